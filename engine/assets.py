@@ -0,0 +1,139 @@
+from engine.variants import VARIANTS
+import pygame as pg
+import os
+
+
+class AssetCache:
+    """A process-wide cache of assets. An image is loaded and converted once per path, each of its
+    variants is scaled, flipped and rotated once per size and transform, a sound is loaded once per
+    path. The surfaces are shared, so they must not be drawn on. With placeholders, missing files
+    are replaced by plain surfaces, silent sounds and the default font (for headless runs)"""
+    def __init__(self, colorkey: tuple[int, ...] = (255, 255, 255),
+                 placeholders: bool = False) -> None:
+        self.colorkey: tuple[int, ...] = colorkey
+        self.placeholders: bool = placeholders
+        self.__images: dict[str, pg.surface.Surface] = {}
+        self.__variants: dict[tuple, pg.surface.Surface] = {}
+        self.__sounds: dict[str, pg.mixer.Sound] = {}
+        self.__fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self.__manifest: dict[str, None] = {}
+
+    def image(self, path: str) -> pg.surface.Surface:
+        """Converted and colorkeyed image in its original size"""
+        image: pg.surface.Surface | None = self.__images.get(path)
+        if image is None:
+            image = self.load_image(path)
+            self.__images[path] = image
+            VARIANTS.source(image, path)
+        return image
+
+    def surface(self, path: str,
+                sizes: tuple[float, float] | None = None,
+                flip_x: bool = False,
+                flip_y: bool = False,
+                degree: float = 0) -> pg.surface.Surface:
+        """Scaled, flipped and then rotated variant of the image"""
+        image: pg.surface.Surface = self.image(path)
+        if sizes is None:
+            sizes = image.get_size()
+        key: tuple = path, int(sizes[0]), int(sizes[1]), flip_x, flip_y, degree
+        variant: pg.surface.Surface | None = self.__variants.get(key)
+        if variant is None:
+            variant = VARIANTS.variant(image, ('asset',) + key[1:],
+                                       lambda: self.transform(image, sizes, flip_x, flip_y, degree))
+            self.__variants[key] = variant
+        return variant
+
+    def sound(self, path: str) -> pg.mixer.Sound:
+        sound: pg.mixer.Sound | None = self.__sounds.get(path)
+        if sound is None:
+            sound = self.load_sound(path)
+            self.__sounds[path] = sound
+        return sound
+
+    def font(self, path: str, size: int) -> pg.font.Font:
+        """Fonts are shared by every text of the same file and size"""
+        key: tuple[str, int] = path, size
+        font: pg.font.Font | None = self.__fonts.get(key)
+        if font is None:
+            font = self.load_font(path, size)
+            self.__fonts[key] = font
+        return font
+
+    def load_image(self, path: str) -> pg.surface.Surface:
+        return self.prepare_image(self.decode_image(path))
+
+    def decode_image(self, path: str) -> pg.surface.Surface:
+        """The image as it is in the file. Needs no display, so it can run on another thread"""
+        if self.placeholders and not os.path.isfile(path):
+            image: pg.surface.Surface = pg.surface.Surface((32, 32))
+            image.fill((255, 0, 255))
+            return image
+        return pg.image.load(path)
+
+    def prepare_image(self, image) -> pg.surface.Surface:
+        """Converts a decoded image to the display format, on the main thread"""
+        image = image.convert()
+        image.set_colorkey(self.colorkey)
+        return image
+
+    def load_sound(self, path: str) -> pg.mixer.Sound:
+        if self.placeholders and not os.path.isfile(path):
+            return pg.mixer.Sound(buffer=bytes(64))
+        return pg.mixer.Sound(path)
+
+    def put_image(self, path: str, image) -> None:
+        """Keeps an image decoded elsewhere, as if it was loaded by the cache"""
+        self.__images[path] = self.prepare_image(image)
+        VARIANTS.source(self.__images[path], path)
+
+    def put_sound(self, path: str, sound) -> None:
+        self.__sounds[path] = sound
+
+    def register(self, *paths: str) -> tuple[str, ...]:
+        """Adds the files of a spawner to the manifest of the preloader. Returns the paths"""
+        self.__manifest.update(dict.fromkeys(paths))
+        return paths
+
+    def cached(self, path: str) -> bool:
+        return (path in self.__images) or (path in self.__sounds)
+
+    def load_font(self, path: str, size: int) -> pg.font.Font:
+        if self.placeholders and not os.path.isfile(path):
+            return pg.font.Font(None, size)
+        return pg.font.Font(path, size)
+
+    def transform(self, image,
+                  sizes: tuple[float, float],
+                  flip_x: bool = False,
+                  flip_y: bool = False,
+                  degree: float = 0) -> pg.surface.Surface:
+        variant: pg.surface.Surface = pg.transform.scale(image, sizes)
+        if flip_x or flip_y:
+            variant = pg.transform.flip(variant, flip_x, flip_y)
+        if degree:
+            variant = pg.transform.rotate(variant, degree)
+        variant.set_colorkey(self.colorkey)
+        return variant
+
+    def clear(self) -> None:
+        self.__images = {}
+        self.__variants = {}
+        self.__sounds = {}
+        self.__fonts = {}
+
+    @property
+    def manifest(self) -> tuple[str, ...]:
+        """Registered files in the order of registration, kept by clear"""
+        return tuple(self.__manifest)
+
+    @property
+    def loaded(self) -> int:
+        """Number of files read from the disk"""
+        return len(self.__images) + len(self.__sounds)
+
+    def __del__(self) -> None:
+        pass
+
+
+ASSETS: AssetCache = AssetCache()
@@ -0,0 +1,191 @@
+from engine.variants import VARIANTS
+from typing import Callable
+import pygame as pg
+
+
+class Atlas:
+    """Frames of sprite families packed into the shelves of big page surfaces. A frame is packed
+    once per key and handed out as a subsurface of its page, so equal frames are shared, and all of
+    them can be drawn from a few source surfaces by area rects. Frames bigger than a page get a page
+    of their own. Without active nothing is packed and the frames are built as before"""
+    def __init__(self, page_size: tuple[int, int] = (1024, 1024),
+                 colorkey: tuple[int, ...] = (255, 255, 255),
+                 active: bool = False) -> None:
+        self.page_size: tuple[int, int] = page_size
+        self.colorkey: tuple[int, ...] = colorkey
+        self.active: bool = active
+        self.__pages: list[pg.surface.Surface] = []
+        self.__shelves: list[list[list[int]]] = []
+        self.__tops: list[int] = []
+        self.__frames: dict[tuple, pg.surface.Surface] = {}
+
+    def variant(self, image,
+                sizes: tuple[float, float] | None = None,
+                flip_x: bool = False,
+                degree: float = 0) -> pg.surface.Surface:
+        """The image scaled to sizes, rotated and then flipped. Without active an image which
+        needs no transform is returned as it is, as is a packed frame"""
+        if sizes is None:
+            sizes = image.get_size()
+        key: tuple = image, int(sizes[0]), int(sizes[1]), flip_x, degree
+        transform: tuple = ('frame',) + key[1:]
+        if (image.get_size() == key[1:3]) and not (flip_x or degree):
+            if self.packed(image):
+                return image
+            frame: pg.surface.Surface = self.frame(key, lambda: image)
+        else:
+            frame: pg.surface.Surface = self.frame(key, lambda: VARIANTS.variant(
+                image, transform, lambda: self.transform(image, sizes, flip_x, degree)))
+        VARIANTS.derive(frame, image, transform)
+        return frame
+
+    @staticmethod
+    def transform(image,
+                  sizes: tuple[float, float],
+                  flip_x: bool = False,
+                  degree: float = 0) -> pg.surface.Surface:
+        if image.get_size() != (int(sizes[0]), int(sizes[1])):
+            image = pg.transform.scale(image, sizes)
+        if degree:
+            image = pg.transform.rotate(image, degree)
+        if flip_x:
+            image = pg.transform.flip(image, True, False)
+        return image
+
+    def frame(self, key: tuple, build: Callable) -> pg.surface.Surface:
+        """The packed frame of the key, built by build on the first request"""
+        if not self.active:
+            return build()
+        frame: pg.surface.Surface | None = self.__frames.get(key)
+        if frame is None:
+            frame = self.pack(build())
+            self.__frames[key] = frame
+        return frame
+
+    def pack(self, image) -> pg.surface.Surface:
+        width, height = image.get_size()
+        page_index, x, y = self.place(width, height)
+        page: pg.surface.Surface = self.__pages[page_index]
+        page.blit(image, (x, y))
+        return page.subsurface((x, y, width, height))
+
+    def place(self, width: int, height: int) -> tuple[int, int, int]:
+        """Page index and position of a free place. The first shelf as high as the frame and wide
+        enough is taken, else a new shelf or a new page is opened"""
+        for page_index, shelves in enumerate(self.__shelves):
+            page_w, page_h = self.__pages[page_index].get_size()
+            for shelf in shelves:
+                shelf_y, shelf_h, shelf_x = shelf
+                if (height <= shelf_h) and (shelf_x + width <= page_w):
+                    shelf[2] += width
+                    return page_index, shelf_x, shelf_y
+            top: int = self.__tops[page_index]
+            if (top + height <= page_h) and (width <= page_w):
+                shelves.append([top, height, width])
+                self.__tops[page_index] = top + height
+                return page_index, 0, top
+        page_w: int = max(self.page_size[0], width)
+        page_h: int = max(self.page_size[1], height)
+        self.add_page(page_w, page_h)
+        self.__shelves[-1].append([0, height, width])
+        self.__tops[-1] = height
+        return len(self.__pages) - 1, 0, 0
+
+    def add_page(self, width: int, height: int) -> None:
+        page: pg.surface.Surface = pg.surface.Surface((width, height))
+        if pg.display.get_surface() is not None:
+            page = page.convert()
+        page.fill(self.colorkey)
+        page.set_colorkey(self.colorkey)
+        self.__pages.append(page)
+        self.__shelves.append([])
+        self.__tops.append(0)
+
+    def packed(self, image) -> bool:
+        parent: pg.surface.Surface | None = image.get_parent()
+        return any(parent is page for page in self.__pages)
+
+    @staticmethod
+    def source(frame) -> tuple[pg.surface.Surface, pg.Rect]:
+        """The page and the area of a packed frame, for blits from a single source surface"""
+        parent: pg.surface.Surface | None = frame.get_parent()
+        if parent is None:
+            return frame, frame.get_rect()
+        return parent, pg.Rect(frame.get_offset(), frame.get_size())
+
+    def clear(self) -> None:
+        self.__pages = []
+        self.__shelves = []
+        self.__tops = []
+        self.__frames = {}
+
+    @property
+    def pages(self) -> int:
+        return len(self.__pages)
+
+    @property
+    def frames(self) -> int:
+        return len(self.__frames)
+
+    @property
+    def used(self) -> float:
+        """Share of the page area taken by frames"""
+        total: int = sum(page.get_width() * page.get_height() for page in self.__pages)
+        taken: int = sum(frame.get_width() * frame.get_height() for frame in self.__frames.values())
+        return taken / total if total else 0.
+
+    def __del__(self) -> None:
+        pass
+
+
+ATLAS: Atlas = Atlas()
+
+
+class FrameSets:
+    """Frames and frame sets shared by every sprite built from the same source images. A frame is
+    made once per source and transform (packed when the atlas is active), a set is a tuple made once
+    per key. The frames are never changed in place: a sprite which resizes, flips or rotates its
+    frames makes new ones for itself. Like the asset cache, the sets live until clear"""
+    def __init__(self, atlas: Atlas) -> None:
+        self.atlas: Atlas = atlas
+        self.__frames: dict[tuple, pg.surface.Surface] = {}
+        self.__sets: dict[tuple, tuple] = {}
+
+    def variant(self, image,
+                sizes: tuple[float, float] | None = None,
+                flip_x: bool = False,
+                degree: float = 0) -> pg.surface.Surface:
+        if sizes is None:
+            sizes = image.get_size()
+        key: tuple = image, int(sizes[0]), int(sizes[1]), flip_x, degree
+        frame: pg.surface.Surface | None = self.__frames.get(key)
+        if frame is None:
+            frame = self.atlas.variant(image, sizes, flip_x, degree)
+            self.__frames[key] = frame
+        return frame
+
+    def get(self, key: tuple, build: Callable) -> tuple:
+        """The frame set of the key, built by build on the first request"""
+        frames: tuple | None = self.__sets.get(key)
+        if frames is None:
+            frames = tuple(build())
+            self.__sets[key] = frames
+        return frames
+
+    def clear(self) -> None:
+        self.__frames = {}
+        self.__sets = {}
+
+    @property
+    def frames(self) -> int:
+        return len(self.__frames)
+
+    @property
+    def sets(self) -> int:
+        return len(self.__sets)
+
+    def __del__(self) -> None:
+        pass
+
+
+FRAME_SETS: FrameSets = FrameSets(ATLAS)
@@ -1,7 +1,83 @@
 from engine.component import Drawable
+from engine.tools import VIEW
+from engine.assets import ASSETS
 import pygame as pg
 
 
+DIGITS: str = '0123456789'
+
+
+class GlyphCache:
+    """Rendered glyphs shared by every text of the same font, font color and background. The digits
+    of a font are rendered once as a strip and handed out as subsurfaces of it, other characters
+    are rendered one by one on the first request. A line of text is laid out from the widths of its
+    glyphs, so it may differ by a pixel from the kerned render of the whole string"""
+    def __init__(self) -> None:
+        self.__strips: dict[tuple, tuple[pg.surface.Surface, ...]] = {}
+        self.__glyphs: dict[tuple, pg.surface.Surface] = {}
+
+    def strip(self, font,
+              fnt_color: tuple[int, ...],
+              color: tuple[int, ...] | None = None) -> tuple[pg.surface.Surface, ...]:
+        """The digits of the font as subsurfaces of one rendered strip"""
+        key: tuple = font, fnt_color, color
+        digits: tuple[pg.surface.Surface, ...] | None = self.__strips.get(key)
+        if digits is None:
+            strip: pg.surface.Surface = self.render(font, DIGITS, fnt_color, color)
+            offsets: list[int] = [font.size(DIGITS[:i])[0] for i in range(len(DIGITS) + 1)]
+            height: int = strip.get_height()
+            digits = tuple(strip.subsurface((offsets[i], 0, offsets[i + 1] - offsets[i], height))
+                           for i in range(len(DIGITS)))
+            self.__strips[key] = digits
+        return digits
+
+    def glyph(self, font, char: str,
+              fnt_color: tuple[int, ...],
+              color: tuple[int, ...] | None = None) -> pg.surface.Surface:
+        if char in DIGITS:
+            return self.strip(font, fnt_color, color)[DIGITS.index(char)]
+        key: tuple = font, char, fnt_color, color
+        glyph: pg.surface.Surface | None = self.__glyphs.get(key)
+        if glyph is None:
+            glyph = self.render(font, char, fnt_color, color)
+            self.__glyphs[key] = glyph
+        return glyph
+
+    def line(self, font, txt: str,
+             fnt_color: tuple[int, ...],
+             color: tuple[int, ...] | None = None) -> tuple[list[tuple], tuple[int, int]]:
+        """Glyphs of the text with their offsets, and the size of the line"""
+        glyphs: list[tuple] = []
+        x: int = 0
+        for char in txt:
+            glyph: pg.surface.Surface = self.glyph(font, char, fnt_color, color)
+            glyphs.append((glyph, x))
+            x += glyph.get_width()
+        return glyphs, (x, font.get_height())
+
+    @staticmethod
+    def render(font, txt: str,
+               fnt_color: tuple[int, ...],
+               color: tuple[int, ...] | None = None) -> pg.surface.Surface:
+        if color is None:
+            return font.render(txt, 1, fnt_color)
+        return font.render(txt, 1, fnt_color, color)
+
+    def clear(self) -> None:
+        self.__strips = {}
+        self.__glyphs = {}
+
+    @property
+    def glyphs(self) -> int:
+        return len(self.__glyphs) + len(self.__strips) * len(DIGITS)
+
+    def __del__(self) -> None:
+        pass
+
+
+GLYPHS: GlyphCache = GlyphCache()
+
+
 class Text:
     def __init__(self,
                  txt: str,
@@ -15,19 +91,13 @@ class Text:
         self.__fnt_path: str = fnt_path
         self.__fnt_color: tuple[int, ...] = fnt_color
         self.__color: tuple[int, ...] | None = color
-        self.__font = pg.font.Font(fnt_path, size)
-        if color is None:
-            self.text = self.__font.render(self.__txt, 1, self.__fnt_color)
-            self.__filled: bool = False
-        else:
-            self.text = self.__font.render(self.__txt, 1, self.__fnt_color, color)
-            self.__filled: bool = True
-        pos: tuple[float, float] = pos
-        self.rect = self.text.get_rect()
-        self.rect.left, self.rect.top = pos
+        self.__font = ASSETS.font(fnt_path, size)
+        self.__filled: bool = color is not None
+        self.rect = pg.Rect(pos, (0, 0))
+        self.update_text()
     
     def draw(self, wnd) -> None:
-        wnd.blit(self.text, self.rect)
+        wnd.blit(self.text, self.screen_pos())
     
     def update(self) -> None:
         pass
@@ -35,6 +105,12 @@ class Text:
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         self.rect.move_ip(dx, dy)
     
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.rect.topleft)
+    
+    def screen_rect(self) -> pg.Rect:
+        return pg.Rect(self.screen_pos(), self.sizes)
+    
     def change_text(self, txt: str) -> None:
         if self.__txt != txt:
             self.__txt = txt
@@ -54,7 +130,7 @@ class Text:
     
     def change_fnt(self, fnt_path: str) -> None:
         if self.__fnt_path != fnt_path:
-            self.__font = pg.font.Font(fnt_path, self.__size)
+            self.__font = ASSETS.font(fnt_path, self.__size)
             self.__fnt_path = fnt_path
             self.update_text()
     
@@ -66,7 +142,7 @@ class Text:
     def change_fnt_size(self, size: int) -> None:
         if self.__size != size:
             self.__size = size
-            self.__font = pg.font.Font(self.__fnt_path, size)
+            self.__font = ASSETS.font(self.__fnt_path, size)
             self.update_text()
     
     def change_color(self, color: tuple[int, ...] | None) -> None:
@@ -81,6 +157,22 @@ class Text:
         else:
             self.__filled = True
     
+    @property
+    def txt(self) -> str:
+        return self.__txt
+    
+    @property
+    def font(self):
+        return self.__font
+    
+    @property
+    def fnt_color(self) -> tuple[int, ...]:
+        return self.__fnt_color
+    
+    @property
+    def color(self) -> tuple[int, ...] | None:
+        return self.__color
+    
     @property
     def pos(self) -> tuple[float, float]:
         return self.rect.left, self.rect.top
@@ -116,13 +208,39 @@ class Inscription(Text):
             super().draw(wnd)
     
     def update(self) -> None:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.drawable.check_bound(pos)
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         if not self.static:
             super().shift(dx, dy)
     
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.rect.topleft, self.static)
+    
+    def __del__(self) -> None:
+        pass
+
+
+class Counter(Inscription):
+    """An inscription drawn from cached glyphs. Changing the number only lays out the glyphs
+    again, nothing is rendered by the font"""
+    def update_text(self) -> None:
+        self.glyphs, sizes = GLYPHS.line(self.font, self.txt, self.fnt_color, self.color)
+        self.rect.size = sizes
+    
+    def draw(self, wnd) -> None:
+        if self.drawable.in_bound:
+            x, y = self.screen_pos()
+            wnd.blits([(glyph, (x + offset, y)) for glyph, offset in self.glyphs], doreturn=False)
+    
+    @property
+    def text(self) -> pg.surface.Surface:
+        """The glyphs drawn on one surface"""
+        text: pg.surface.Surface = pg.surface.Surface(self.rect.size, pg.SRCALPHA)
+        text.blits([(glyph, (offset, 0)) for glyph, offset in self.glyphs], doreturn=False)
+        return text
+    
     def __del__(self) -> None:
         pass
 
@@ -142,8 +260,8 @@ class CounterItems:
                                              on_screen, pos, color, fnt_color)
         counter_x: float = pos[0] + self.text.sizes[0]
         counter_pos: tuple[float, float] = counter_x, pos[1]
-        self.counter: Inscription = Inscription(str(start_num), size, fnt_path, static, 
-                                             on_screen, counter_pos, color, fnt_color)
+        self.counter: Counter = Counter(str(start_num), size, fnt_path, static, 
+                                        on_screen, counter_pos, color, fnt_color)
     
     def draw(self, wnd) -> None:
         self.text.draw(wnd)
@@ -157,6 +275,10 @@ class CounterItems:
         self.text.shift(dx, dy)
         self.counter.shift(dx, dy)
     
+    def dirty_rects(self) -> list[pg.Rect]:
+        """Screen rects covered by the next draw, for the dirty renderer"""
+        return [part.screen_rect() for part in (self.text, self.counter) if part.drawable.in_bound]
+    
     @property
     def rect(self):
         return pg.Rect(self.pos[0], self.pos[1], self.sizes[0], self.sizes[1])
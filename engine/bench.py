@@ -0,0 +1,234 @@
+"""Headless frame runner. Builds a level from a tilemap of engine/tilemaps, steps it with scripted
+input and reports the time of every phase of the frame. The simulation clock is stepped once per 
+frame, so the same arguments give the same simulation. Run from the root of the repository:
+
+    python -m engine.bench gym --frames 600 --save baseline.json
+    python -m engine.bench gym --frames 600 --baseline baseline.json
+    python -m engine.bench --memory
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from engine.tools import ScriptedKeys, CLOCK, timer
+from engine.constants import Sizes
+from engine.assets import ASSETS
+from engine.atlas import ATLAS, FRAME_SETS
+from engine.bar import GLYPHS
+from engine.variants import VARIANTS
+from engine.spawner import SpawnerCoin, SpawnerMarioBlock
+from engine.tilepack import TILEMAPS
+from engine.preload import Preloader
+from engine.level import Level
+from typing import Callable
+import tracemalloc
+import time
+import argparse
+import random
+import json
+import sys
+import pygame as pg
+
+
+PHASES: tuple[str, ...] = 'update', 'collision', 'interact', 'draw'
+
+
+def load_tilemap(name: str):
+    """The packed tilemap of the name, or the tuple map of the modules of engine/tilemaps"""
+    return TILEMAPS.get(name)
+
+
+def default_script(length: int = 240) -> list[tuple[int, ...]]:
+    """Runs right and left in turns, jumps and shoots now and then"""
+    script: list[tuple[int, ...]] = []
+    for frame in range(length):
+        keys: list[int] = [pg.K_RIGHT] if (frame // (length // 2)) % 2 == 0 else [pg.K_LEFT]
+        if frame % 45 < 12:
+            keys.append(pg.K_UP)
+        if frame % 30 == 0:
+            keys.append(pg.K_SPACE)
+        script.append(tuple(keys))
+    return script
+
+
+class Bench:
+    """Steps a populated level for a number of frames. Times are in milliseconds per frame"""
+    def __init__(self, tilemap_name: str,
+                 frames: int = 300,
+                 players: int = 1,
+                 coins: int = 50,
+                 surprises: int = 10,
+                 platforms: int = 10,
+                 bullets: int = 50,
+                 rain: int = 0,
+                 seed: int = 0,
+                 world_space: bool = True,
+                 indexed: bool = True,
+                 batched: bool = True,
+                 dirty: bool = False,
+                 atlas: bool = False,
+                 store: bool = False,
+                 streamed: bool = False,
+                 preload: bool = False,
+                 variants: bool = False) -> None:
+        self.tilemap_name: str = tilemap_name
+        self.frames: int = frames
+        self.mix: dict[str, int] = {'players': players, 'coins': coins, 'surprises': surprises,
+                                    'platforms': platforms, 'bullets': bullets, 'rain': rain}
+        self.seed: int = seed
+        self.world_space: bool = world_space
+        self.indexed: bool = indexed
+        self.batched: bool = batched
+        self.dirty: bool = dirty
+        self.atlas: bool = atlas
+        self.store: bool = store
+        self.streamed: bool = streamed
+        self.preload: bool = preload
+        self.variants: bool = variants
+
+    def run(self) -> dict:
+        random.seed(self.seed)
+        CLOCK.reset()
+        ASSETS.placeholders = True
+        wnd = pg.display.set_mode(Sizes().wnd_size)
+        ATLAS.clear()
+        FRAME_SETS.clear()
+        GLYPHS.clear()
+        ATLAS.active = self.atlas
+        VARIANTS.clear()
+        VARIANTS.active = self.variants
+        start: float = time.perf_counter()
+        if self.preload:
+            Preloader().wait()
+        level: Level = Level(load_tilemap(self.tilemap_name), world_space=self.world_space,
+                             indexed=self.indexed, batched=self.batched, dirty=self.dirty,
+                             store=self.store, streamed=self.streamed)
+        level.populate(seed=self.seed, **self.mix)
+        load: float = time.perf_counter() - start
+        keyboard: ScriptedKeys = ScriptedKeys(default_script())
+        level.set_keyboard(keyboard)
+
+        def draw() -> None:
+            level.render(wnd)
+
+        steps: dict = {'update': timer(level.update), 'collision': timer(level.collide),
+                       'interact': timer(level.interact), 'draw': timer(draw)}
+        totals: dict[str, float] = dict.fromkeys(PHASES, 0.)
+        for _ in range(self.frames):
+            CLOCK.step()
+            for phase in PHASES:
+                totals[phase] += steps[phase]()
+            keyboard.next_frame()
+        total: float = sum(totals.values())
+        return {'map': self.tilemap_name, 'frames': self.frames, 'mix': self.mix,
+                'entities': level.entities, 'load': load * 1000,
+                'phases': {phase: totals[phase] * 1000 / max(self.frames, 1) for phase in PHASES},
+                'fps': self.frames / total if total else 0.}
+
+    def __del__(self) -> None:
+        pass
+
+
+def measure(spawn: Callable, count: int = 200) -> float:
+    """Python heap bytes per spawned entity. The first entity is made before the measurement, so
+    the shared images and frame sets are not counted. Pixels of the surfaces are not in the heap"""
+    spawn((0, 0))
+    tracemalloc.start()
+    entities: list = [spawn((i, 0)) for i in range(count)]
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(entities)
+
+
+def entity_memory(count: int = 200) -> dict[str, float]:
+    """Bytes per coin, brick block and player"""
+    ASSETS.placeholders = True
+    pg.display.set_mode(Sizes().wnd_size)
+    spawners: dict[str, Callable] = {'coin': SpawnerCoin().spawn, 'block': SpawnerMarioBlock().spawn,
+                                     'model7': Level.spawn_player}
+    return {name: measure(spawn, count) for name, spawn in spawners.items()}
+
+
+def compare(result: dict, baseline: dict, tolerance: float = .1) -> list[str]:
+    """Phases slower than the baseline by more than the tolerance"""
+    regressions: list[str] = []
+    for phase in PHASES:
+        old: float = baseline['phases'].get(phase, 0)
+        new: float = result['phases'][phase]
+        if old and new > old * (1 + tolerance):
+            regressions.append(f'{phase}: {old:.3f} -> {new:.3f} ms')
+    if result['fps'] < baseline['fps'] * (1 - tolerance):
+        regressions.append(f"fps: {baseline['fps']:.1f} -> {result['fps']:.1f}")
+    return regressions
+
+
+def report(result: dict, baseline: dict | None = None) -> str:
+    lines: list[str] = [f"{result['map']}: {result['frames']} frames, {result['entities']} entities"]
+    if 'load' in result:
+        lines.append(f"{'load':>10}: {result['load']:8.3f} ms")
+    for phase in PHASES:
+        line: str = f"{phase:>10}: {result['phases'][phase]:8.3f} ms"
+        if baseline is not None:
+            line += f"  (baseline {baseline['phases'][phase]:8.3f} ms)"
+        lines.append(line)
+    line: str = f"{'fps':>10}: {result['fps']:8.1f}"
+    if baseline is not None:
+        line += f"     (baseline {baseline['fps']:8.1f})"
+    lines.append(line)
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('tilemap', nargs='?', default='gym')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--players', type=int, default=1)
+    parser.add_argument('--coins', type=int, default=50)
+    parser.add_argument('--surprises', type=int, default=10)
+    parser.add_argument('--platforms', type=int, default=10)
+    parser.add_argument('--bullets', type=int, default=50)
+    parser.add_argument('--rain', type=int, default=0, help='number of rain drops')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shift', action='store_true', help='shift the world instead of the view')
+    parser.add_argument('--no-index', action='store_true', help='update and draw every entity')
+    parser.add_argument('--no-batch', action='store_true', help='blit every sprite by itself')
+    parser.add_argument('--dirty', action='store_true', help='redraw only the changed regions')
+    parser.add_argument('--atlas', action='store_true', help='pack animation frames into an atlas')
+    parser.add_argument('--store', action='store_true', help='keep the bricks in a block store')
+    parser.add_argument('--stream', action='store_true', help='load the tiles only near the camera')
+    parser.add_argument('--preload', action='store_true', help='load the assets on a pool of threads')
+    parser.add_argument('--variants', action='store_true', help='keep transformed images on the disk')
+    parser.add_argument('--memory', action='store_true', help='report the bytes per entity and exit')
+    parser.add_argument('--save', help='write the result to a json file')
+    parser.add_argument('--baseline', help='compare with a result saved before')
+    parser.add_argument('--tolerance', type=float, default=.1)
+    args = parser.parse_args(argv)
+    if args.memory:
+        for name, size in entity_memory().items():
+            print(f'{name:>10}: {size:10.1f} bytes')
+        return 0
+    bench: Bench = Bench(args.tilemap, args.frames, args.players, args.coins, args.surprises,
+                         args.platforms, args.bullets, args.rain, args.seed, world_space=not args.shift,
+                         indexed=not args.no_index, batched=not args.no_batch,
+                         dirty=args.dirty, atlas=args.atlas,
+                         store=args.store, streamed=args.stream, preload=args.preload,
+                         variants=args.variants)
+    result: dict = bench.run()
+    baseline: dict | None = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    print(report(result, baseline))
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(result, file, indent=4)
+    if baseline is not None:
+        regressions: list[str] = compare(result, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'Regression in {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
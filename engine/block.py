@@ -22,7 +22,7 @@ class Lightning(GhostSprite):
                  color: tuple[int, ...] = (255, 255, 255)) -> None:
         size: Sizes = Sizes()
         self.surface: pg.surface.Surface = pg.surface.Surface(size.wnd_size)
-        self.bleach: RectangleShape = RectangleShape((0, 0), size.wnd_size, color)
+        self.bleach: RectangleShape = RectangleShape((0, 0), size.wnd_size, color, static=True)
         self.sound: pg.mixer.Sound = thunder_sound
         self.__timer: Timer = Timer()
         self.surface.set_alpha(alpha)
@@ -226,9 +226,10 @@ class MonoBlock(Sprite):
         self.destroyed: bool = destroyed
         self.physical: bool = phys
     
-    def draw(self, wnd) -> None:
+    def blit_args(self) -> tuple | None:
         if not self.destroyed:
-            super().draw(wnd)
+            return super().blit_args()
+        return None
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         if not self.destroyed:
@@ -240,7 +241,7 @@ class MonoBlock(Sprite):
             self.main_update(pos)
     
     def init_update(self) -> tuple[float, float]:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.updatable.check_bound(pos)
         self.fix_destruction()
         return pos
@@ -261,7 +262,8 @@ class MonoBlock(Sprite):
 
 
 class MarioBlock(MonoBlock, Interactive):
-    """Usual block from Mario85"""
+    """Usual block from Mario85. A block adopted by a ChunkLayer is drawn by the layer, and its 
+    destruction erases the tile from the layer"""
     def __init__(self, image,
                  brick_sound,
                  breakblock_sound,
@@ -274,11 +276,33 @@ class MarioBlock(MonoBlock, Interactive):
                  static: bool = False,
                  right: bool = True,
                  phys: bool = True) -> None:
+        self.layer = None
+        self._destroyed: bool = destroyed
         MonoBlock.__init__(self, image, sizes, pos, destructible, in_activity,
                            destroyed, on_screen, static, right, phys)
         self.sound_broken: Soundman = Soundman(breakblock_sound)
         self.sound_clsn = brick_sound
     
+    def blit_args(self) -> tuple | None:
+        if self.layer is None:
+            return super().blit_args()
+        return None
+    
+    @property
+    def destroyed(self) -> bool:
+        return self._destroyed
+    
+    @destroyed.setter
+    def destroyed(self, value: bool) -> None:
+        if value and not self._destroyed:
+            self.erase_from_layer()
+        self._destroyed = value
+    
+    def erase_from_layer(self) -> None:
+        """Indestructible blocks are restored by fix_destruction, so they stay in the layer"""
+        if (self.layer is not None) and self.destructible:
+            self.layer.erase(self.rect.topleft)
+    
     def interact(self, target) -> None:
         check_active: bool = target.rect.colliderect(self.rect) and self.updatable.in_bound
         if check_active and not self.destroyed:
@@ -465,9 +489,10 @@ class PolyBlock(AnimatedSprite):
         self.destroyed: bool = destroyed
         self.physical: bool = phys
         
-    def draw(self, wnd) -> None:
+    def blit_args(self) -> tuple | None:
         if not self.destroyed:
-            super().draw(wnd)
+            return super().blit_args()
+        return None
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         if not self.destroyed:
@@ -479,7 +504,7 @@ class PolyBlock(AnimatedSprite):
             self.main_update(pos)
     
     def init_update(self) -> tuple[float, float]:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.updatable.check_bound(pos)
         self.fix_destruction()
         return pos
@@ -28,16 +28,34 @@ class Bullet(MonoBlock, Interactive):
         self.damage: int = damage
         self.life_time: float = life_time
         self.activated: bool = activated
-    
-    def draw(self, wnd) -> None:
+        self.pool = None    #The spawner which takes the bullet back
+        self.previous: tuple[int, int] = self.rect.center    #The center before the last move
+    
+    def reset(self, pos: tuple[float, float]) -> None:
+        """Makes a destroyed bullet new again, for reuse from a pool"""
+        self.rect.left, self.rect.top = pos
+        self.previous = self.rect.center
+        self.life_timer.reset()
+        self.destroyed = False
+        self.activated = False
+        self.static = False
+    
+    def blit_args(self) -> tuple | None:
         if self.activated:
-            super().draw(wnd)
+            return super().blit_args()
+        return None
     
     def init_update(self) -> tuple[float, float]:
+        self.previous = self.rect.center
         self.control_bullet_life()
         pos: tuple[float, float] = super().init_update()
         return pos
     
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        x, y = self.rect.center
+        super().shift(dx, dy)
+        self.previous = self.previous[0] + self.rect.centerx - x, self.previous[1] + self.rect.centery - y
+    
     def control_bullet_life(self) -> None:
         if self.activated and not self.destroyed:
             self.destroy_bullet()
@@ -101,6 +119,10 @@ class ClassicBullet(Bullet):
         self.speed: Speed = Speed(speed, max_speed, right)
         self.is_move: bool = is_move
     
+    def reset(self, pos: tuple[float, float]) -> None:
+        super().reset(pos)
+        self.speed.reset()
+    
     def main_update(self, pos: tuple[float, float]) -> None:
         self.motion_x()
         super().main_update(pos)
@@ -139,6 +161,10 @@ class ParabolaBullet(Bullet):
         self.parabola_motion: Parabola = Parabola(speed, max_speed, fly_angle, right, down)
         self.is_move: bool = is_move
     
+    def reset(self, pos: tuple[float, float]) -> None:
+        super().reset(pos)
+        self.parabola_motion.reset()
+    
     def main_update(self, pos: tuple[float, float]) -> None:
         super().main_update(pos)
         self.motion()
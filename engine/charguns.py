@@ -4,14 +4,12 @@ from engine.interfaces import Spawner
 from engine.constants import Sizes
 
 
-SIZE: float = Sizes().size
-
-
 class SpawnerFiregun(Spawner):
     """Caused by a fire flower"""
     def __init__(self, right: bool, equiped: bool, time_charge: float = .5) -> None:
+        size: float = Sizes().size
         self._bullet_image: str = 'Assets/Sprites/Characters/Polys/Mario/Fire/5.bmp'
-        self._bullet_sizes: tuple[float, float] = SIZE * .25, SIZE * .25
+        self._bullet_sizes: tuple[float, float] = size * .25, size * .25
         self._time_charge: float = time_charge
         self._bullet_fly_angle: float = 100
         self._bullets: int = 10
@@ -1,3 +1,6 @@
+from engine.constants import DRAW_BOUNDS, UPDATE_BOUNDS
+from engine.spatial import UniformGrid, SortedIndex
+from engine.tools import VIEW
 from typing import Any
 
 
@@ -9,6 +12,10 @@ class Collection:
     def append(self, item: Any) -> None:
         self.__tar.append(item)
     
+    def extend(self, items) -> None:
+        for item in items:
+            self.append(item)
+    
     def get_index_of(self, item: Any) -> int:
         return self.__tar.index(item)
     
@@ -37,19 +44,43 @@ class Collection:
 
 class PictureList(Collection):
     """A class for managing a group of imageries(draws, shifts methods). Based on a class 
-    Collection."""
-    def __init__(self) -> None:
+    Collection. With batched the images are collected from blit_args and drawn by one blits call,
+    items without it are drawn by themselves in their turn"""
+    def __init__(self, batched: bool = False) -> None:
         super().__init__()
+        self.batched: bool = batched
     
     def do_stuff(self, wnd, dx: float = 0, dy: float = 0) -> None:
+        batch: list[tuple] = []
         for item in self.tar:
-            item.draw(wnd)
+            self.draw_item(wnd, item, batch)
             item.shift(dx, dy)
+        self.flush(wnd, batch)
     
     def draws(self, wnd) -> None:
-        for item in self.tar:
+        self.draw_items(wnd, self.tar)
+    
+    def draw_items(self, wnd, items: list[Any]) -> None:
+        batch: list[tuple] = []
+        for item in items:
+            self.draw_item(wnd, item, batch)
+        self.flush(wnd, batch)
+    
+    def draw_item(self, wnd, item: Any, batch: list[tuple]) -> None:
+        if self.batched and hasattr(item, 'blit_args') and item.batched_draw:
+            args: tuple | None = item.blit_args()
+            if args is not None:
+                batch.append(args)
+        else:
+            self.flush(wnd, batch)
             item.draw(wnd)
     
+    @staticmethod
+    def flush(wnd, batch: list[tuple]) -> None:
+        if batch:
+            wnd.blits(batch, doreturn=False)
+            batch.clear()
+    
     def shifts(self, dx: float = 0, dy: float = 0) -> None:
         for item in self.tar:
             item.shift(dx, dy)
@@ -59,20 +90,126 @@ class PictureList(Collection):
 
 
 class SpriteList(PictureList):
-    """A class for managing a group of sprites(adds updates method). Based on PictureList class."""
-    def __init__(self) -> None:
-        super().__init__()
+    """A class for managing a group of sprites(adds updates method). Based on PictureList class.
+    With indexed the items are also sorted by x, and the updates and draws visit only the items
+    inside the update and draw bounds. Items of an indexed collection must not be static"""
+    def __init__(self, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(batched)
+        self.x_index: SortedIndex | None = SortedIndex() if indexed else None
+        self.__awake: list[Any] = []
+    
+    def append(self, item: Any) -> None:
+        super().append(item)
+        if self.x_index is not None:
+            self.x_index.insert(item)
+            x1, x2 = self.world_range(UPDATE_BOUNDS.bound_x)
+            if not (x1 <= item.rect.left <= x2):
+                self.deactivate(item)
+    
+    def delete_item(self, index: int) -> None:
+        if self.x_index is not None:
+            self.x_index.remove(self.tar[index])
+        super().delete_item(index)
+    
+    def clear(self) -> None:
+        super().clear()
+        self.__awake = []
+        if self.x_index is not None:
+            self.x_index.clear()
+    
+    def __setitem__(self, index: int, item: Any) -> None:
+        if self.x_index is not None:
+            order: int = self.x_index.remove(self.tar[index])
+            self.x_index.insert(item, order)
+        super().__setitem__(index, item)
     
     def do_stuff(self, wnd, dx: float = 0, dy: float = 0) -> None:
         """Draw, update and shift"""
+        batch: list[tuple] = []
+        pinned: list[Any] = []
         for item in self.tar:
             item.update()
-            item.draw(wnd)
-            item.shift(dx, dy)
+            self.reindex(item)
+            self.draw_item(wnd, item, batch)
+            self.shift_item(item, dx, dy, pinned)
+        self.flush(wnd, batch)
+        self.sync(dx, dy, pinned)
     
     def updates(self) -> None:
-        for item in self.tar:
+        items: list[Any] = self.active()
+        if self.x_index is not None:
+            self.retire(items)
+        for item in items:
             item.update()
+            self.reindex(item)
+    
+    def retire(self, items: list[Any]) -> None:
+        """Items which have left the update bounds are marked as inactive, as their own bound check 
+        would do"""
+        awake: set[int] = {id(item) for item in items}
+        for item in self.__awake:
+            if id(item) not in awake:
+                self.deactivate(item)
+        self.__awake = items
+    
+    @staticmethod
+    def deactivate(item: Any) -> None:
+        if hasattr(item, 'updatable'):
+            item.updatable.in_bound = False
+    
+    def draws(self, wnd) -> None:
+        self.draw_items(wnd, self.visible())
+    
+    def shifts(self, dx: float = 0, dy: float = 0) -> None:
+        pinned: list[Any] = []
+        for item in self.tar:
+            self.shift_item(item, dx, dy, pinned)
+        self.sync(dx, dy, pinned)
+    
+    @staticmethod
+    def shift_item(item: Any, dx: float, dy: float, pinned: list[Any]) -> None:
+        """Shifts the item, which goes to pinned if it ignored the shift (static, destroyed)"""
+        left, top = item.rect.topleft
+        item.shift(dx, dy)
+        if (item.rect.left - left != int(dx)) or (item.rect.top - top != int(dy)):
+            pinned.append(item)
+    
+    def active(self) -> list[Any]:
+        """Items inside the update bounds, all items without the index"""
+        return self.in_range(UPDATE_BOUNDS.bound_x)
+    
+    def visible(self) -> list[Any]:
+        """Items inside the draw bounds, all items without the index"""
+        return self.in_range(DRAW_BOUNDS.bound_x)
+    
+    def in_range(self, bound_x: tuple[float, float]) -> list[Any]:
+        if self.x_index is None:
+            return self.tar
+        x1, x2 = self.world_range(bound_x)
+        return self.x_index.query(x1, x2)
+    
+    @staticmethod
+    def world_range(bound_x: tuple[float, float]) -> tuple[float, float]:
+        x1: float = VIEW.to_world((bound_x[0], 0))[0]
+        x2: float = VIEW.to_world((bound_x[1], 0))[0]
+        return x1, x2
+    
+    def reindex(self, item: Any) -> None:
+        """Called for every updated item, which could have moved"""
+        if self.x_index is not None:
+            self.x_index.update(item)
+    
+    def sync(self, dx: float, dy: float, pinned: list[Any]) -> None:
+        """Follows a shift of the world. Only the pinned items, which did not move with it, are 
+        placed again"""
+        self.sync_index(dx, pinned)
+    
+    def sync_index(self, dx: float = 0, items: list[Any] | None = None) -> None:
+        """Every item is checked without items"""
+        if self.x_index is not None:
+            self.x_index.shift(dx)
+            for item in self.tar if items is None else items:
+                self.x_index.update(item)
     
     def __del__(self) -> None:
         pass
@@ -82,21 +219,26 @@ class ActiveSprites(SpriteList):
     """Movable sprites. Reflection means changing the direction of movement to the opposite.
     Objects in this collection must have the to_right attribute if reflectable is True. The speed
     component is required for collection objects"""
-    def __init__(self, reflectable: bool = False) -> None:
-        super().__init__()
+    def __init__(self, reflectable: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(indexed, batched)
         self.reflectable: bool = reflectable
     
     def physical_stuff(self, wnd, solid_blocks,
                        dx: float = 0, dy: float = 0) -> None:
         """Update, shift and collisions"""
+        batch: list[tuple] = []
+        pinned: list[Any] = []
         for item in self.tar:
             item.update()
-            item.draw(wnd)
-            item.shift(dx, dy)
+            self.reindex(item)
+            self.draw_item(wnd, item, batch)
+            self.shift_item(item, dx, dy, pinned)
             solid_blocks.do_collision(item, item.speed.limiter, hor_repulse=self.reflectable)
+        self.flush(wnd, batch)
+        self.sync(dx, dy, pinned)
     
     def collisions(self, solid_blocks) -> None:
-        for item in self.tar:
+        for item in self.active():
             solid_blocks.do_collision(item, item.speed.limiter, hor_repulse=self.reflectable)
     
     def __del__(self) -> None:
@@ -106,47 +248,107 @@ class ActiveSprites(SpriteList):
 class InteractiveSprites(ActiveSprites):
     """Based on class ActiveSprites. Items must have the destroyed and physical fields, and their class inherit the
     interactive interface"""
-    def __init__(self, reflectable: bool = False) -> None:
-        super().__init__(reflectable)
+    def __init__(self, reflectable: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(reflectable, indexed, batched)
     
     def all_stuff(self, wnd, target, solid_blocks,
                   dx: float = 0, dy: float = 0) -> None:
         """Update, shift, interacts and collisions"""
+        batch: list[tuple] = []
+        pinned: list[Any] = []
         for item in self.tar:
             item.update()
-            item.draw(wnd)
-            item.shift(dx, dy)
+            self.reindex(item)
+            self.draw_item(wnd, item, batch)
+            self.shift_item(item, dx, dy, pinned)
             item.interact(target)
             if item.physical and not item.destroyed:
                 solid_blocks.do_collision(item, item.speed.limiter, hor_repulse=self.reflectable)
+        self.flush(wnd, batch)
+        self.sync(dx, dy, pinned)
     
     def interacts(self, target) -> None:
-        for item in self.tar:
+        for item in self.active():
             item.interact(target)
     
+    def physical_collisions(self, solid_blocks) -> None:
+        """Collisions of the physical items only, as in the all_stuff method"""
+        for item in self.active():
+            if item.physical and not item.destroyed:
+                solid_blocks.do_collision(item, item.speed.limiter, hor_repulse=self.reflectable)
+    
     def __del__(self) -> None:
         pass
 
 
 class BulletsList(InteractiveSprites):
-    def __init__(self, reflectable: bool = False) -> None:
-        super().__init__(reflectable)
+    """Up to linear_targets targets are checked by every bullet, more are put into a grid"""
+    linear_targets: int = 16
+
+    def __init__(self, reflectable: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(reflectable, indexed, batched)
     
     def all_stuff(self, wnd, target, solid_blocks,
                   dx: float = 0, dy: float = 0) -> None:
         """Update, shift, interacts and collisions"""
+        batch: list[tuple] = []
+        pinned: list[Any] = []
         for item in self.tar:
             item.update()
-            item.draw(wnd)
-            item.shift(dx, dy)
+            self.reindex(item)
+            self.draw_item(wnd, item, batch)
+            self.shift_item(item, dx, dy, pinned)
             item.interact(target)
             if item.physical and not item.destroyed:
                 BulletsList.collide_solids(item, solid_blocks)
+        self.flush(wnd, batch)
+        self.sync(dx, dy, pinned)
+        self.compact()
+    
+    def compact(self) -> None:
+        """Removes destroyed bullets, each by a swap with the last one, and returns them to their pools"""
+        bullets: list = self.tar
+        i: int = 0
+        while i < len(bullets):
+            item = bullets[i]
+            if item.destroyed:
+                bullets[i] = bullets[-1]
+                bullets.pop()
+                if self.x_index is not None:
+                    self.x_index.remove(item)
+                if hasattr(item, 'pool') and (item.pool is not None):
+                    item.pool.recycle(item)
+            else:
+                i += 1
+    
+    def collisions(self, solid_blocks, raycaster=None) -> None:
+        """With a tile raycaster the whole move of a bullet is checked, not only its end"""
+        for item in self.active():
+            if item.physical and not item.destroyed:
+                if raycaster is not None:
+                    BulletsList.sweep(item, raycaster)
+                BulletsList.collide_solids(item, solid_blocks)
     
     def kill_targets(self, targets) -> None:
-        for item in self.tar:
+        """Every bullet visits only the targets near it. Nothing is prepared while no bullet flies"""
+        finder = None
+        for item in self.active():
             if item.activated and not item.destroyed:
-                BulletsList.interact_targets(item, targets)
+                if finder is None:
+                    finder = self.target_finder(targets)
+                BulletsList.interact_targets(item, finder(item))
+    
+    def target_finder(self, targets):
+        """A collection with the nearby method answers by itself, a few targets are all checked, 
+        more are put into a temporary grid. All give the targets in their original order"""
+        if hasattr(targets, 'nearby'):
+            return targets.nearby
+        if len(targets) <= self.linear_targets:
+            return lambda item: targets
+        grid: UniformGrid = UniformGrid()
+        for target in targets:
+            grid.insert(target)
+        return lambda item: grid.query(item.rect)
     
     @staticmethod
     def interact_targets(item, targets) -> None:
@@ -166,10 +368,19 @@ class BulletsList(InteractiveSprites):
         if hasattr(target, 'alive') and target.alive:
             item.interact(target)
     
+    @staticmethod
+    def sweep(item, raycaster) -> None:
+        """A bullet which passed through a solid tile is put back where it hit the tile"""
+        if item.activated and (item.previous != item.rect.center):
+            hit: tuple[float, float] | None = raycaster.cast(item.previous, item.rect.center)
+            if hit is not None:
+                item.rect.center = round(hit[0]), round(hit[1])
+    
     @staticmethod
     def collide_solids(item, solid_blocks) -> None:
         """Collisions with Mono/Poly-blocks"""
-        for block in solid_blocks:
+        blocks = solid_blocks.nearby(item) if hasattr(solid_blocks, 'nearby') else solid_blocks
+        for block in blocks:
             if item.rect.colliderect(block.rect) and not block.destroyed:
                 BulletsList.destroy_block(item, block)
     
@@ -192,13 +403,20 @@ class BulletsList(InteractiveSprites):
 
 class HorizontalWalls(SpriteList):
     """A class with horizontal collision control. Based on SpriteList class"""
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(indexed, batched)
     
     def hor_collision(self, sprite, limiter: float = 0) -> None:
         for item in self.tar:
             if sprite.rect.colliderect(item.rect):
-                self.hor_collide(sprite, item, limiter)
+                self.hor_collide(sprite, self.touched(item, sprite), limiter)
+    
+    @staticmethod
+    def touched(item, sprite):
+        """A merged collider is replaced by its tile under the sprite"""
+        if hasattr(item, 'piece'):
+            return item.piece(sprite.rect)
+        return item
     
     def hor_collide(self, sprite, item,
                     limiter: float = 0,
@@ -226,16 +444,75 @@ class HorizontalWalls(SpriteList):
 
 class SolidBlocks(HorizontalWalls):
     """A class for simulating solid blocks (vertical and horizontal collisions). Based on 
-    HorizontalWalls class."""
-    def __init__(self) -> None:
-        super().__init__()
+    HorizontalWalls class. With use_grid the blocks are also kept in a uniform grid, and collisions
+    only visit the blocks near the sprite"""
+    def __init__(self, use_grid: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(indexed, batched)
+        self.grid: UniformGrid | None = UniformGrid() if use_grid else None
+    
+    def append(self, item: Any) -> None:
+        super().append(item)
+        if self.grid is not None:
+            self.grid.insert(item)
+    
+    def delete_item(self, index: int) -> None:
+        if self.grid is not None:
+            self.grid.remove(self.tar[index])
+        super().delete_item(index)
+    
+    def clear(self) -> None:
+        super().clear()
+        if self.grid is not None:
+            self.grid.clear()
+    
+    def __setitem__(self, index: int, item: Any) -> None:
+        if self.grid is not None:
+            order: int = self.grid.remove(self.tar[index])
+            self.grid.insert(item, order)
+        super().__setitem__(index, item)
+    
+    def sync(self, dx: float, dy: float, pinned: list[Any]) -> None:
+        super().sync(dx, dy, pinned)
+        self.sync_grid(dx, dy, pinned)
+    
+    def sync_grid(self, dx: float = 0, dy: float = 0, items: list[Any] | None = None) -> None:
+        """Every block is checked without items"""
+        if self.grid is not None:
+            self.grid.shift(dx, dy)
+            for item in self.tar if items is None else items:
+                self.grid.update(item)
+    
+    def nearby(self, sprite, margin: tuple[float, float] = (0, 0)):
+        """Blocks that can touch the sprite, in the order of the collection. If a collision moves
+        the sprite, the rest of the blocks are taken around its new position"""
+        if self.grid is None:
+            yield from self.tar
+            return
+        area = sprite.rect.inflate(margin[0] * 2, margin[1] * 2)
+        items: list[Any] = self.grid.query(area)
+        last: int = -1
+        i: int = 0
+        while i < len(items):
+            item: Any = items[i]
+            i += 1
+            order: int = self.grid.order_of(item)
+            if order <= last:
+                continue
+            last = order
+            yield item
+            moved = sprite.rect.inflate(margin[0] * 2, margin[1] * 2)
+            if moved != area:
+                area = moved
+                items = self.grid.query(area)
+                i = 0
     
     def do_collision(self, sprite,
                      limiter: float = 0,
                      hor_repulse: bool = False) -> None:
         self.fix_jumping(sprite)
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect):
+                item = self.touched(item, sprite)
                 self.correct_hor_collide(sprite, item, limiter, hor_repulse)
                 self.ver_collider(sprite, item)
     
@@ -261,9 +538,9 @@ class SolidBlocks(HorizontalWalls):
         sprite.pos = sprite.pos[0], y
     
     def ver_collision(self, sprite) -> None:
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect):
-                self.ver_collider(sprite, item)
+                self.ver_collider(sprite, self.touched(item, sprite))
     
     def ver_collider(self, sprite, item) -> None:
         if (sprite.pos[1] < item.pos[1]) and not sprite.gravity.grounded:
@@ -305,15 +582,16 @@ class SolidBlocks(HorizontalWalls):
 
 class MarioBlocks(SolidBlocks):
     """A class for controlling collisions with blocks from the mario game(block with interact method)"""
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, use_grid: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(use_grid, indexed, batched)
        
     def do_collision(self, sprite,
                      limiter: float = 0,
                      hor_repulse: bool = False) -> None:
         self.fix_jumping(sprite)
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect) and not item.destroyed:
+                item = self.touched(item, sprite)
                 self.correct_hor_collide(sprite, item, limiter, hor_repulse)
                 self.ver_collider(sprite, item)
 
@@ -327,15 +605,21 @@ class MarioBlocks(SolidBlocks):
 
 
 class TransportPlatforms(MarioBlocks):
-    """Control of sprite and vehicle interaction. The objects must implement the Transport interface"""
-    def __init__(self) -> None:
-        super().__init__()
+    """Control of sprite and vehicle interaction. The objects must implement the Transport interface.
+    Platforms move by themselves, so every updated platform is moved in the grid as well"""
+    def __init__(self, use_grid: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(use_grid, indexed, batched)
+    
+    def reindex(self, item: Any) -> None:
+        super().reindex(item)
+        if self.grid is not None:
+            self.grid.update(item)
         
     def do_collision(self, sprite,
                      limiter: float = 0,
                      hor_repulse: bool = False) -> None:
         self.fix_jumping(sprite)
-        for item in self.tar:
+        for item in self.nearby(sprite, self.ride_margin(sprite)):
             self.fix_ride(item, sprite)
             if sprite.rect.colliderect(item.rect) and not item.destroyed:
                 self.correct_hor_collide(sprite, item, limiter, hor_repulse)
@@ -349,9 +633,17 @@ class TransportPlatforms(MarioBlocks):
         k_y: float = item.sizes[1] * .5 + sprite.sizes[1] * .6
         if (delta_x <= k_x) and ((delta_y > 0) and (abs(delta_y) <= k_y)):
             item.joy_ride(sprite)
+    
+    def ride_margin(self, sprite) -> tuple[float, float]:
+        """Distance at which fix_ride can still pick up the sprite"""
+        if self.grid is None:
+            return 0, 0
+        margin_x: float = self.grid.largest[0] * 1.2
+        margin_y: float = self.grid.largest[1] * 1.2 + sprite.sizes[1] * .6
+        return margin_x, margin_y
  
     def joy_rides(self, sprite) -> None:
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect) and not item.destroyed:
                 item.joy_ride(sprite)
 
@@ -360,8 +652,8 @@ class TransportPlatforms(MarioBlocks):
 
 
 class SurpriseBlocks(SolidBlocks):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, use_grid: bool = False, indexed: bool = False, batched: bool = False) -> None:
+        super().__init__(use_grid, indexed, batched)
 
     def jump_collide(self, item, sprite, collection) -> None:
         item.interact(sprite, collection)
@@ -377,9 +669,9 @@ class SurpriseBlocks(SolidBlocks):
         sprite.pos = sprite_pos[0], sprite_y
    
     def ver_collision(self, sprite, collection) -> None:
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect):
-                self.ver_collider(sprite, item, collection)
+                self.ver_collider(sprite, self.touched(item, sprite), collection)
     
     def ver_collider(self, sprite, item, collection) -> None:
         if (sprite.pos[1] < item.pos[1]) and not sprite.gravity.grounded:
@@ -392,8 +684,9 @@ class SurpriseBlocks(SolidBlocks):
                      limiter: float = 0,
                      hor_repulse: bool = False) -> None:
         self.fix_jumping(sprite)
-        for item in self.tar:
+        for item in self.nearby(sprite):
             if sprite.rect.colliderect(item.rect):
+                item = self.touched(item, sprite)
                 self.correct_hor_collide(sprite, item, limiter, hor_repulse)
                 self.ver_collider(sprite, item, collection)
 
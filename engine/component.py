@@ -1,20 +1,23 @@
-from engine.constants import DrawBounds, UpdateBounds
+from engine.constants import Bounds, DRAW_BOUNDS, UPDATE_BOUNDS
 from engine.tools import Timer
 
 
 class BoundChecker:
+    """The bounds object is shared, so a change of the screen reaches every checker"""
+    __slots__ = ('bounds', 'in_bound')
+
     def __init__(self,
                  x: tuple[float, float] | None = None,
                  y: tuple[float, float] | None = None,
-                 in_bound: bool = True) -> None:
-        if x is None:
-            self.x: tuple[float, float] = 0, 0
-        else:
-            self.x: tuple[float, float] = x
-        if y is None:
-            self.y: tuple[float, float] = 0, 0
-        else:
-            self.y: tuple[float, float] = y
+                 in_bound: bool = True,
+                 bounds: Bounds | None = None) -> None:
+        if bounds is None:
+            if x is None:
+                x = 0, 0
+            if y is None:
+                y = 0, 0
+            bounds = Bounds(x, y)
+        self.bounds: Bounds = bounds
         self.in_bound: bool = in_bound
     
     def check_bound(self, pos) -> None:
@@ -24,45 +27,46 @@ class BoundChecker:
             self.in_bound = False
     
     def check_x(self, pos_x: float) -> bool:
-        return (pos_x >= self.x[0]) and (pos_x <= self.x[1])
+        x: tuple[float, float] = self.bounds.bound_x
+        return (pos_x >= x[0]) and (pos_x <= x[1])
     
     def check_y(self, pos_y: float) -> bool:
-        return (pos_y >= self.y[0]) and (pos_y <= self.y[1])
+        y: tuple[float, float] = self.bounds.bound_y
+        return (pos_y >= y[0]) and (pos_y <= y[1])
+    
+    @property
+    def x(self) -> tuple[float, float]:
+        return self.bounds.bound_x
     
-    def __del__(self) -> None:
-        pass
+    @property
+    def y(self) -> tuple[float, float]:
+        return self.bounds.bound_y
         
     
 class Drawable(BoundChecker):
+    __slots__ = ()
+
     def __init__(self,
                  x: tuple[float, float] | None = None,
                  y: tuple[float, float] | None = None,
                  in_bound: bool = True) -> None:
-        super().__init__(x, y, in_bound)
-        draw_border: DrawBounds = DrawBounds()
-        self.x: tuple[float, float] = draw_border.bound_x
-        self.y: tuple[float, float] = draw_border.bound_y
-    
-    def __del__(self) -> None:
-        pass
+        super().__init__(x, y, in_bound, DRAW_BOUNDS)
 
 
 class Updatable(BoundChecker):
+    __slots__ = ()
+
     def __init__(self,
                  x: tuple[float, float] | None = None,
                  y: tuple[float, float] | None = None,
                  in_bound: bool = True) -> None:
-        super().__init__(x, y, in_bound)
-        update_bounds: UpdateBounds = UpdateBounds()
-        self.x: tuple[float, float] = update_bounds.bound_x
-        self.y: tuple[float, float] = update_bounds.bound_y
-    
-    def __del__(self) -> None:
-        pass
+        super().__init__(x, y, in_bound, UPDATE_BOUNDS)
 
 
 class Delta:
     """A class for obtaining value of a quantity in an infinitesimal period of time"""
+    __slots__ = ('value', 'max_value', 'limiter', '__timer')
+
     def __init__(self, value: float, max_value: float) -> None:
         self.value: float = value
         self.max_value: float = max_value * .75
@@ -78,6 +82,10 @@ class Delta:
         elapsed_time: float = self.__timer.restart()
         return self.value * elapsed_time
     
+    def reset(self) -> None:
+        """Forgets the time of the last step"""
+        self.__timer.reset()
+    
     def limit_value(self, value: float) -> float:
         if value > self.max_value:
             return self.max_value
@@ -89,13 +97,12 @@ class Delta:
             return self.max_value
         else:
             return value
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Speed(Delta):
     """A class for storing and controlling speed. Based on class Delta"""
+    __slots__ = ('right', 'down')
+
     def __init__(self, value: float, max_value: float,
                  right: bool = True,
                  down: bool = True) -> None:
@@ -134,13 +141,12 @@ class Speed(Delta):
         else:
             self.down = positive
             rect.move_ip(0, delta)
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Gravity(Delta):
     """A class for storing and controlling gravity. Based on class Delta"""
+    __slots__ = ('__timer_grounded', 'time_control', 'controlled', 'grounded')
+
     def __init__(self, value: float, 
                  max_value: float,
                  grounded: bool = False,
@@ -171,12 +177,11 @@ class Gravity(Delta):
             gravity: float = self.get_delta()
             fixed_gravity: float = self.fix_value(gravity)
             return fixed_gravity
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Jump(Delta):
+    __slots__ = ('ground', 'height', 'jumped', 'in_jumping')
+
     def __init__(self, value: float, 
                  max_value: float,
                  ground: float,
@@ -212,12 +217,11 @@ class Jump(Delta):
     def stop_jumping(self) -> None:
         self.in_jumping = False
         self.jumped = True
-    
-    def __del__(self) -> None:
-        pass
 
 
 class HP:
+    __slots__ = ('__health', '__max_health')
+
     def __init__(self, health: float,
                  max_health: float) -> None:
         self.__health: float = health
@@ -244,6 +248,3 @@ class HP:
     @property
     def relative_health(self) -> float:
         return self.__health / self.__max_health
-    
-    def __del__(self) -> None:
-        pass
@@ -2,11 +2,52 @@ import pygame as pg
 pg.init()
 
 
+class Screen:
+    """Screen metrics shared by the whole engine. The display is asked once, on first use. override
+    sets the resolution by hand (headless runs, tests), recompute asks the display again after the
+    window was resized and refreshes every watcher. Sizes and the screen bounds read it when used,
+    so spawners made after a recompute take the new sizes. Spawners and entities already made keep
+    theirs: a level is laid out on the tile grid of one size, so it is built again for another"""
+    def __init__(self) -> None:
+        self.__resolution: tuple[int, int] | None = None
+        self.__forced: tuple[int, int] | None = None
+        self.__watchers: list = []
+    
+    def recompute(self) -> None:
+        if self.__forced is not None:
+            self.__resolution = self.__forced
+        else:
+            info = pg.display.Info()
+            self.__resolution = info.current_w, info.current_h
+        for watcher in self.__watchers:
+            watcher.refresh()
+    
+    def override(self, resolution: tuple[int, int] | None) -> None:
+        """None returns to the resolution of the display"""
+        self.__forced = resolution
+        self.recompute()
+    
+    def watch(self, watcher) -> None:
+        """The watcher must have the refresh method"""
+        self.__watchers.append(watcher)
+    
+    @property
+    def resolution(self) -> tuple[int, int]:
+        if self.__resolution is None:
+            self.recompute()
+        return self.__resolution
+    
+    def __del__(self) -> None:
+        pass
+
+
+SCREEN: Screen = Screen()
+
+
 class Sizes:
     """A class for storing basic sizes"""
     def __init__(self) -> None:
-        info = pg.display.Info()
-        raw_sizes: tuple[float, float] = info.current_w, info.current_h
+        raw_sizes: tuple[float, float] = SCREEN.resolution
         self.__rows: int = 12
         self.__cols: int = 22
         self.__size: float = raw_sizes[1] / self.__rows
@@ -34,52 +75,70 @@ class Sizes:
         pass
 
 
-class DrawBounds:
-    """A class for storing drawing borders"""
+class Bounds:
+    """Borders along x and y"""
+    def __init__(self, bound_x: tuple[float, float] = (0, 0),
+                 bound_y: tuple[float, float] = (0, 0)) -> None:
+        self.bound_x: tuple[float, float] = bound_x
+        self.bound_y: tuple[float, float] = bound_y
+    
+    def __del__(self) -> None:
+        pass
+
+
+class ScreenBounds(Bounds):
+    """Borders made from the screen sizes by refresh. They are made on the first read, so the 
+    display is not asked on import, and again after every recompute of SCREEN"""
     def __init__(self) -> None:
+        SCREEN.watch(self)
+    
+    def __getattr__(self, name: str):
+        if name not in ('bound_x', 'bound_y'):
+            raise AttributeError(name)
+        self.refresh()
+        return self.__dict__[name]
+    
+    def refresh(self) -> None:
+        pass
+    
+    def __del__(self) -> None:
+        pass
+
+
+class DrawBounds(ScreenBounds):
+    """A class for storing drawing borders"""
+    def refresh(self) -> None:
         sizes: Sizes = Sizes()
         x1: float = -sizes.size * 5
         x2: float = sizes.wnd_size[0] + sizes.size * 5
-        self.__bound_x: tuple[float, float] = x1, x2
+        self.bound_x = x1, x2
         y1: float = -sizes.size * 5
         y2: float = sizes.wnd_size[1] + sizes.size * 5
-        self.__bound_y: tuple[float, float] = y1, y2
-    
-    @property
-    def bound_x(self) -> tuple[float, float]:
-        return self.__bound_x
-    
-    @property
-    def bound_y(self) -> tuple[float, float]:
-        return self.__bound_y
+        self.bound_y = y1, y2
     
     def __del__(self) -> None:
         pass
 
 
-class UpdateBounds:
+class UpdateBounds(ScreenBounds):
     """A class for storing activity boundaries (update method)"""
-    def __init__(self) -> None:
+    def refresh(self) -> None:
         sizes: Sizes = Sizes()
         x1: float = -sizes.wnd_size[0]
         x2: float = sizes.wnd_size[0] * 2
-        self.__bound_x: tuple[float , float] = x1, x2
+        self.bound_x = x1, x2
         y1: float = -sizes.size * 5
         y2: float = sizes.wnd_size[1] + sizes.size * 5
-        self.__bound_y: tuple[float, float] = y1, y2
-    
-    @property
-    def bound_x(self) -> tuple[float, float]:
-        return self.__bound_x
-    
-    @property
-    def bound_y(self) -> tuple[float, float]:
-        return self.__bound_y
+        self.bound_y = y1, y2
     
     def __del__(self) -> None:
         pass
 
 
+DRAW_BOUNDS: DrawBounds = DrawBounds()
+UPDATE_BOUNDS: UpdateBounds = UpdateBounds()
+
+
 class FPSer:
     """A class for storing the recommended fps and frame time"""
     def __init__(self) -> None:
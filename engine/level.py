@@ -0,0 +1,264 @@
+from engine.collection import SolidBlocks, MarioBlocks, TransportPlatforms, SurpriseBlocks
+from engine.collection import InteractiveSprites, BulletsList
+from engine.spawner import SpawnerMarioBlock, SpawnerCoin, SpawnerClassicBullet
+from engine.spawner import SpawnerBoatPlatform, SpawnerLiftPlatform, SpawnerRotatingPlatform
+from engine.surprise import SpawnerSurpriseBlock
+from engine.particles import SpawnerParticleRain
+from engine.enumerations import EntityName
+from engine.tilemap import TileCompiler, TileRaycaster
+from engine.render import DirtyRenderer
+from engine.stream import LevelStreamer
+from engine.store import BlockStore
+from engine.prerender import ChunkLayer
+from engine.tools import Camera, VIEW
+from engine.constants import Sizes
+from engine.assets import ASSETS
+from engine.mario import Model7
+import random
+import pygame as pg
+
+
+BLOCK_PATH: str = 'Assets/Sprites/Blocks/Monos/Block.bmp'
+BRICKS_PATH: str = 'Assets/Sprites/Blocks/Monos/Bricks.bmp'
+MARIO_PATH: str = 'Assets/Sprites/Characters/Polys/Mario/'
+BULLET_PATH: str = 'Assets/Sprites/Characters/Polys/Mario/Fire/5.bmp'
+DRIP_PATH: str = 'Assets/Sprites/Items/Monos/Drip.bmp'
+ASSETS.register(BLOCK_PATH, BRICKS_PATH, BULLET_PATH, DRIP_PATH,
+                *(f'{MARIO_PATH}{form}/{i}.bmp' for form in ('Base', 'Fire') for i in range(4)))
+
+
+class Level:
+    """A level built from a tilemap. Solid tiles 'B' become merged colliders drawn by a chunk layer,
+    'M' are bricks, 'S' are surprise blocks, 'C' are coins, 'P' are lift platforms and 'R' is the
+    spawn of the player. The frame is split into the update, collision, interact and draw phases, so
+    they can be measured separately. With dirty the frame is shown by a dirty renderer, which
+    redraws only the changed regions while the camera stands still. With store the bricks are kept
+    in a block store. With streamed the tiles become colliders and entities only near the camera.
+    Bullets are swept against the 'B', 'M' and 'S' tiles, and a destroyed brick lets them through"""
+    def __init__(self, tilemap,
+                 use_grid: bool = True,
+                 world_space: bool = True,
+                 indexed: bool = True,
+                 batched: bool = True,
+                 dirty: bool = False,
+                 store: bool = False,
+                 streamed: bool = False) -> None:
+        size: float = Sizes().size
+        if store and streamed:
+            raise ValueError('A streamed level keeps its bricks as sprites')
+        self.tilemap = tilemap
+        self.solid_blocks: SolidBlocks = SolidBlocks(use_grid)
+        if store:
+            self.mario_blocks: MarioBlocks = BlockStore(use_grid)
+        else:
+            self.mario_blocks: MarioBlocks = MarioBlocks(use_grid, indexed, batched)
+        self.surprise_blocks: SurpriseBlocks = SurpriseBlocks(use_grid, indexed, batched)
+        self.platforms: TransportPlatforms = TransportPlatforms(use_grid, indexed, batched)
+        self.items: InteractiveSprites = InteractiveSprites(indexed=indexed, batched=batched)
+        self.bullets: BulletsList = BulletsList(batched=batched)
+        self.players: list[Model7] = []
+        self.weather: list = []
+        self.spawn_pos: tuple[float, float] = size, size
+        images: dict = {'B': ASSETS.image(BLOCK_PATH), 'M': ASSETS.image(BRICKS_PATH)}
+        self.layer: ChunkLayer = ChunkLayer(tilemap, images)
+        wnd_w, wnd_h = Sizes().wnd_size
+        self.camera: Camera = Camera((0, 0), wnd_w * .4, wnd_w * .6, wnd_h * .7, world_space)
+        self.renderer: DirtyRenderer | None = DirtyRenderer(self.draw_background) if dirty else None
+        self.tile_spawners: dict[str, tuple] = {'M': (self.mario_blocks, SpawnerMarioBlock()),
+                                                'S': (self.surprise_blocks, SpawnerSurpriseBlock()),
+                                                'C': (self.items, SpawnerCoin()),
+                                                'P': (self.platforms, SpawnerLiftPlatform(size * 2))}
+        self.raycaster: TileRaycaster = TileRaycaster(tilemap, 'BMS')
+        self.layer.watch(self.raycaster)
+        self.streamer: LevelStreamer | None = LevelStreamer(self) if streamed else None
+        if streamed:
+            self.find_spawn()
+        else:
+            TileCompiler('B').feed(tilemap, self.solid_blocks)
+            self.fill_blocks()
+
+    def fill_blocks(self) -> None:
+        size: float = Sizes().size
+        for row_index, row in enumerate(self.tilemap):
+            for col, symbol in enumerate(row):
+                pos: tuple[float, float] = col * size, row_index * size
+                if symbol in self.tile_spawners:
+                    self.add_tile(symbol, pos)
+                elif symbol == 'R':
+                    self.spawn_pos = pos
+
+    def add_tile(self, symbol: str, pos: tuple[float, float]) -> tuple:
+        """Spawns the entity of the symbol into its collection. Returns both"""
+        collection, spawner = self.tile_spawners[symbol]
+        entity = spawner.spawn(pos)
+        if symbol == 'M':
+            self.layer.adopt(entity)
+        collection.append(entity)
+        return collection, entity
+
+    def find_spawn(self) -> None:
+        """The spawn of the player without visiting the other tiles"""
+        size: float = Sizes().size
+        if hasattr(self.tilemap, 'cells'):
+            for row_index, col in self.tilemap.cells('R')[:1].tolist():
+                self.spawn_pos = col * size, row_index * size
+            return
+        for row_index, row in enumerate(self.tilemap):
+            col: int = row.find('R')
+            if col >= 0:
+                self.spawn_pos = col * size, row_index * size
+                return
+
+    def free_cells(self) -> list[tuple[float, float]]:
+        """Empty cells standing on a tile, the places for the populated entities"""
+        size: float = Sizes().size
+        cells: list[tuple[float, float]] = []
+        for row_index, row in enumerate(self.tilemap[:-1]):
+            below: str = self.tilemap[row_index + 1]
+            for col, symbol in enumerate(row):
+                if (symbol == ' ') and (col < len(below)) and (below[col] != ' '):
+                    cells.append((col * size, row_index * size))
+        return cells
+
+    def populate(self, players: int = 1,
+                 coins: int = 0,
+                 surprises: int = 0,
+                 platforms: int = 0,
+                 bullets: int = 0,
+                 rain: int = 0,
+                 seed: int = 0) -> None:
+        """Adds entities at pseudo-random free cells. The same seed gives the same level"""
+        size: float = Sizes().size
+        rand: random.Random = random.Random(seed)
+        cells: list[tuple[float, float]] = self.free_cells() or [self.spawn_pos]
+        self.add_players(players, rand, cells)
+        coin_spawner: SpawnerCoin = SpawnerCoin()
+        for _ in range(coins):
+            self.items.append(coin_spawner.spawn(rand.choice(cells)))
+        surprise_spawner: SpawnerSurpriseBlock = SpawnerSurpriseBlock()
+        for _ in range(surprises):
+            x, y = rand.choice(cells)
+            self.surprise_blocks.append(surprise_spawner.spawn((x, y - size * 2)))
+        platform_spawners: tuple = (SpawnerBoatPlatform(size * 3), SpawnerLiftPlatform(size * 2),
+                                    SpawnerRotatingPlatform())
+        for i in range(platforms):
+            x, y = rand.choice(cells)
+            self.platforms.append(platform_spawners[i % len(platform_spawners)].spawn((x, y - size * 3)))
+        bullet_spawner: SpawnerClassicBullet = SpawnerClassicBullet(BULLET_PATH, (size * .25, size * .25),
+                                                                    enemy_name=EntityName.monster)
+        for _ in range(bullets):
+            x, y = rand.choice(cells)
+            bullet = bullet_spawner.spawn((x, y + size * .5))
+            bullet.right = rand.random() < .5
+            bullet.activated = True
+            self.bullets.append(bullet)
+        if rain:
+            self.weather.append(SpawnerParticleRain(DRIP_PATH, rain).spawn())
+
+    def add_players(self, number: int, rand: random.Random, cells: list[tuple[float, float]]) -> None:
+        """The first player spawns at 'R' and is followed by the camera, the crowd takes free cells"""
+        for i in range(number):
+            pos: tuple[float, float] = self.spawn_pos if i == 0 else rand.choice(cells)
+            self.players.append(self.spawn_player(pos))
+
+    @staticmethod
+    def spawn_player(pos: tuple[float, float]) -> Model7:
+        size: float = Sizes().size
+        base_images: list = [ASSETS.image(f'{MARIO_PATH}Base/{i}.bmp') for i in range(4)]
+        fireman_images: list = [ASSETS.image(f'{MARIO_PATH}Fire/{i}.bmp') for i in range(4)]
+        sizes: tuple[float, float] = size * .8, size
+        return Model7(base_images, fireman_images, sizes, pos, pos[1] + sizes[1],
+                      size * 3, size * .5, -size * .5, size * .5, fireform=True)
+
+    def set_keyboard(self, keyboard) -> None:
+        for player in self.players:
+            player.keyboard = keyboard
+
+    def update(self) -> None:
+        if self.streamer is not None:
+            self.streamer.update()
+        for player in self.players:
+            player.update()
+        self.mario_blocks.updates()
+        self.surprise_blocks.updates()
+        self.platforms.updates()
+        self.items.updates()
+        self.bullets.updates()
+        for weather in self.weather:
+            weather.update()
+        if self.players:
+            world_objects: tuple = (self.solid_blocks, self.mario_blocks, self.surprise_blocks,
+                                    self.platforms, self.items, self.bullets, self)
+            self.camera.world_shift(self.players[0], world_objects)
+
+    def shifts(self, dx: float = 0, dy: float = 0) -> None:
+        """Shifts the parts of the level which are not collections"""
+        self.layer.shift(dx, dy)
+        self.raycaster.shift(dx, dy)
+        for player in self.players[1:]:
+            player.shift(dx, dy)
+
+    def collide(self) -> None:
+        for player in self.players:
+            limiter: float = player.speed.limiter
+            self.solid_blocks.do_collision(player, limiter)
+            self.mario_blocks.do_collision(player, limiter)
+            self.surprise_blocks.do_collision(player, self.items, limiter)
+            self.platforms.do_collision(player, limiter)
+        self.items.physical_collisions(self.solid_blocks)
+        self.bullets.collisions(self.solid_blocks, self.raycaster)
+        self.bullets.collisions(self.mario_blocks)
+        self.bullets.collisions(self.surprise_blocks)
+
+    def interact(self) -> None:
+        for player in self.players:
+            self.items.interacts(player)
+            player.key_shoot(self.bullets)
+        self.bullets.kill_targets(self.players)
+        self.bullets.compact()
+
+    def render(self, wnd) -> None:
+        """Draws the frame and shows it on the display"""
+        if self.renderer is None:
+            self.draw(wnd)
+            pg.display.flip()
+        else:
+            self.renderer.render(wnd, self.sprites(), self.scene_key)
+
+    def draw_background(self, wnd) -> None:
+        wnd.fill((100, 150, 255))
+        self.layer.draw(wnd)
+
+    def sprites(self) -> list:
+        """Everything drawn over the background, in the drawing order"""
+        sprites: list = []
+        for collection in (self.mario_blocks, self.surprise_blocks, self.platforms, self.items, self.bullets):
+            sprites.extend(collection.visible())
+        sprites.extend(self.players)
+        sprites.extend(self.weather)
+        return sprites
+
+    def draw(self, wnd) -> None:
+        self.draw_background(wnd)
+        self.mario_blocks.draws(wnd)
+        self.surprise_blocks.draws(wnd)
+        self.platforms.draws(wnd)
+        self.items.draws(wnd)
+        self.bullets.draws(wnd)
+        for player in self.players:
+            player.draw(wnd)
+        for weather in self.weather:
+            weather.draw(wnd)
+
+    @property
+    def scene_key(self) -> tuple:
+        """Changes when the background on the screen changes"""
+        return VIEW.x, VIEW.y, self.layer.origin, self.layer.version
+
+    @property
+    def entities(self) -> int:
+        return (len(self.solid_blocks) + len(self.mario_blocks) + len(self.surprise_blocks) +
+                len(self.platforms) + len(self.items) + len(self.bullets) + len(self.players))
+
+    def __del__(self) -> None:
+        pass
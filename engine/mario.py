@@ -4,7 +4,7 @@ from engine.enumerations import EntityName
 from engine.charguns import SpawnerFiregun
 from engine.bar import CounterItems
 from engine.constants import Sizes
-from time import sleep
+from engine.tools import CLOCK
 import pygame as pg
 
 
@@ -62,16 +62,17 @@ class Model1(Model0):
         super().__init__(images, sizes, pos, speed, frame_time,
                          is_moving, play_anime, on_screen, is_move, static, right)
         self._name: int = EntityName.player
+        self.keyboard = pg.key    #Anything with the get_pressed method, e.g. ScriptedKeys
     
     def update(self) -> None:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.drawable.check_bound(pos)
         self.motion()
         self.sync_right()
         self.define_image()
     
     def motion(self) -> None:
-        keys = pg.key.get_pressed()
+        keys = self.keyboard.get_pressed()
         self.motion_x(keys)
     
     def motion_x(self, keys) -> None:
@@ -160,7 +161,7 @@ class Model3(Model2):
         self.jump.ground += dy
     
     def motion(self) -> None:
-        keys = pg.key.get_pressed()
+        keys = self.keyboard.get_pressed()
         self.motion_x(keys)
         self.motion_up(keys)
     
@@ -199,7 +200,10 @@ class Model3(Model2):
 
 
 class Model4(Model3):
-    """Improved to interact with the mushrooms of life"""
+    """Improved to interact with the mushrooms of life. A dead player comes back after death_pause 
+    seconds of the simulation clock, while the rest of the game goes on"""
+    batched_draw: bool = False
+
     def __init__(self, images,
                  sizes: tuple[float, float],
                  pos: tuple[float, float],
@@ -233,6 +237,8 @@ class Model4(Model3):
         self.lives: int = lives
         self.alive: bool = True if lives else False
         self.death_sound = death_sound
+        self.death_pause: float = 2
+        self.__death_time: float | None = None
             
     def draw(self, wnd) -> None:
         if self.alive:
@@ -242,6 +248,16 @@ class Model4(Model3):
         super().draw(wnd)
         self.live_bar.draw(wnd)
     
+    def dirty_rects(self) -> list[pg.Rect]:
+        """Screen rects of the sprite and the live bar, for the dirty renderer"""
+        if not self.alive:
+            return []
+        rects: list[pg.Rect] = self.live_bar.dirty_rects()
+        args: tuple | None = self.blit_args()
+        if args is not None:
+            rects.append(pg.Rect(args[1], args[0].get_size()))
+        return rects
+    
     def update(self) -> None:
         self.respawn()
         if self.alive:
@@ -259,12 +275,20 @@ class Model4(Model3):
 
     def respawn(self, pos: tuple[float, float] = (0, 0)) -> None:
         if (self.lives > 0) and not self.alive:
-            self.respawn_options(pos)
+            if self.__death_time is None:
+                self.start_death(pos)
+            if CLOCK.now() - self.__death_time >= self.death_pause:
+                self.__death_time = None
+                self.respawn_options(pos)
+        else:
+            self.__death_time = None
+
+    def start_death(self, pos: tuple[float, float] = (0, 0)) -> None:
+        self.play_death_snd()
+        self.set_spawn_pos(pos)
+        self.__death_time = CLOCK.now()
 
     def respawn_options(self, pos: tuple[float, float] = (0, 0)) -> None:       
-            self.play_death_snd()
-            self.set_spawn_pos(pos)
-            sleep(2)
             self.lives -= 1
             self.alive = True
             self.rect.left, self.rect.top = self.__spawn_pos
@@ -283,6 +307,11 @@ class Model4(Model3):
         if (pos != (0, 0)) and (pos != self.__spawn_pos):
             self.__spawn_pos = pos
     
+    @property
+    def dying(self) -> bool:
+        """The death sequence is playing"""
+        return self.__death_time is not None
+    
     def __del__(self) -> None:
         pass
 
@@ -373,6 +402,12 @@ class Model6(Model5):
         super().draw_options(wnd)
         self.coin_bar.draw(wnd)
 
+    def dirty_rects(self) -> list[pg.Rect]:
+        rects: list[pg.Rect] = super().dirty_rects()
+        if self.alive:
+            rects.extend(self.coin_bar.dirty_rects())
+        return rects
+
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         super().shift(dx, dy)
         self.coin_bar.shift(dx, dy)
@@ -435,6 +470,12 @@ class Model7(Model6):
         if self.fireform:
             self.fire_bar.draw(wnd)
     
+    def dirty_rects(self) -> list[pg.Rect]:
+        rects: list[pg.Rect] = super().dirty_rects()
+        if self.alive and self.fireform:
+            rects.extend(self.fire_bar.dirty_rects())
+        return rects
+    
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         super().shift(dx, dy)
         self.fire_bar.shift(dx, dy)
@@ -445,7 +486,7 @@ class Model7(Model6):
         self.fire_bar.counter.change_text(str(self.firegun.bullets))
     
     def key_shoot(self, bullets_list) -> None:
-        keys = pg.key.get_pressed()
+        keys = self.keyboard.get_pressed()
         if keys[pg.K_SPACE]:
             self.shooting(bullets_list)
     
@@ -1,11 +1,14 @@
 from engine.enumerations import ProcStatus
 from engine.tools import RandPos, Timer
+from engine.atlas import FRAME_SETS
 from engine.component import Delta
 import pygame as pg
 import math as mt
 
 
 class Circle:
+    __slots__ = ('speed', 'radius', 'clockwise', 'center', '__t')
+
     def __init__(self, speed: float,
                   max_speed: float,
                   radius: float,
@@ -60,11 +63,12 @@ class Circle:
         y: float = self.center[1] + dy
         self.center = x, y
 
-    def __del__(self) -> None:
-        pass
-
 
 class Rotation:
+    """Rotations of the same image, sizes, moments and direction share one set of rotated frames. 
+    Each rotation keeps only its index and center, the rect of a frame is made when it is shown"""
+    __slots__ = ('__sizes', '__pos', '__max_ind', '__speed', '__ind', '__rotation')
+
     def __init__(self, image,
                  sizes: tuple[float, float],
                  pos: tuple[float, float],
@@ -76,18 +80,15 @@ class Rotation:
         self.__max_ind: int = moments - 1
         self.__speed: float = speed
         self.__ind: float = 0
-        self.__rotation = []
-        delta: float = 360 / moments
         image.set_colorkey((255, 255, 255))
-        image = pg.transform.scale(image, sizes)
-        for i in range(1, moments + 1):
-            angle: float = delta * i
-            rotated_image = pg.transform.rotate(image, angle)
-            if clockwise:
-                rotated_image = pg.transform.flip(rotated_image, True, False)
-            rect = rotated_image.get_rect()
-            rect.center = pos
-            self.__rotation.append([rotated_image, rect])
+        key: tuple = 'rotation', image, int(sizes[0]), int(sizes[1]), moments, clockwise
+        self.__rotation: tuple = FRAME_SETS.get(key, lambda: self.build(image, sizes, moments, clockwise))
+
+    @staticmethod
+    def build(image, sizes: tuple[float, float], moments: int, clockwise: bool) -> list:
+        delta: float = 360 / moments
+        image = FRAME_SETS.variant(image, sizes)
+        return [FRAME_SETS.variant(image, flip_x=clockwise, degree=delta * i) for i in range(1, moments + 1)]
 
     def rotate(self):
         self.__ind += self.__speed
@@ -95,35 +96,27 @@ class Rotation:
         if index > self.__max_ind:
             index = 0
             self.__ind = 0
-        return self.__rotation[index]
+        rotated_image = self.__rotation[index]
+        rect = rotated_image.get_rect()
+        rect.center = self.__pos
+        return rotated_image, rect
 
     def shift_center(self, dx: float = 0, dy: float = 0) -> None:
         pos: tuple[float, float] = self.__pos[0] + dx, self.__pos[1] + dy
         self.set_center(pos)
 
     def set_center(self, pos: tuple[float, float]) -> None:
-        if pos != self.__pos:
-            self.__pos = pos
-            for i, _ in enumerate(self.__rotation):
-                self.__rotation[i][1].center = pos
+        self.__pos = pos
 
     def total_resize(self, sizes: tuple[float, float]) -> None:
         if sizes != self.__sizes:
             delta_y: float = (self.__sizes[1] - sizes[1]) * .5
             self.__sizes = sizes
             self.__pos = self.__pos[0], self.__pos[1] + delta_y
-            for i, pair in enumerate(self.__rotation):
-                pair[0] = pg.transform.scale(pair[0], sizes)
-                pair[1] = pair[0].get_rect()
-                pair[1].center = self.__pos
-                self.__rotation[i] = pair
+            self.__rotation = tuple(FRAME_SETS.variant(image, sizes) for image in self.__rotation)
 
     def total_flip(self, flip_x: bool = True, flip_y: bool = False) -> None:
-        for i, pair in enumerate(self.__rotation):
-            pair[0] = pg.transform.flip(pair[0], flip_x, flip_y)
-            pair[1] = pair[0].get_rect()
-            pair[1].center = self.__pos
-            self.__rotation[i] = pair
+        self.__rotation = tuple(pg.transform.flip(image, flip_x, flip_y) for image in self.__rotation)
 
     @property
     def pos(self) -> tuple[float, float]:
@@ -133,12 +126,11 @@ class Rotation:
     @property
     def sizes(self) -> tuple[float, float]:
         return self.__sizes
-
-    def __del__(self) -> None:
-        pass
         
 
 class Patrol:
+    __slots__ = ('speed', 'begin', 'end', 'vertical', 'forward', 'round1')
+
     def __init__(self,
                  speed: float,
                  max_speed: float,
@@ -212,11 +204,10 @@ class Patrol:
             self.begin += dx
             self.end += dx
 
-    def __del__(self) -> None:
-        pass
-
 
 class Drip:
+    __slots__ = ('__speed', '__middle_line', '__bounds_x', '__bounds_y', '__fall')
+
     def __init__(self,
                  speed: float,
                  max_speed: float,
@@ -253,13 +244,12 @@ class Drip:
         bound_y: tuple[float, float] = self.__bounds_y[0], self.__middle_line
         pos: tuple[float, float] = RandPos.rand_pos(self.__bounds_x, bound_y)
         return pos
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Parabola:
     """Give argument fly_angle in degrees"""
+    __slots__ = ('speed', 'fly_angle', '__lim', 'right', 'down')
+
     def __init__(self,
                  speed: float,
                  max_speed: float,
@@ -277,6 +267,9 @@ class Parabola:
         rect.move_ip(offset[0], offset[1])
         return offset
     
+    def reset(self) -> None:
+        self.speed.reset()
+    
     def get_offset(self, special: bool = False) -> tuple[float, float]:
         angle: float = self.fix_angle(special)
         speed: float = self.speed.get_current()
@@ -303,6 +296,3 @@ class Parabola:
         if special and not self.right:
             angle += self.__lim
         return angle
-    
-    def __del__(self) -> None:
-        pass
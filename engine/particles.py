@@ -0,0 +1,224 @@
+from engine.constants import Sizes, DRAW_BOUNDS
+from engine.enumerations import EntityName
+from engine.interfaces import Spawner
+from engine.assets import ASSETS
+from engine.tools import CLOCK
+from itertools import repeat
+import numpy as np
+
+
+class ParticleRain:
+    """Rain drops stored in NumPy arrays instead of sprites: positions and velocities, one row per
+    drop. All drops move in one vectorized step and are drawn by a single blits call. A drop below
+    the lower bound starts again at a random point between the upper bound and the middle line, a
+    drop blown past a side comes back from the other side. Speed is in pixels per second, setting it
+    sets the velocity of every drop"""
+    def __init__(self, image,
+                 speed: float,
+                 middle_line: float,
+                 bounds_x: tuple[float, float],
+                 bounds_y: tuple[float, float],
+                 quantity: int = 1000,
+                 rain_on: bool = True,
+                 seed: int | None = None) -> None:
+        self.image = image
+        self.middle_line: float = middle_line
+        self.bounds_x: tuple[float, float] = bounds_x
+        self.bounds_y: tuple[float, float] = bounds_y
+        self.__half: tuple[float, float] = image.get_width() * .5, image.get_height() * .5
+        self.__rng: np.random.Generator = np.random.default_rng(seed)
+        self.__x: np.ndarray = np.zeros(quantity, np.float32)
+        self.__y: np.ndarray = np.zeros(quantity, np.float32)
+        self.__vx: np.ndarray = np.zeros(quantity, np.float32)
+        self.__vy: np.ndarray = np.zeros(quantity, np.float32)
+        self.speed = speed
+        self.respawn(np.ones(quantity, bool))
+        self.rain_on: bool = rain_on
+        self._name: int = EntityName.other
+
+    def respawn(self, mask: np.ndarray) -> None:
+        """Moves the chosen drops to random start points, as the Drip motion does"""
+        count: int = int(np.count_nonzero(mask))
+        if count:
+            x: np.ndarray = self.__rng.integers(int(self.bounds_x[0]), int(self.bounds_x[1]), count, endpoint=True)
+            y: np.ndarray = self.__rng.integers(int(self.bounds_y[0]), int(self.middle_line), count, endpoint=True)
+            self.__x[mask] = x - self.__half[0]
+            self.__y[mask] = y - self.__half[1]
+
+    def update(self) -> None:
+        if self.rain_on:
+            self.__x += self.__vx * CLOCK.dt
+            self.__y += self.__vy * CLOCK.dt
+            self.wrap()
+            self.respawn(self.__y + self.__half[1] >= self.bounds_y[1])
+
+    def wrap(self) -> None:
+        """Brings the drops whose centres left the bounds along x back from the other side"""
+        left, right = self.bounds_x
+        width: float = right - left
+        if width <= 0:
+            return
+        centres: np.ndarray = self.__x + self.__half[0]
+        out: np.ndarray = (centres < left) | (centres > right)
+        if out.any():
+            self.__x[out] = (centres[out] - left) % width + left - self.__half[0]
+
+    def draw(self, wnd) -> None:
+        positions: list = np.stack((self.__x, self.__y), axis=1).astype(np.int32).tolist()
+        wnd.blits(zip(repeat(self.image), positions), doreturn=False)
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        pass
+
+    @property
+    def speed(self) -> float:
+        return self.__speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self.__speed = speed
+        self.__vy[:] = speed
+
+    @property
+    def positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Top left corners of the drops along x and y"""
+        return self.__x, self.__y
+
+    @property
+    def velocities(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per-drop velocities along x and y, views which may be changed in place"""
+        return self.__vx, self.__vy
+
+    @property
+    def quantity(self) -> int:
+        return len(self.__x)
+
+    @property
+    def name(self) -> int:
+        return self._name
+
+    def __del__(self) -> None:
+        pass
+
+
+class ParticleClouds:
+    """The particle version of Clouds. Positions and velocities are NumPy arrays, one row per cloud,
+    so all clouds drift in one vectorized step, come back from the other side of bounds_x and are
+    drawn by a single blits call. Speed is in pixels per second and a step is limited as by Speed"""
+    def __init__(self, image,
+                 speed: float,
+                 max_speed: float,
+                 bounds_x: tuple[float, float],
+                 bounds_y: tuple[float, float],
+                 quantity: int = 6,
+                 to_right: bool = True,
+                 stop_clouds: bool = False,
+                 seed: int | None = None) -> None:
+        self.image = image
+        self.bounds_x: tuple[float, float] = bounds_x
+        self.limiter: float = max_speed * .75
+        rng: np.random.Generator = np.random.default_rng(seed)
+        x: np.ndarray = rng.integers(int(bounds_x[0]), int(bounds_x[1]), quantity, endpoint=True)
+        y: np.ndarray = rng.integers(int(bounds_y[0]), int(bounds_y[1]), quantity, endpoint=True)
+        self.__x: np.ndarray = x.astype(np.float32)
+        self.__y: np.ndarray = y.astype(np.float32)
+        self.__vx: np.ndarray = np.full(quantity, speed if to_right else -speed, np.float32)
+        self.stop_clouds: bool = stop_clouds
+        self._name: int = EntityName.other
+
+    def update(self) -> None:
+        if not self.stop_clouds:
+            self.__x += np.clip(self.__vx * CLOCK.dt, -self.limiter, self.limiter)
+            self.wrap()
+
+    def wrap(self) -> None:
+        """Clouds past the far side start again at the near one, as recover_cloud_pos does"""
+        left, right = self.bounds_x
+        self.__x[(self.__vx > 0) & (self.__x >= right)] = left
+        self.__x[(self.__vx < 0) & (self.__x <= left)] = right
+
+    def draw(self, wnd) -> None:
+        positions: list = np.stack((self.__x, self.__y), axis=1).astype(np.int32).tolist()
+        wnd.blits(zip(repeat(self.image), positions), doreturn=False)
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        pass
+
+    @property
+    def right(self) -> bool:
+        return bool(np.all(self.__vx >= 0))
+
+    @right.setter
+    def right(self, right: bool) -> None:
+        """Turns every cloud, keeping its speed"""
+        np.abs(self.__vx, out=self.__vx)
+        if not right:
+            np.negative(self.__vx, out=self.__vx)
+
+    @property
+    def positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Top left corners of the clouds along x and y"""
+        return self.__x, self.__y
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Per-cloud velocities along x, a view which may be changed in place"""
+        return self.__vx
+
+    @property
+    def quantity(self) -> int:
+        return len(self.__x)
+
+    @property
+    def name(self) -> int:
+        return self._name
+
+    def __del__(self) -> None:
+        pass
+
+
+class SpawnerParticleRain(Spawner):
+    """The particle version of SpawnerRain. Drops fall by the average step of a Drip"""
+    def __init__(self, image_path: str,
+                 drips_quantity: int = 2000) -> None:
+        size: float = Sizes().size
+        self.__sizes: tuple[float, float] = size * .125, size * .25
+        self.__quantity: int = drips_quantity
+        self.__speed: float = size * .375 * CLOCK.fps
+        self.image = ASSETS.surface(image_path, self.__sizes)
+
+    def spawn(self) -> ParticleRain:
+        return ParticleRain(self.image, self.__speed, DRAW_BOUNDS.bound_y[1],
+                            DRAW_BOUNDS.bound_x, DRAW_BOUNDS.bound_y, self.__quantity)
+
+    def __del__(self) -> None:
+        pass
+
+
+class SpawnerParticleClouds(Spawner):
+    """Takes the arguments of Clouds, the bounds are those of drawing when the clouds are spawned"""
+    def __init__(self, image_path: str,
+                 speed: float,
+                 max_speed: float,
+                 sizes: tuple[float, float],
+                 quantity: int = 6,
+                 to_right: bool = True,
+                 stop_clouds: bool = False) -> None:
+        self.__speed: float = speed
+        self.__max_speed: float = max_speed
+        self.__sizes: tuple[float, float] = sizes
+        self.__quantity: int = quantity
+        self.__to_right: bool = to_right
+        self.__stop_clouds: bool = stop_clouds
+        self.image = ASSETS.surface(image_path, sizes)
+
+    def spawn(self) -> ParticleClouds:
+        return ParticleClouds(self.image, self.__speed, self.__max_speed, DRAW_BOUNDS.bound_x,
+                              DRAW_BOUNDS.bound_y, self.__quantity, self.__to_right, self.__stop_clouds)
+
+    @property
+    def sizes(self) -> tuple[float, float]:
+        return self.__sizes
+
+    def __del__(self) -> None:
+        pass
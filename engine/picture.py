@@ -1,19 +1,22 @@
 from engine.interfaces import GhostSprite
 from engine.enumerations import EntityName
 from engine.component import Drawable
-from engine.tools import Animator
+from engine.tools import Animator, VIEW
+from engine.atlas import FRAME_SETS
 import pygame as pg
 
 
 class Picture:
+    __slots__ = ('normal', 'flipped', 'right')
+
     def __init__(self, image,
                  right: bool = True) -> None:
         if right:
             self.normal = image
-            self.flipped = pg.transform.flip(image, True, False)
+            self.flipped = FRAME_SETS.variant(image, flip_x=True)
         else:
             self.flipped = image
-            self.normal = pg.transform.flip(image, True, False)
+            self.normal = FRAME_SETS.variant(image, flip_x=True)
         self.right: bool = right
     
     def change_image(self):
@@ -21,9 +24,6 @@ class Picture:
             return self.normal
         else:
             return self.flipped
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Cover:
@@ -32,15 +32,15 @@ class Cover:
                  sizes: tuple[float, float],
                  right: bool = True) -> None:
         image.set_colorkey((255, 255, 255))
-        image = pg.transform.scale(image, sizes)
+        image = FRAME_SETS.variant(image, sizes)
         self.image: Picture = Picture(image, right)
         self.right: bool = right
 
     def total_resize(self, sizes: tuple[float, float]) -> None:
         cur_size: tuple[int, int] = self.image.normal.get_size()
         if sizes != cur_size:
-            self.image.normal = pg.transform.scale(self.image.normal, sizes)
-            self.image.flipped = pg.transform.scale(self.image.flipped, sizes)
+            self.image.normal = FRAME_SETS.variant(self.image.normal, sizes)
+            self.image.flipped = FRAME_SETS.variant(self.image.flipped, sizes)
 
     def total_flip(self, flip_x: bool = True, flip_y: bool = False) -> None:
         self.image.normal = pg.transform.flip(self.image.normal, flip_x, flip_y)
@@ -71,7 +71,10 @@ class Cover:
 
 class Imagery(GhostSprite):
     """A class fow working with an image and it's rectangle. The image has 1 view. Image is loaded 
-    pygame image from bmp file"""
+    pygame image from bmp file. Collections may draw it in a batch from blit_args, so subclasses 
+    change blit_args instead of draw, or clear batched_draw"""
+    batched_draw: bool = True
+
     def __init__(self, image,
                  sizes: tuple[float, float],
                  pos: tuple[float, float],
@@ -86,11 +89,20 @@ class Imagery(GhostSprite):
         print('Nothing to do with me...')
     
     def draw(self, wnd) -> None:
-        wnd.blit(self.image, self.rect)
+        args: tuple | None = self.blit_args()
+        if args is not None:
+            wnd.blit(*args)
+    
+    def blit_args(self) -> tuple | None:
+        """The image and its place on the screen, None if nothing is drawn"""
+        return self.image, self.screen_pos()
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         self.rect.move_ip(dx, dy)
     
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.rect.topleft)
+    
     @property
     def name(self) -> int:
         return self._name
@@ -136,16 +148,20 @@ class Sprite(Imagery):
         self.right: bool = right
         self.static: bool = static
     
-    def draw(self, wnd) -> None:
+    def blit_args(self) -> tuple | None:
         if self.drawable.in_bound:
-            super().draw(wnd)
+            return super().blit_args()
+        return None
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         if not self.static:
             super().shift(dx, dy)
     
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.rect.topleft, self.static)
+    
     def update(self) -> None:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.drawable.check_bound(pos)
         self.sync_right()
         self.change_image()
@@ -236,7 +252,9 @@ class Skin:
 
 
 class AnimatedSprite(GhostSprite):
-    """Animated sprite with right and left animation"""
+    """Animated sprite with right and left animation. Drawn the same way as Imagery"""
+    batched_draw: bool = True
+
     def __init__(self, images,
                  sizes: tuple[float, float],
                  pos: tuple[float, float],
@@ -256,15 +274,24 @@ class AnimatedSprite(GhostSprite):
         self.play_anime: bool = play_anime
         
     def draw(self, wnd) -> None:
+        args: tuple | None = self.blit_args()
+        if args is not None:
+            wnd.blit(*args)
+    
+    def blit_args(self) -> tuple | None:
         if self.drawable.in_bound:
-            wnd.blit(self.image, self.rect)
+            return self.image, self.screen_pos()
+        return None
 
     def shift(self, dx: float = 0, dy: float = 0) -> None:
         if not self.static:
             self.rect.move_ip(dx, dy)
+    
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.rect.topleft, self.static)
             
     def update(self) -> None:
-        pos: tuple[float, float] = self.rect.left, self.rect.top
+        pos: tuple[float, float] = self.screen_pos()
         self.drawable.check_bound(pos)
         self.sync_right()
         self.change_image()
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait as wait_for
+from engine.assets import ASSETS
+import os
+
+
+SOUND_EXTENSIONS: tuple[str, ...] = '.ogg', '.wav', '.mp3'
+
+
+class Preloader:
+    """Loads the files of a manifest into the asset cache on a pool of threads. The threads decode
+    the images and sounds; poll, called by the main thread between frames, converts the decoded
+    images to the display format and hands the results to the cache. A file that failed is left
+    to the cache, which loads it (and raises) on the first request. A path missing from the manifest
+    is loaded on its first request as before. Without paths the manifest is the files registered by
+    the spawners of the imported modules"""
+    def __init__(self, paths: tuple[str, ...] | None = None,
+                 workers: int | None = None,
+                 cache=ASSETS) -> None:
+        if paths is None:
+            paths = cache.manifest
+        self.paths: tuple[str, ...] = tuple(dict.fromkeys(path for path in paths if not cache.cached(path)))
+        self.workers: int = workers or min(len(self.paths), os.cpu_count() or 1) or 1
+        self.cache = cache
+        self.errors: dict[str, Exception] = {}
+        self.__pool: ThreadPoolExecutor | None = None
+        self.__pending: dict[Future, str] = {}
+        self.__done: int = 0
+
+    def start(self) -> None:
+        if self.__pool is not None:
+            return
+        self.__pool = ThreadPoolExecutor(self.workers)
+        self.__pending = {self.__pool.submit(self.decode, path): path for path in self.paths}
+
+    def decode(self, path: str):
+        if path.lower().endswith(SOUND_EXTENSIONS):
+            return self.cache.load_sound(path)
+        return self.cache.decode_image(path)
+
+    def poll(self, limit: int | None = None) -> int:
+        """Hands the finished files to the cache without waiting. Returns their number"""
+        finished: list[Future] = [future for future in self.__pending if future.done()]
+        if limit is not None:
+            finished = finished[:limit]
+        for future in finished:
+            self.deliver(future)
+        if self.__pool is not None and not self.__pending:
+            self.__pool.shutdown()
+        return len(finished)
+
+    def deliver(self, future: Future) -> None:
+        path: str = self.__pending.pop(future)
+        self.__done += 1
+        error: BaseException | None = future.exception()
+        if error is not None:
+            self.errors[path] = error
+        elif path.lower().endswith(SOUND_EXTENSIONS):
+            self.cache.put_sound(path, future.result())
+        else:
+            self.cache.put_image(path, future.result())
+
+    def wait(self) -> None:
+        """Loads everything, blocking"""
+        self.start()
+        wait_for(list(self.__pending))
+        self.poll()
+
+    @property
+    def done(self) -> int:
+        return self.__done
+
+    @property
+    def total(self) -> int:
+        return len(self.paths)
+
+    @property
+    def progress(self) -> float:
+        """Share of the files handed to the cache, from 0 to 1"""
+        return self.__done / self.total if self.total else 1.
+
+    @property
+    def finished(self) -> bool:
+        return self.__done == self.total
+
+    def __del__(self) -> None:
+        pass
@@ -0,0 +1,147 @@
+from engine.interfaces import GhostSprite
+from engine.enumerations import EntityName
+from engine.constants import Sizes
+from collections import OrderedDict
+from engine.atlas import FRAME_SETS
+from engine.tools import VIEW
+from math import floor
+import pygame as pg
+
+
+class ChunkLayer(GhostSprite):
+    """Static tiles of a tilemap baked into chunk surfaces. images maps a tilemap symbol to a
+    loaded pygame image, other symbols are left empty. Chunks are baked on first sight and kept in
+    a cache of max_chunks surfaces, so drawing a frame blits only the chunks on the screen. Adopted
+    blocks are drawn by the layer, and their destruction re-bakes only their chunk and clears the
+    cell of the watchers. version grows with every change of the tiles"""
+    def __init__(self, tilemap,
+                 images: dict,
+                 size: float | None = None,
+                 origin: tuple[float, float] = (0, 0),
+                 chunk: int = 16,
+                 max_chunks: int = 64) -> None:
+        if size is None:
+            size = Sizes().size
+        self.__size: float = size
+        self.__chunk: int = chunk
+        self.__chunk_px: float = chunk * size
+        self.__tiles: list[bytearray] = [bytearray(row, 'ascii') for row in tilemap]
+        self.__rows: int = len(self.__tiles)
+        self.__cols: int = max((len(row) for row in self.__tiles), default=0)
+        self.__images: dict[int, pg.surface.Surface] = {}
+        for symbol, image in images.items():
+            tile: pg.surface.Surface = FRAME_SETS.variant(image, (size, size)).copy()
+            tile.set_colorkey((255, 255, 255))
+            self.__images[ord(symbol)] = tile
+        self.__baked: OrderedDict[tuple[int, int], pg.surface.Surface | None] = OrderedDict()
+        self.max_chunks: int = max_chunks
+        self.origin: tuple[float, float] = origin
+        self.version: int = 0
+        self.__watchers: list = []
+        self._name: int = EntityName.other
+
+    def draw(self, wnd) -> None:
+        wnd_w, wnd_h = wnd.get_size()
+        left, top = VIEW.to_world((0, 0))
+        x1: int = max(floor((left - self.origin[0]) / self.__chunk_px), 0)
+        y1: int = max(floor((top - self.origin[1]) / self.__chunk_px), 0)
+        x2: int = min(floor((left + wnd_w - self.origin[0]) / self.__chunk_px), self.chunk_cols - 1)
+        y2: int = min(floor((top + wnd_h - self.origin[1]) / self.__chunk_px), self.chunk_rows - 1)
+        for cy in range(y1, y2 + 1):
+            for cx in range(x1, x2 + 1):
+                self.draw_chunk(wnd, cx, cy)
+
+    def draw_chunk(self, wnd, cx: int, cy: int) -> None:
+        surface: pg.surface.Surface | None = self.get_chunk(cx, cy)
+        if surface is not None:
+            x: float = self.origin[0] + round(cx * self.__chunk_px)
+            y: float = self.origin[1] + round(cy * self.__chunk_px)
+            wnd.blit(surface, VIEW.to_screen((x, y)))
+
+    def get_chunk(self, cx: int, cy: int) -> pg.surface.Surface | None:
+        key: tuple[int, int] = cx, cy
+        if key in self.__baked:
+            self.__baked.move_to_end(key)
+        else:
+            self.__baked[key] = self.bake(cx, cy)
+            if len(self.__baked) > self.max_chunks:
+                self.__baked.popitem(last=False)
+        return self.__baked[key]
+
+    def bake(self, cx: int, cy: int) -> pg.surface.Surface | None:
+        """Returns None for a chunk without tiles"""
+        col1: int = cx * self.__chunk
+        row1: int = cy * self.__chunk
+        base_x: int = round(col1 * self.__size)
+        base_y: int = round(row1 * self.__size)
+        surface: pg.surface.Surface | None = None
+        for row in range(row1, min(row1 + self.__chunk, self.__rows)):
+            tiles: bytearray = self.__tiles[row]
+            for col in range(col1, min(col1 + self.__chunk, len(tiles))):
+                image = self.__images.get(tiles[col])
+                if image is None:
+                    continue
+                if surface is None:
+                    surface = self.new_chunk()
+                pos: tuple[int, int] = round(col * self.__size) - base_x, round(row * self.__size) - base_y
+                surface.blit(image, pos)
+        return surface
+
+    def new_chunk(self) -> pg.surface.Surface:
+        side: int = round(self.__chunk_px) + 1
+        surface: pg.surface.Surface = pg.surface.Surface((side, side)).convert()
+        surface.fill((255, 255, 255))
+        surface.set_colorkey((255, 255, 255))
+        return surface
+
+    def adopt(self, block) -> None:
+        """The block is drawn by the layer from now on"""
+        block.layer = self
+
+    def watch(self, watcher) -> None:
+        """The clear method of the watcher gets the column and the row of every erased tile"""
+        self.__watchers.append(watcher)
+
+    def erase(self, pos: tuple[float, float]) -> None:
+        """Removes the tile at the position and drops its chunk from the cache"""
+        col: int = round((pos[0] - self.origin[0]) / self.__size)
+        row: int = round((pos[1] - self.origin[1]) / self.__size)
+        if (0 <= row < self.__rows) and (0 <= col < len(self.__tiles[row])):
+            self.__tiles[row][col] = ord(' ')
+            self.invalidate(col // self.__chunk, row // self.__chunk)
+            for watcher in self.__watchers:
+                watcher.clear(col, row)
+
+    def invalidate(self, cx: int, cy: int) -> None:
+        self.__baked.pop((cx, cy), None)
+        self.version += 1
+
+    def update(self) -> None:
+        pass
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        """Rectangles of the adopted blocks move by whole pixels, so the origin does the same"""
+        self.origin = self.origin[0] + int(dx), self.origin[1] + int(dy)
+
+    @property
+    def chunk_cols(self) -> int:
+        return -(-self.__cols // self.__chunk)
+
+    @property
+    def chunk_rows(self) -> int:
+        return -(-self.__rows // self.__chunk)
+
+    @property
+    def name(self) -> int:
+        return self._name
+
+    @property
+    def sizes(self) -> tuple[float, float]:
+        return self.__cols * self.__size, self.__rows * self.__size
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        return self.origin
+
+    def __del__(self) -> None:
+        pass
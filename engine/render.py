@@ -0,0 +1,136 @@
+import pygame as pg
+
+
+class DirtyRenderer:
+    """Draws a frame by redrawing only the regions of the screen which changed. A sprite is tracked
+    by its blit_args: when its image or rect changes, or it appears or vanishes, its old and new
+    rects become dirty. A sprite drawing more than one image (the player with its HUD) gives its
+    rects by dirty_rects and is redrawn every frame. In a dirty region the background is restored
+    and the sprites over it are drawn again with the clip set to the region, then only the dirty
+    rects go to the display. A sprite with neither method, a new scene key (the camera scrolled,
+    the tiles changed) or dirty rects larger than max_area of the screen make a full redraw. While
+    the scene key changes every frame the background is drawn straight to the screen, and it is
+    kept in a surface only from the first frame of a still camera"""
+    def __init__(self, draw_background,
+                 max_area: float = .5) -> None:
+        self.draw_background = draw_background
+        self.max_area: float = max_area
+        self.__background: pg.surface.Surface | None = None
+        self.__scene_key = None
+        self.__background_key = None
+        self.__tracked: dict[int, tuple] = {}
+        self.__full: bool = True
+        self.full_frames: int = 0
+        self.dirty_frames: int = 0
+
+    def render(self, wnd, sprites, scene_key=None) -> None:
+        """The sprites are given in the drawing order"""
+        entries: list[tuple] = [self.track(sprite) for sprite in sprites]
+        if self.__full or (scene_key != self.__scene_key):
+            self.full(wnd, entries, scene_key)
+            return
+        self.keep_background(wnd, scene_key)
+        dirty: list[pg.Rect] | None = self.dirty(wnd, entries)
+        if dirty is None:
+            self.full(wnd, entries, scene_key)
+            return
+        bounds: list[pg.Rect] = [entry[3] for entry in entries]
+        for rect in dirty:
+            wnd.set_clip(rect)
+            wnd.blit(self.__background, rect, rect)
+            for index in rect.collidelistall(bounds):
+                self.draw_entry(wnd, entries[index])
+        wnd.set_clip(None)
+        pg.display.update(dirty)
+        self.dirty_frames += 1
+
+    @staticmethod
+    def track(sprite) -> tuple:
+        """The sprite, its blit args, its screen rects and their union. Rects are None for a
+        sprite which cannot be tracked"""
+        if hasattr(sprite, 'blit_args') and sprite.batched_draw:
+            args: tuple | None = sprite.blit_args()
+            if args is None:
+                return sprite, None, [], pg.Rect(0, 0, 0, 0)
+            rect: pg.Rect = pg.Rect(args[1], args[0].get_size()).inflate(2, 2)
+            return sprite, args, [rect], rect
+        if hasattr(sprite, 'dirty_rects'):
+            rects: list[pg.Rect] = [rect.inflate(2, 2) for rect in sprite.dirty_rects()]
+            bound: pg.Rect = rects[0].unionall(rects[1:]) if rects else pg.Rect(0, 0, 0, 0)
+            return sprite, None, rects, bound
+        return sprite, None, None, None
+
+    def dirty(self, wnd, entries: list[tuple]) -> list[pg.Rect] | None:
+        """Changed rects clipped to the screen, None when a full redraw is cheaper or needed"""
+        screen: pg.Rect = wnd.get_rect()
+        tracked: dict[int, tuple] = {}
+        rects: list[pg.Rect] = []
+        for entry in entries:
+            if entry[2] is None:
+                return None
+            old: tuple | None = self.__tracked.pop(id(entry[0]), None)
+            tracked[id(entry[0])] = entry
+            if (old is not None) and self.same(old, entry):
+                continue
+            rects.extend(entry[2])
+            if old is not None:
+                rects.extend(old[2])
+        for old in self.__tracked.values():
+            rects.extend(old[2])
+        self.__tracked = tracked
+        dirty: list[pg.Rect] = [rect.clip(screen) for rect in rects]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        area: int = sum(rect.width * rect.height for rect in dirty)
+        if area > screen.width * screen.height * self.max_area:
+            return None
+        return dirty
+
+    @staticmethod
+    def same(old: tuple, new: tuple) -> bool:
+        """Only sprites tracked by blit_args can stay the same"""
+        if (new[1] is None) or (old[1] is None):
+            return (new[1] is None) and (old[1] is None) and not new[2] and not old[2]
+        return (old[1][0] is new[1][0]) and (old[3] == new[3])
+
+    def keep_background(self, wnd, scene_key=None) -> None:
+        """Draws the background of the scene into its surface, if it is not there yet"""
+        if (scene_key == self.__background_key) and (wnd.get_size() == self.background_size):
+            return
+        if wnd.get_size() != self.background_size:
+            self.__background = pg.surface.Surface(wnd.get_size()).convert()
+        self.draw_background(self.__background)
+        self.__background_key = scene_key
+
+    def full(self, wnd, entries: list[tuple], scene_key=None) -> None:
+        if scene_key == self.__scene_key:
+            self.keep_background(wnd, scene_key)
+            wnd.blit(self.__background, (0, 0))
+        else:
+            self.draw_background(wnd)
+            self.__scene_key = scene_key
+        for entry in entries:
+            self.draw_entry(wnd, entry)
+        pg.display.flip()
+        self.__tracked = {id(entry[0]): entry for entry in entries}
+        self.__full = False
+        self.full_frames += 1
+
+    @staticmethod
+    def draw_entry(wnd, entry: tuple) -> None:
+        if entry[1] is not None:
+            wnd.blit(*entry[1])
+        else:
+            entry[0].draw(wnd)
+
+    def invalidate(self) -> None:
+        """The next frame is drawn in full, e.g. after drawing over the screen by other means"""
+        self.__full = True
+
+    @property
+    def background_size(self) -> tuple[int, int] | None:
+        if self.__background is None:
+            return None
+        return self.__background.get_size()
+
+    def __del__(self) -> None:
+        pass
@@ -1,6 +1,7 @@
 from engine.enumerations import EntityName
 from engine.interfaces import GhostSprite
 from engine.component import Drawable
+from engine.tools import VIEW
 import pygame as pg
 
 
@@ -9,25 +10,30 @@ class RectangleShape(GhostSprite):
                  pos: tuple[float, float],
                  sizes: tuple[float, float],
                  color: tuple[int, ...],
-                 line_width: int = 0) -> None:
+                 line_width: int = 0,
+                 static: bool = False) -> None:
+        """A static shape ignores the shift method and the camera"""
         self.drawable: Drawable = Drawable()
         self.__pos: tuple[float, float] = pos
         self.__sizes: tuple[float, float] = sizes
         self.__color: tuple[int, ...] = color
         self.__line_width: int = line_width
         self._name: int = EntityName.other
+        self.static: bool = static
     
     def draw(self, wnd) -> None:
         if self.drawable.in_bound:
-            rect = pg.rect.Rect(self.__pos[0], self.__pos[1], self.__sizes[0], self.__sizes[1])
+            pos: tuple[float, float] = VIEW.to_screen(self.__pos, self.static)
+            rect = pg.rect.Rect(pos[0], pos[1], self.__sizes[0], self.__sizes[1])
             pg.draw.rect(wnd, self.__color, rect, self.__line_width)
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
-        pos: tuple[float, float] = self.__pos[0] + dx, self.__pos[1] + dy
-        self.set_pos(pos)
+        if not self.static:
+            pos: tuple[float, float] = self.__pos[0] + dx, self.__pos[1] + dy
+            self.set_pos(pos)
     
     def update(self) -> None:
-        self.drawable.check_bound(self.__pos)
+        self.drawable.check_bound(VIEW.to_screen(self.__pos, self.static))
     
     def set_pos(self, pos: tuple[float, float]) -> None:
         if pos != self.__pos:
@@ -78,24 +84,29 @@ class CircleShape(GhostSprite):
                  radius: float,
                  color: tuple[int, ...],
                  center: tuple[float, float],
-                 line_width: int = 0) -> None:
+                 line_width: int = 0,
+                 static: bool = False) -> None:
+        """A static shape ignores the shift method and the camera"""
         self.drawable: Drawable = Drawable()
         self.__center: tuple[float, float] = center
         self.__color: tuple[int, ...] = color
         self.__radius: float = radius
         self.__line_width: int = line_width
         self._name: int = EntityName.other
+        self.static: bool = static
     
     def draw(self, wnd) -> None:
         if self.drawable.in_bound:
-            pg.draw.circle(wnd, self.__color, self.__center, self.__radius, self.__line_width)
+            center: tuple[float, float] = VIEW.to_screen(self.__center, self.static)
+            pg.draw.circle(wnd, self.__color, center, self.__radius, self.__line_width)
     
     def shift(self, dx: float = 0, dy: float = 0) -> None:
-        center: tuple[float, float] = self.__center[0] + dx, self.__center[1] + dy
-        self.set_center(center)
+        if not self.static:
+            center: tuple[float, float] = self.__center[0] + dx, self.__center[1] + dy
+            self.set_center(center)
     
     def update(self) -> None:
-        self.drawable.check_bound(self.__center)
+        self.drawable.check_bound(VIEW.to_screen(self.__center, self.static))
     
     def set_center(self, center: tuple[float, float]) -> None:
         if center != self.__center:
@@ -0,0 +1,182 @@
+from engine.constants import Sizes
+from bisect import bisect_left, bisect_right
+from typing import Any
+from math import floor
+
+
+class UniformGrid:
+    """A uniform grid of tile-sized cells for finding items near a rectangle. Every item keeps the
+    order in which it was inserted, so the query returns items in the same order as a linear scan
+    of the collection. The origin follows the shifts of the world"""
+    def __init__(self, cell: float | None = None) -> None:
+        if cell is None:
+            cell = Sizes().size
+        self.__cell: float = cell
+        self.__cells: dict[tuple[int, int], list[Any]] = {}
+        self.__spans: dict[int, tuple[int, int, int, int]] = {}
+        self.__orders: dict[int, int] = {}
+        self.__counter: int = 0
+        self.origin: tuple[float, float] = 0, 0
+        self.largest: tuple[float, float] = 0, 0
+
+    def insert(self, item: Any, order: int | None = None) -> None:
+        if order is None:
+            order = self.__counter
+            self.__counter += 1
+        self.__orders[id(item)] = order
+        span: tuple[int, int, int, int] = self.get_span(item.rect)
+        self.fill_span(item, span)
+        self.fix_largest(item.rect)
+
+    def remove(self, item: Any) -> int:
+        """Returns the order of the removed item"""
+        span: tuple[int, int, int, int] = self.__spans.pop(id(item))
+        self.clear_span(item, span)
+        return self.__orders.pop(id(item))
+
+    def update(self, item: Any) -> None:
+        """Moves the item to other cells if its rectangle has left the old ones"""
+        span: tuple[int, int, int, int] = self.get_span(item.rect)
+        old_span: tuple[int, int, int, int] = self.__spans[id(item)]
+        if span != old_span:
+            self.clear_span(item, old_span)
+            self.fill_span(item, span)
+            self.fix_largest(item.rect)
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        """Rectangles are moved by whole pixels, so the origin is moved the same way"""
+        self.origin = self.origin[0] + int(dx), self.origin[1] + int(dy)
+
+    def query(self, rect) -> list[Any]:
+        """Items whose cells overlap the rectangle, in the order of insertion"""
+        x1, y1, x2, y2 = self.get_span(rect)
+        found: dict[int, Any] = {}
+        for col in range(x1, x2 + 1):
+            for row in range(y1, y2 + 1):
+                for item in self.__cells.get((col, row), ()):
+                    found[id(item)] = item
+        items: list[Any] = list(found.values())
+        items.sort(key=self.order_of)
+        return items
+
+    def order_of(self, item: Any) -> int:
+        return self.__orders[id(item)]
+
+    def clear(self) -> None:
+        self.__cells = {}
+        self.__spans = {}
+        self.__orders = {}
+        self.__counter = 0
+        self.largest = 0, 0
+
+    def get_span(self, rect) -> tuple[int, int, int, int]:
+        """First and last columns and rows covered by the rectangle"""
+        left: float = rect.left - self.origin[0]
+        top: float = rect.top - self.origin[1]
+        x1: int = floor(left / self.__cell)
+        y1: int = floor(top / self.__cell)
+        x2: int = floor((left + rect.width) / self.__cell)
+        y2: int = floor((top + rect.height) / self.__cell)
+        return x1, y1, x2, y2
+
+    def fill_span(self, item: Any, span: tuple[int, int, int, int]) -> None:
+        self.__spans[id(item)] = span
+        for col in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                self.__cells.setdefault((col, row), []).append(item)
+
+    def clear_span(self, item: Any, span: tuple[int, int, int, int]) -> None:
+        for col in range(span[0], span[2] + 1):
+            for row in range(span[1], span[3] + 1):
+                cell: list[Any] = self.__cells[(col, row)]
+                cell.remove(item)
+                if not cell:
+                    del self.__cells[(col, row)]
+
+    def fix_largest(self, rect) -> None:
+        width: float = max(self.largest[0], rect.width)
+        height: float = max(self.largest[1], rect.height)
+        self.largest = width, height
+
+    @property
+    def cell(self) -> float:
+        return self.__cell
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def __del__(self) -> None:
+        pass
+
+
+class SortedIndex:
+    """Items sorted by the left side of their rectangles. A range query returns the items whose left
+    side lies in the range, in the order of insertion. The origin follows the shifts of the world"""
+    def __init__(self) -> None:
+        self.__keys: list[float] = []
+        self.__items: list[Any] = []
+        self.__known: dict[int, float] = {}
+        self.__orders: dict[int, int] = {}
+        self.__counter: int = 0
+        self.origin: float = 0
+
+    def insert(self, item: Any, order: int | None = None) -> None:
+        if order is None:
+            order = self.__counter
+            self.__counter += 1
+        self.__orders[id(item)] = order
+        self.place(item, item.rect.left - self.origin)
+
+    def remove(self, item: Any) -> int:
+        """Returns the order of the removed item"""
+        self.displace(item)
+        return self.__orders.pop(id(item))
+
+    def update(self, item: Any) -> None:
+        """Moves the item to its new place if its rectangle has moved"""
+        key: float = item.rect.left - self.origin
+        if key != self.__known[id(item)]:
+            self.displace(item)
+            self.place(item, key)
+
+    def shift(self, dx: float = 0) -> None:
+        """Rectangles are moved by whole pixels, so the origin is moved the same way"""
+        self.origin += int(dx)
+
+    def query(self, x1: float, x2: float) -> list[Any]:
+        """Items with the left side between x1 and x2, in the order of insertion"""
+        first: int = bisect_left(self.__keys, x1 - self.origin)
+        last: int = bisect_right(self.__keys, x2 - self.origin)
+        items: list[Any] = self.__items[first:last]
+        items.sort(key=self.order_of)
+        return items
+
+    def order_of(self, item: Any) -> int:
+        return self.__orders[id(item)]
+
+    def place(self, item: Any, key: float) -> None:
+        position: int = bisect_right(self.__keys, key)
+        self.__keys.insert(position, key)
+        self.__items.insert(position, item)
+        self.__known[id(item)] = key
+
+    def displace(self, item: Any) -> None:
+        key: float = self.__known.pop(id(item))
+        position: int = bisect_left(self.__keys, key)
+        while self.__items[position] is not item:
+            position += 1
+        del self.__keys[position]
+        del self.__items[position]
+
+    def clear(self) -> None:
+        self.__keys = []
+        self.__items = []
+        self.__known = {}
+        self.__orders = {}
+        self.__counter = 0
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __del__(self) -> None:
+        pass
@@ -2,17 +2,15 @@ from engine.block import LifeShroom, SuperShroom, MarioBlock, Coin, FireFlower,
 from engine.platforms import CircleMovePlatform, RotatingPlatform, BoatPlatform, LiftPlatform
 from engine.platforms import ParabolaPlatform
 from engine.bullet import Bullet, ClassicBullet, ParabolaBullet
-from engine.constants import Sizes, DrawBounds
+from engine.constants import Sizes, DRAW_BOUNDS
 from engine.interfaces import Spawner
+from engine.assets import ASSETS
 from math import pi
-import pygame as pg
-
-
-SIZE: float = Sizes().size
 
 
 class SpawnerBullet(Spawner):
-    """Entity name is taken from the EntityName enumeration"""
+    """Entity name is taken from the EntityName enumeration. Destroyed bullets come back to the pool 
+    of their spawner and are reused by the next spawn"""
     def __init__(self, image_path: str,
                  sizes: tuple[float, float],
                  damage: int = 1,
@@ -20,17 +18,34 @@ class SpawnerBullet(Spawner):
                  life_time: float = 5,
                  physical: bool = True) -> None:
         super().__init__()
-        self._image = pg.image.load(image_path).convert()
+        self._image = ASSETS.surface(image_path, sizes)
         self._sizes: tuple[float, float] = sizes
         self._damage: int = damage
         self._enemy_name: int = enemy_name
         self._life_time: float = life_time
         self._physical: bool = physical
+        self._pool: list[Bullet] = []
     
     def spawn(self, pos: tuple[float, float]) -> Bullet:
+        if self._pool:
+            bullet: Bullet = self._pool.pop()
+            bullet.reset(pos)
+        else:
+            bullet: Bullet = self.build(pos)
+            bullet.pool = self
+        return bullet
+    
+    def build(self, pos: tuple[float, float]) -> Bullet:
         return Bullet(self._image, self._sizes, pos, self._enemy_name,
                       self._damage, self._life_time, phys=self._physical)
     
+    def recycle(self, bullet: Bullet) -> None:
+        self._pool.append(bullet)
+    
+    @property
+    def pooled(self) -> int:
+        return len(self._pool)
+    
     @property
     def sizes(self) -> tuple[float, float]:
         return self._sizes
@@ -46,10 +61,11 @@ class SpawnerClassicBullet(SpawnerBullet):
                  damage: int = 1,
                  life_time: float = 8,
                  physical: bool = True) -> None:
+        size: float = Sizes().size
         super().__init__(image_path, sizes, damage, enemy_name, life_time, physical)
-        self._speed: float = SIZE * .8
+        self._speed: float = size * .8
     
-    def spawn(self, pos: tuple[float, float]) -> ClassicBullet:
+    def build(self, pos: tuple[float, float]) -> ClassicBullet:
         return ClassicBullet(self._image, self._sizes, pos, self._speed, self._speed,
                              self._enemy_name, self._damage, self._life_time, phys=self._physical)
     
@@ -73,7 +89,7 @@ class SpawnerParabolaBullet(SpawnerClassicBullet):
         self._right: bool = right
         self._down: bool = down
     
-    def spawn(self, pos: tuple[float, float]) -> ParabolaBullet:
+    def build(self, pos: tuple[float, float]) -> ParabolaBullet:
         return ParabolaBullet(self._image, self._sizes, pos, self._speed, self._speed, self._fly_angle,
                               self._life_time, self._enemy_name, self._damage, right=self._right,
                               down=self._down, phys=self._physical)
@@ -85,34 +101,35 @@ class SpawnerParabolaBullet(SpawnerClassicBullet):
 class SpawnerRain(Spawner):
     def __init__(self, image_path: str, 
                  drips_quantity: int = 200) -> None:
-        drw: DrawBounds = DrawBounds()
-        self.__bounds_y: tuple[float, float] = drw.bound_y[0], drw.bound_y[1]
-        self.__bounds_x: tuple[float, float] = drw.bound_x
-        self.__sizes: tuple[float, float] = SIZE * .125, SIZE * .25
+        size: float = Sizes().size
+        self.__sizes: tuple[float, float] = size * .125, size * .25
         self.__quantity: int = drips_quantity
-        self.__speed: float = SIZE
-        self.image = pg.image.load(image_path).convert()
+        self.__speed: float = size
+        self.image = ASSETS.surface(image_path, self.__sizes)
     
     def spawn(self) -> Rain:
-        return Rain(self.image, self.__speed, self.__speed, self.__bounds_y[1],
-                    self.__bounds_x, self.__bounds_y, self.__sizes, self.__quantity)
+        return Rain(self.image, self.__speed, self.__speed, DRAW_BOUNDS.bound_y[1],
+                    DRAW_BOUNDS.bound_x, DRAW_BOUNDS.bound_y, self.__sizes, self.__quantity)
     
     def __del__(self) -> None:
         pass
 
 
 class SpawnerLifeShroom(Spawner):
+    assets: tuple[str, ...] = ASSETS.register('Assets/Sprites/Items/Monos/LifeShroom.bmp',
+                                              'Assets/Music/extra_health.ogg')
+
     def __init__(self) -> None:
-        shroom_path: str = 'Assets/Sprites/Items/Monos/LifeShroom.bmp'
-        sound_path: str = 'Assets/Music/extra_health.ogg'
-        self.__shroom_image = pg.image.load(shroom_path).convert()
-        self.__shroom_sizes: tuple[float, float] = SIZE, SIZE
-        self.__shroom_speed: tuple[float, float] = SIZE * .05
-        self.__shroom_mass: float = SIZE * .2
-        self.__sound = pg.mixer.Sound(sound_path)
+        size: float = Sizes().size
+        shroom_path, sound_path = self.assets
+        self.__shroom_sizes: tuple[float, float] = size, size
+        self.__shroom_image = ASSETS.surface(shroom_path, self.__shroom_sizes)
+        self.__shroom_speed: tuple[float, float] = size * .05
+        self.__shroom_mass: float = size * .2
+        self.__sound = ASSETS.sound(sound_path)
     
     def spawn(self, pos: tuple[float, float]) -> LifeShroom:
-        return LifeShroom(self.__shroom_image, self.__sound, SIZE * .15,
+        return LifeShroom(self.__shroom_image, self.__sound, self.__shroom_sizes[0] * .15,
                           self.__shroom_sizes, self.__shroom_speed, self.__shroom_mass, pos)
 
     @property
@@ -124,17 +141,20 @@ class SpawnerLifeShroom(Spawner):
 
 
 class SpawnerSuperShroom(Spawner):
+    assets: tuple[str, ...] = ASSETS.register('Assets/Sprites/Items/Monos/SuperShroom.bmp',
+                                              'Assets/Music/bonus.ogg')
+
     def __init__(self) -> None:
-        shroom_path: str = 'Assets/Sprites/Items/Monos/SuperShroom.bmp'
-        sound_path: str = 'Assets/Music/bonus.ogg'
-        self.__shroom_image = pg.image.load(shroom_path).convert()
-        self.__shroom_sizes: tuple[float, float] = SIZE, SIZE
-        self.__shroom_speed: tuple[float, float] = SIZE * .05
-        self.__shroom_mass: float = SIZE * .2
-        self.__sound = pg.mixer.Sound(sound_path)
+        size: float = Sizes().size
+        shroom_path, sound_path = self.assets
+        self.__shroom_sizes: tuple[float, float] = size, size
+        self.__shroom_image = ASSETS.surface(shroom_path, self.__shroom_sizes)
+        self.__shroom_speed: tuple[float, float] = size * .05
+        self.__shroom_mass: float = size * .2
+        self.__sound = ASSETS.sound(sound_path)
 
     def spawn(self, pos: tuple[float, float]) -> SuperShroom:
-        return SuperShroom(self.__shroom_image, self.__sound, SIZE * .15,
+        return SuperShroom(self.__shroom_image, self.__sound, self.__shroom_sizes[0] * .15,
                            self.__shroom_sizes, self.__shroom_speed, self.__shroom_mass, pos)
 
     @property
@@ -146,14 +166,17 @@ class SpawnerSuperShroom(Spawner):
        
 
 class SpawnerMarioBlock(Spawner):
+    assets: tuple[str, ...] = ASSETS.register('Assets/Sprites/Blocks/Monos/Bricks.bmp',
+                                              'Assets/Music/brick.ogg',
+                                              'Assets/Music/breakblock.ogg')
+
     def __init__(self) -> None:
-        self.__block_sizes: tuple[float, float] = SIZE, SIZE
-        block_path: str = 'Assets/Sprites/Blocks/Monos/Bricks.bmp'
-        self.block_img = pg.image.load(block_path).convert()
-        brick_snd_path: str = 'Assets/Music/brick.ogg'
-        self.__brick_sound = pg.mixer.Sound(brick_snd_path)
-        break_snd_path: str = 'Assets/Music/breakblock.ogg'
-        self.__break_sound = pg.mixer.Sound(break_snd_path)
+        size: float = Sizes().size
+        self.__block_sizes: tuple[float, float] = size, size
+        block_path, brick_snd_path, break_snd_path = self.assets
+        self.block_img = ASSETS.surface(block_path, self.__block_sizes)
+        self.__brick_sound = ASSETS.sound(brick_snd_path)
+        self.__break_sound = ASSETS.sound(break_snd_path)
     
     def spawn(self, pos: tuple[float, float]) -> MarioBlock:
         return MarioBlock(self.block_img, self.__brick_sound, self.__break_sound, self.__block_sizes, pos)
@@ -167,14 +190,17 @@ class SpawnerMarioBlock(Spawner):
 
 
 class SpawnerPlatform(Spawner):
+    assets: tuple[str, ...] = ASSETS.register('Assets/Sprites/Blocks/Monos/Platform.bmp',
+                                              'Assets/Music/brick.ogg',
+                                              'Assets/Music/breakblock.ogg')
+
     def __init__(self) -> None:
-        img_path: str = 'Assets/Sprites/Blocks/Monos/Platform.bmp'
-        brick_snd_path: str = 'Assets/Music/brick.ogg'
-        break_snd_path: str = 'Assets/Music/breakblock.ogg'
-        self._sizes: tuple[float, float] = SIZE * 3, SIZE
-        self._image = pg.image.load(img_path).convert()
-        self._brick_sound = pg.mixer.Sound(brick_snd_path)
-        self._break_sound = pg.mixer.Sound(break_snd_path)
+        size: float = Sizes().size
+        img_path, brick_snd_path, break_snd_path = self.assets
+        self._sizes: tuple[float, float] = size * 3, size
+        self._image = ASSETS.surface(img_path, self._sizes)
+        self._brick_sound = ASSETS.sound(brick_snd_path)
+        self._break_sound = ASSETS.sound(break_snd_path)
 
     def spawn(self, pos: tuple[float, float]) -> MarioBlock:
         return MarioBlock(self._image, self._brick_sound, self._break_sound, self._sizes, pos, destructible=False, phys=False)
@@ -190,9 +216,10 @@ class SpawnerPlatform(Spawner):
 class SpawnerParabolaPlatform(SpawnerPlatform):
     """Give argument fly_angle in degrees"""
     def __init__(self, fly_angle: float, right: bool = True, down: bool = True) -> None:
+        size: float = Sizes().size
         super().__init__()
-        self._speed: float = SIZE * .15
-        self._max_speed: float = SIZE * .6
+        self._speed: float = size * .15
+        self._max_speed: float = size * .6
         self._fly_angle: float = fly_angle
         self._right: bool = right
         self._down: bool = down
@@ -213,9 +240,10 @@ class SpawnerParabolaPlatform(SpawnerPlatform):
 class SpawnerBoatPlatform(SpawnerPlatform):
     """Length is the length of movement"""
     def __init__(self, length: float) -> None:
+        size: float = Sizes().size
         super().__init__()
-        self._speed: float = SIZE * .05
-        self._max_speed: float = SIZE * .2
+        self._speed: float = size * .05
+        self._max_speed: float = size * .2
         self._length = length
 
     def spawn(self, pos: tuple[float, float]) -> BoatPlatform:
@@ -268,16 +296,18 @@ class SpawnerRotatingPlatform(SpawnerPlatform):
     
 
 class SpawnerCoin(Spawner):
+    assets: tuple[str, ...] = ASSETS.register(*(f'Assets/Sprites/Items/Polys/Coin/{i}.bmp' for i in range(3)),
+                                              'Assets/Music/coin.ogg')
+
     def __init__(self) -> None:
-        self.__coin_sizes: tuple[float, float] = SIZE, SIZE
-        com_path: str = 'Assets/Sprites/Items/Polys/Coin/'
+        size: float = Sizes().size
+        self.__coin_sizes: tuple[float, float] = size, size
+        *img_paths, coin_snd_path = self.assets
         self.__coin_imgs = []
-        for i in range(3):
-            path: str = f'{com_path}{i}.bmp'
-            image = pg.image.load(path).convert()
+        for path in img_paths:
+            image = ASSETS.surface(path, self.__coin_sizes)
             self.__coin_imgs.append(image)
-        coin_snd_path: str = 'Assets/Music/coin.ogg'
-        self.__sound = pg.mixer.Sound(coin_snd_path)
+        self.__sound = ASSETS.sound(coin_snd_path)
 
     def spawn(self, pos: tuple[float, float]) -> Coin:
         return Coin(self.__coin_imgs, self.__sound, self.__coin_sizes, pos)
@@ -291,16 +321,18 @@ class SpawnerCoin(Spawner):
 
 
 class SpawnerFireFlower(Spawner):
+    assets: tuple[str, ...] = ASSETS.register(*(f'Assets/Sprites/Items/Polys/FireFlower/{i}.bmp' for i in range(4)),
+                                              'Assets/Music/bonus.ogg')
+
     def __init__(self) -> None:
-        self.__sizes: tuple[float, float] = SIZE, SIZE
-        com_path: str = 'Assets/Sprites/Items/Polys/FireFlower/'
+        size: float = Sizes().size
+        self.__sizes: tuple[float, float] = size, size
+        *img_paths, sound_path = self.assets
         self.__images = []
-        for i in range(4):
-            path: str = f'{com_path}{i}.bmp'
-            image = pg.image.load(path).convert()
+        for path in img_paths:
+            image = ASSETS.surface(path, self.__sizes)
             self.__images.append(image)
-        sound_path: str = 'Assets/Music/bonus.ogg'
-        self.__sound = pg.mixer.Sound(sound_path)
+        self.__sound = ASSETS.sound(sound_path)
 
     def spawn(self, pos: tuple[float, float]) -> FireFlower:
         return FireFlower(self.__images, self.__sound, self.__sizes, pos)
@@ -0,0 +1,378 @@
+from engine.constants import DRAW_BOUNDS, UPDATE_BOUNDS
+from engine.enumerations import EntityName
+from engine.collection import MarioBlocks
+from engine.tools import VIEW
+from typing import Any
+import pygame as pg
+import numpy as np
+
+
+FIELDS: dict[str, type] = {'x': np.int64, 'y': np.int64, 'w': np.int64, 'h': np.int64,
+                           'image': np.int32, 'sound': np.int32, 'destroyed': bool,
+                           'destructible': bool, 'physical': bool, 'static': bool, 'right': bool,
+                           'layered': bool, 'in_update': bool, 'in_draw': bool, 'played': bool}
+
+
+class BlockStore(MarioBlocks):
+    """MarioBlocks kept as columns of NumPy arrays instead of sprites: positions, sizes, image and
+    sound ids, and the flags of MonoBlock and MarioBlock. Updates, bound checks, shifts and
+    collision queries run over whole columns. An appended block is copied into the columns, and
+    the collection hands out StoredBlock proxies for the per-block code (collision responses,
+    interactions, bullets). A proxy is made once per block and kept; when a block is deleted the
+    proxies of the blocks after it are renumbered and its own proxy is detached. With use_grid the
+    collision queries go through the blocks sorted by x, sorted again after the blocks move, instead
+    of a mask over every block. The update and draw checks are masks over whole columns, so there is
+    no activation index to keep"""
+    def __init__(self, use_grid: bool = True, capacity: int = 64) -> None:
+        super().__init__()
+        self.use_index: bool = use_grid
+        self.__order: np.ndarray | None = None
+        self.__sorted_x: np.ndarray | None = None
+        self.__widest: int = 0
+        self.__count: int = 0
+        self.__columns: dict[str, np.ndarray] = {name: np.zeros(capacity, kind) for name, kind in FIELDS.items()}
+        self.__images: list[pg.surface.Surface] = []
+        self.__sounds: list[tuple] = []
+        self.__proxies: dict[int, StoredBlock] = {}
+        self.layer = None
+
+    def append(self, item: Any) -> None:
+        if self.__count == len(self.__columns['x']):
+            self.grow()
+        self.__count += 1
+        self.write(self.__count - 1, item)
+
+    def write(self, index: int, item: Any) -> None:
+        """Copies a MarioBlock into the row"""
+        row: dict[str, Any] = {'x': item.rect.left, 'y': item.rect.top, 'w': item.rect.width,
+                               'h': item.rect.height, 'image': self.image_id(item.image),
+                               'sound': self.sound_id(item.sound_clsn, item.sound_broken.sound),
+                               'destroyed': item.destroyed, 'destructible': item.destructible,
+                               'physical': item.physical, 'static': item.static, 'right': item.right,
+                               'layered': item.layer is not None, 'in_update': item.updatable.in_bound,
+                               'in_draw': item.drawable.in_bound, 'played': item.sound_broken.played}
+        for name, value in row.items():
+            self.__columns[name][index] = value
+        self.unsort()
+        if item.layer is not None:
+            self.layer = item.layer
+
+    def grow(self) -> None:
+        for name, column in self.__columns.items():
+            self.__columns[name] = np.concatenate((column, np.zeros(max(len(column), 1), column.dtype)))
+
+    def image_id(self, image) -> int:
+        for index, known in enumerate(self.__images):
+            if known is image:
+                return index
+        self.__images.append(image)
+        return len(self.__images) - 1
+
+    def sound_id(self, brick_sound, breakblock_sound) -> int:
+        for index, (known_brick, known_break) in enumerate(self.__sounds):
+            if (known_brick is brick_sound) and (known_break is breakblock_sound):
+                return index
+        self.__sounds.append((brick_sound, breakblock_sound))
+        return len(self.__sounds) - 1
+
+    def column(self, name: str) -> np.ndarray:
+        """A view of the filled part of the column"""
+        return self.__columns[name][:self.__count]
+
+    def proxy(self, index: int) -> 'StoredBlock':
+        block: StoredBlock | None = self.__proxies.get(index)
+        if block is None:
+            block = StoredBlock(self, index)
+            self.__proxies[index] = block
+        return block
+
+    def delete_item(self, index: int) -> None:
+        if index < 0:
+            index += self.__count
+        for name, column in self.__columns.items():
+            column[index:self.__count - 1] = column[index + 1:self.__count]
+        self.__count -= 1
+        proxies: dict[int, StoredBlock] = {}
+        for old, block in self.__proxies.items():
+            if old == index:
+                block.index = None
+            else:
+                block.index = old if old < index else old - 1
+                proxies[block.index] = block
+        self.__proxies = proxies
+        self.unsort()
+
+    def clear(self) -> None:
+        super().clear()
+        self.__count = 0
+        for block in self.__proxies.values():
+            block.index = None
+        self.__proxies = {}
+        self.unsort()
+
+    def unsort(self) -> None:
+        """Drops the x order of the queries after the blocks were moved, added or deleted"""
+        self.__order = None
+
+    def get_index_of(self, item: Any) -> int:
+        return item.index
+
+    @property
+    def tar(self) -> list[Any]:
+        return [self.proxy(index) for index in range(self.__count)]
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError(index)
+        return self.proxy(index)
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        self.write(index, item)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def screen_pos(self) -> tuple[np.ndarray, np.ndarray]:
+        """Static blocks are in screen space, as Sprite.screen_pos"""
+        x: np.ndarray = self.column('x').astype(float)
+        y: np.ndarray = self.column('y').astype(float)
+        if VIEW.active:
+            moving: np.ndarray = ~self.column('static')
+            x[moving] += VIEW.x
+            y[moving] += VIEW.y
+        return x, y
+
+    @staticmethod
+    def in_bounds(x: np.ndarray, y: np.ndarray, bounds) -> np.ndarray:
+        bound_x: tuple[float, float] = bounds.bound_x
+        bound_y: tuple[float, float] = bounds.bound_y
+        return (x >= bound_x[0]) & (x <= bound_x[1]) & (y >= bound_y[0]) & (y <= bound_y[1])
+
+    def updates(self) -> None:
+        """MonoBlock.update for every block at once"""
+        x, y = self.screen_pos()
+        in_update: np.ndarray = self.in_bounds(x, y, UPDATE_BOUNDS)
+        self.column('in_update')[:] = in_update
+        destroyed: np.ndarray = self.column('destroyed')
+        destroyed[~self.column('destructible')] = False
+        self.column('static')[destroyed] = True
+        main: np.ndarray = in_update & ~destroyed
+        self.column('in_draw')[main] = self.in_bounds(x[main], y[main], DRAW_BOUNDS)
+
+    def drawn(self) -> np.ndarray:
+        """Indices of the blocks drawn by the store, not by a chunk layer"""
+        mask: np.ndarray = self.column('in_draw') & ~self.column('destroyed') & ~self.column('layered')
+        return np.flatnonzero(mask)
+
+    def draws(self, wnd) -> None:
+        indices: np.ndarray = self.drawn()
+        if not len(indices):
+            return
+        x, y = self.screen_pos()
+        images: list = self.__images
+        image_ids: list[int] = self.column('image')[indices].tolist()
+        positions = zip(x[indices].tolist(), y[indices].tolist())
+        wnd.blits([(images[image_id], pos) for image_id, pos in zip(image_ids, positions)], doreturn=False)
+
+    def visible(self) -> list[Any]:
+        return [self.proxy(index) for index in self.drawn().tolist()]
+
+    def active(self) -> list[Any]:
+        return [self.proxy(index) for index in np.flatnonzero(self.column('in_update')).tolist()]
+
+    def shifts(self, dx: float = 0, dy: float = 0) -> None:
+        """Destroyed and static blocks stay, the others move by whole pixels as their rects did"""
+        if not (int(dx) or int(dy)):
+            return
+        moving: np.ndarray = ~self.column('destroyed') & ~self.column('static')
+        self.column('x')[moving] += int(dx)
+        self.column('y')[moving] += int(dy)
+        self.unsort()
+
+    def do_stuff(self, wnd, dx: float = 0, dy: float = 0) -> None:
+        self.updates()
+        self.draws(wnd)
+        self.shifts(dx, dy)
+
+    def query(self, area: pg.Rect) -> np.ndarray:
+        """Indices of the blocks overlapping the area, in the order of the collection"""
+        if not self.use_index:
+            return np.flatnonzero(self.overlaps(np.arange(self.__count), area))
+        if self.__order is None:
+            self.sort()
+        first: int = int(np.searchsorted(self.__sorted_x, area.left - self.__widest, 'right'))
+        last: int = int(np.searchsorted(self.__sorted_x, area.right, 'left'))
+        candidates: np.ndarray = self.__order[first:last]
+        return np.sort(candidates[self.overlaps(candidates, area)])
+
+    def overlaps(self, indices: np.ndarray, area: pg.Rect) -> np.ndarray:
+        x: np.ndarray = self.column('x')[indices]
+        y: np.ndarray = self.column('y')[indices]
+        return ((x < area.right) & (x + self.column('w')[indices] > area.left) &
+                (y < area.bottom) & (y + self.column('h')[indices] > area.top))
+
+    def sort(self) -> None:
+        x: np.ndarray = self.column('x')
+        self.__order = np.argsort(x, kind='stable')
+        self.__sorted_x = x[self.__order]
+        self.__widest = int(self.column('w').max(initial=0))
+
+    def nearby(self, sprite, margin: tuple[float, float] = (0, 0)):
+        """Blocks that can touch the sprite, as SolidBlocks.nearby"""
+        area: pg.Rect = sprite.rect.inflate(margin[0] * 2, margin[1] * 2)
+        last: int = -1
+        while True:
+            indices: list[int] = [index for index in self.query(area).tolist() if index > last]
+            moved: bool = False
+            for index in indices:
+                last = index
+                yield self.proxy(index)
+                current: pg.Rect = sprite.rect.inflate(margin[0] * 2, margin[1] * 2)
+                if current != area:
+                    area = current
+                    moved = True
+                    break
+            if not moved:
+                return
+
+    def destroy(self, index: int, value: bool) -> None:
+        """The setter of MarioBlock.destroyed"""
+        destroyed: np.ndarray = self.column('destroyed')
+        if value and not destroyed[index]:
+            if self.column('layered')[index] and self.column('destructible')[index] and (self.layer is not None):
+                self.layer.erase((int(self.column('x')[index]), int(self.column('y')[index])))
+        destroyed[index] = value
+
+    def image(self, index: int) -> pg.surface.Surface:
+        return self.__images[int(self.column('image')[index])]
+
+    def sounds(self, index: int) -> tuple:
+        return self.__sounds[int(self.column('sound')[index])]
+
+    def __del__(self) -> None:
+        pass
+
+
+class StoredSound:
+    """The break sound of a stored block, played once as by Soundman"""
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store: BlockStore, index: int) -> None:
+        self.store: BlockStore = store
+        self.index: int = index
+
+    def play(self) -> None:
+        played: np.ndarray = self.store.column('played')
+        if not played[self.index]:
+            self.store.sounds(self.index)[1].play()
+            played[self.index] = True
+
+
+class StoredBlock:
+    """A thin proxy of a block in a BlockStore. It reads and writes the row of the block and has the
+    part of the MarioBlock interface used by collisions and interactions"""
+    __slots__ = ('store', 'index')
+    batched_draw: bool = True
+
+    def __init__(self, store: BlockStore, index: int) -> None:
+        self.store: BlockStore = store
+        self.index: int | None = index
+
+    def get(self, name: str) -> Any:
+        if self.index is None:
+            raise IndexError('The block was deleted from its store')
+        return self.store.column(name)[self.index].item()
+
+    def set(self, name: str, value: Any) -> None:
+        if self.index is None:
+            raise IndexError('The block was deleted from its store')
+        self.store.column(name)[self.index] = value
+
+    def interact(self, target) -> None:
+        check_active: bool = target.rect.colliderect(self.rect) and self.get('in_update')
+        if check_active and not self.destroyed:
+            self.interact_options(target)
+
+    def interact_options(self, target) -> None:
+        if (hasattr(target, 'big') and target.big) and self.destructible:
+            self.sound_broken.play()
+            self.destroyed = True
+        else:
+            self.sound_clsn.play()
+
+    def blit_args(self) -> tuple | None:
+        if self.get('in_draw') and not self.destroyed and not self.get('layered'):
+            return self.image, self.screen_pos()
+        return None
+
+    def draw(self, wnd) -> None:
+        args: tuple | None = self.blit_args()
+        if args is not None:
+            wnd.blit(*args)
+
+    def screen_pos(self) -> tuple[float, float]:
+        return VIEW.to_screen(self.pos, self.static)
+
+    @property
+    def rect(self) -> pg.Rect:
+        return pg.Rect(self.get('x'), self.get('y'), self.get('w'), self.get('h'))
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        return self.get('x'), self.get('y')
+
+    @pos.setter
+    def pos(self, new: tuple[float, float]) -> None:
+        self.set('x', int(new[0]))
+        self.set('y', int(new[1]))
+        self.store.unsort()
+
+    @property
+    def sizes(self) -> tuple[float, float]:
+        return self.get('w'), self.get('h')
+
+    @property
+    def image(self) -> pg.surface.Surface:
+        return self.store.image(self.index)
+
+    @property
+    def destroyed(self) -> bool:
+        return self.get('destroyed')
+
+    @destroyed.setter
+    def destroyed(self, value: bool) -> None:
+        self.store.destroy(self.index, value)
+
+    @property
+    def destructible(self) -> bool:
+        return self.get('destructible')
+
+    @property
+    def physical(self) -> bool:
+        return self.get('physical')
+
+    @property
+    def static(self) -> bool:
+        return self.get('static')
+
+    @static.setter
+    def static(self, value: bool) -> None:
+        self.set('static', value)
+
+    @property
+    def right(self) -> bool:
+        return self.get('right')
+
+    @property
+    def sound_clsn(self):
+        return self.store.sounds(self.index)[0]
+
+    @property
+    def sound_broken(self) -> StoredSound:
+        return StoredSound(self.store, self.index)
+
+    @property
+    def name(self) -> int:
+        return EntityName.other
@@ -0,0 +1,124 @@
+from engine.tilemap import TileCompiler
+from engine.constants import Sizes
+from collections import OrderedDict
+from engine.tools import VIEW
+from math import floor
+import pygame as pg
+
+
+class LevelStreamer:
+    """Fills a level chunk by chunk instead of all at once. A chunk is a square of chunk tiles; its
+    solid tiles become colliders and its other symbols become entities through the spawners of the
+    level when it comes within margin chunks of the screen or of a player. Chunks out of range are
+    kept until there are more than max_chunks of them, then the least recently needed are evicted.
+    An evicted brick or coin that was destroyed, and a surprise block that was unleashed, stay so
+    when their chunk is loaded again"""
+    def __init__(self, level,
+                 chunk: int = 16,
+                 margin: int = 1,
+                 max_chunks: int = 48,
+                 size: float | None = None) -> None:
+        if size is None:
+            size = Sizes().size
+        self.level = level
+        self.chunk: int = chunk
+        self.margin: int = margin
+        self.max_chunks: int = max_chunks
+        self.__size: float = size
+        self.__chunk_px: float = chunk * size
+        self.__compiler: TileCompiler = TileCompiler('B', size)
+        cols, rows = level.layer.sizes
+        self.__chunk_cols: int = -(-round(cols / size) // chunk)
+        self.__chunk_rows: int = -(-round(rows / size) // chunk)
+        self.__loaded: OrderedDict[tuple[int, int], list[tuple]] = OrderedDict()
+        self.gone: set[tuple[int, int]] = set()
+        self.unleashed: set[tuple[int, int]] = set()
+        self.loads: int = 0
+        self.evictions: int = 0
+
+    def update(self) -> None:
+        """Loads the chunks in range and evicts the oldest of the others"""
+        needed: list[tuple[int, int]] = self.needed()
+        for key in needed:
+            if key in self.__loaded:
+                self.__loaded.move_to_end(key)
+            else:
+                self.load(key)
+        wanted: set[tuple[int, int]] = set(needed)
+        for key in list(self.__loaded):
+            if len(self.__loaded) <= self.max_chunks:
+                break
+            if key not in wanted:
+                self.evict(key)
+
+    def needed(self) -> list[tuple[int, int]]:
+        """Chunks near the screen and the players, in rows"""
+        wnd_w, wnd_h = Sizes().wnd_size
+        areas: list[pg.Rect] = [pg.Rect(VIEW.to_world((0, 0)), (wnd_w, wnd_h))]
+        areas.extend(player.rect for player in self.level.players)
+        keys: set[tuple[int, int]] = set()
+        for area in areas:
+            x1, y1, x2, y2 = self.span(area)
+            keys.update((cx, cy) for cy in range(y1, y2 + 1) for cx in range(x1, x2 + 1))
+        return sorted(keys, key=lambda key: (key[1], key[0]))
+
+    def span(self, area: pg.Rect) -> tuple[int, int, int, int]:
+        origin: tuple[float, float] = self.level.layer.origin
+        x1: int = floor((area.left - origin[0]) / self.__chunk_px) - self.margin
+        y1: int = floor((area.top - origin[1]) / self.__chunk_px) - self.margin
+        x2: int = floor((area.right - origin[0]) / self.__chunk_px) + self.margin
+        y2: int = floor((area.bottom - origin[1]) / self.__chunk_px) + self.margin
+        return (max(x1, 0), max(y1, 0),
+                min(x2, self.__chunk_cols - 1), min(y2, self.__chunk_rows - 1))
+
+    def load(self, key: tuple[int, int]) -> None:
+        cx, cy = key
+        col1: int = cx * self.chunk
+        row1: int = cy * self.chunk
+        tilemap = self.level.tilemap
+        rows: list[str] = [tilemap[row][col1:col1 + self.chunk]
+                           for row in range(row1, min(row1 + self.chunk, len(tilemap)))]
+        origin: tuple[float, float] = self.level.layer.origin
+        entries: list[tuple] = []
+        chunk_origin: tuple[float, float] = origin[0] + col1 * self.__size, origin[1] + row1 * self.__size
+        for collider in self.__compiler.compile(rows, chunk_origin):
+            self.level.solid_blocks.append(collider)
+            entries.append((self.level.solid_blocks, collider, None))
+        for row_index, row in enumerate(rows):
+            for col_index, symbol in enumerate(row):
+                tile: tuple[int, int] = col1 + col_index, row1 + row_index
+                if (symbol not in self.level.tile_spawners) or (tile in self.gone):
+                    continue
+                pos: tuple[float, float] = origin[0] + tile[0] * self.__size, origin[1] + tile[1] * self.__size
+                collection, entity = self.level.add_tile(symbol, pos)
+                if tile in self.unleashed:
+                    entity.unleashed = True
+                entries.append((collection, entity, tile))
+        self.__loaded[key] = entries
+        self.loads += 1
+
+    def evict(self, key: tuple[int, int]) -> None:
+        for collection, entity, tile in self.__loaded.pop(key):
+            if tile is not None:
+                self.keep_state(entity, tile)
+            collection.delete_item(collection.get_index_of(entity))
+        self.evictions += 1
+
+    def keep_state(self, entity, tile: tuple[int, int]) -> None:
+        if entity.destroyed:
+            self.gone.add(tile)
+        elif getattr(entity, 'unleashed', False):
+            self.unleashed.add(tile)
+
+    def clear(self) -> None:
+        for key in list(self.__loaded):
+            self.evict(key)
+        self.gone = set()
+        self.unleashed = set()
+
+    @property
+    def loaded(self) -> int:
+        return len(self.__loaded)
+
+    def __del__(self) -> None:
+        pass
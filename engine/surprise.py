@@ -1,13 +1,10 @@
 from engine.spawner import SpawnerLifeShroom, SpawnerSuperShroom, SpawnerCoin, SpawnerFireFlower
 from engine.interfaces import Spawner
+from engine.assets import ASSETS
 from engine.block import MarioBlock
 from engine.constants import Sizes
 from engine.picture import Cover
 from random import randint
-import pygame as pg
-
-
-SIZE: float = Sizes().size
 
 
 class SurpriseBlock(MarioBlock):
@@ -68,16 +65,19 @@ class SurpriseBlock(MarioBlock):
 
 
 class SpawnerSurpriseBlock(Spawner):
+    assets: tuple[str, ...] = ASSETS.register('Assets/Sprites/Blocks/Polys/SurpriseBlock/0.bmp',
+                                              'Assets/Sprites/Blocks/Polys/SurpriseBlock/1.bmp',
+                                              'Assets/Music/brick.ogg',
+                                              'Assets/Music/breakblock.ogg')
+
     def __init__(self) -> None:
-        image_path: str = 'Assets/Sprites/Blocks/Polys/SurpriseBlock/0.bmp'
-        image2_path: str = 'Assets/Sprites/Blocks/Polys/SurpriseBlock/1.bmp'
-        brick_snd_path: str = 'Assets/Music/brick.ogg'
-        break_snd_path: str = 'Assets/Music/breakblock.ogg'
-        self.__image = pg.image.load(image_path).convert()
-        self.__image2 = pg.image.load(image2_path).convert()
-        self.__brick_sound = pg.mixer.Sound(brick_snd_path)
-        self.__break_sound = pg.mixer.Sound(break_snd_path)
-        self.__sizes: tuple[float, float] = SIZE, SIZE
+        size: float = Sizes().size
+        image_path, image2_path, brick_snd_path, break_snd_path = self.assets
+        self.__sizes: tuple[float, float] = size, size
+        self.__image = ASSETS.surface(image_path, self.__sizes)
+        self.__image2 = ASSETS.surface(image2_path, self.__sizes)
+        self.__brick_sound = ASSETS.sound(brick_snd_path)
+        self.__break_sound = ASSETS.sound(break_snd_path)
 
     def spawn(self, pos) -> SurpriseBlock:
         return SurpriseBlock(self.__image, self.__image2, self.__brick_sound, self.__break_sound, self.__sizes, pos)
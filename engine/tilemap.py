@@ -0,0 +1,209 @@
+from engine.interfaces import GhostSprite
+from engine.enumerations import EntityName
+from engine.constants import Sizes
+from typing import Iterator
+from math import floor, inf
+import pygame as pg
+
+
+class Collider(GhostSprite):
+    """A lightweight solid rectangle for the SolidBlocks collection. It is never drawn and can not
+    be destroyed. A merged collider answers collisions with the tile touched by the sprite, so the
+    collision response is the same as for separate blocks"""
+    def __init__(self, rect, tile: float) -> None:
+        self.rect = pg.Rect(rect)
+        self.tile: float = tile
+        self.destructible: bool = False
+        self.physical: bool = True
+        self.static: bool = False
+        self.right: bool = True
+        self._name: int = EntityName.other
+
+    def draw(self, wnd) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        self.rect.move_ip(dx, dy)
+
+    def interact(self, target, collection=None) -> None:
+        pass
+
+    def piece(self, rect) -> 'Collider':
+        """The tile of the collider nearest to the center of the rectangle"""
+        cols: int = max(round(self.rect.width / self.tile), 1)
+        rows: int = max(round(self.rect.height / self.tile), 1)
+        col: int = floor((rect.centerx - self.rect.left) / self.tile)
+        row: int = floor((rect.centery - self.rect.top) / self.tile)
+        col = min(max(col, 0), cols - 1)
+        row = min(max(row, 0), rows - 1)
+        left: int = self.rect.left + round(col * self.tile)
+        top: int = self.rect.top + round(row * self.tile)
+        width: int = self.rect.left + round((col + 1) * self.tile) - left
+        height: int = self.rect.top + round((row + 1) * self.tile) - top
+        return Collider((left, top, width, height), self.tile)
+
+    @property
+    def destroyed(self) -> bool:
+        return False
+
+    @destroyed.setter
+    def destroyed(self, value: bool) -> None:
+        pass
+
+    @property
+    def name(self) -> int:
+        return self._name
+
+    @property
+    def sizes(self) -> tuple[float, float]:
+        return self.rect.width, self.rect.height
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        return self.rect.left, self.rect.top
+
+    def __del__(self) -> None:
+        pass
+
+
+class TileCompiler:
+    """Turns a tilemap (a tuple of strings) into a small set of colliders. Runs of solid symbols in
+    a row are merged first, then equal runs of the following rows are merged into one rectangle"""
+    def __init__(self, symbols: str = 'B', size: float | None = None) -> None:
+        if size is None:
+            size = Sizes().size
+        self.symbols: str = symbols
+        self.size: float = size
+
+    def runs(self, row: str) -> list[tuple[int, int]]:
+        """Start and end (exclusive) columns of the solid runs"""
+        runs: list[tuple[int, int]] = []
+        start: int = -1
+        for col, symbol in enumerate(row):
+            if symbol in self.symbols:
+                if start < 0:
+                    start = col
+            elif start >= 0:
+                runs.append((start, col))
+                start = -1
+        if start >= 0:
+            runs.append((start, len(row)))
+        return runs
+
+    def merge(self, tilemap) -> list[tuple[int, int, int, int]]:
+        """Rectangles in tiles: column, row, width and height"""
+        rects: list[tuple[int, int, int, int]] = []
+        opened: dict[tuple[int, int], list[int]] = {}
+        for row_index, row in enumerate(tilemap):
+            current: dict[tuple[int, int], list[int]] = {}
+            for run in self.runs(row):
+                if run in opened:
+                    rect: list[int] = opened.pop(run)
+                    rect[3] += 1
+                else:
+                    rect: list[int] = [run[0], row_index, run[1] - run[0], 1]
+                current[run] = rect
+            rects.extend(tuple(rect) for rect in opened.values())
+            opened = current
+        rects.extend(tuple(rect) for rect in opened.values())
+        rects.sort(key=lambda rect: (rect[1], rect[0]))
+        return rects
+
+    def compile(self, tilemap, origin: tuple[float, float] = (0, 0)) -> list[Collider]:
+        """Colliders in pixels. The origin is the position of the top left tile"""
+        colliders: list[Collider] = []
+        for col, row, width, height in self.merge(tilemap):
+            left: int = round(origin[0] + col * self.size)
+            top: int = round(origin[1] + row * self.size)
+            right: int = round(origin[0] + (col + width) * self.size)
+            bottom: int = round(origin[1] + (row + height) * self.size)
+            colliders.append(Collider((left, top, right - left, bottom - top), self.size))
+        return colliders
+
+    def feed(self, tilemap, solid_blocks, origin: tuple[float, float] = (0, 0)) -> None:
+        """Adds the colliders to a SolidBlocks collection"""
+        solid_blocks.extend(self.compile(tilemap, origin))
+
+    def __del__(self) -> None:
+        pass
+
+
+class TileRaycaster:
+    """Swept queries against the solid tiles of a tilemap. A segment is walked cell by cell in the
+    order it crosses them (the traversal of Amanatides and Woo), so a query visits only the cells on
+    the path and finds the first solid one however long the step is. The origin follows the shifts
+    of the world, as the one of the chunk layer, and a cell is cleared when its block is destroyed"""
+    def __init__(self, tilemap, symbols: str = 'B', size: float | None = None) -> None:
+        if size is None:
+            size = Sizes().size
+        self.size: float = size
+        if hasattr(tilemap, 'mask'):
+            self.__solid = tilemap.mask(symbols)
+        else:
+            self.__solid = [bytearray(symbol in symbols for symbol in row) for row in tilemap]
+        self.__rows: int = len(self.__solid)
+        self.origin: tuple[float, float] = 0, 0
+
+    def cell(self, pos: tuple[float, float]) -> tuple[int, int]:
+        return floor((pos[0] - self.origin[0]) / self.size), floor((pos[1] - self.origin[1]) / self.size)
+
+    def solid(self, col: int, row: int) -> bool:
+        if (0 <= row < self.__rows) and (0 <= col < len(self.__solid[row])):
+            return bool(self.__solid[row][col])
+        return False
+
+    def clear(self, col: int, row: int) -> None:
+        """The cell is no longer solid, called by the chunk layer for an erased tile"""
+        if (0 <= row < self.__rows) and (0 <= col < len(self.__solid[row])):
+            self.__solid[row][col] = 0
+
+    def traverse(self, start: tuple[float, float], end: tuple[float, float]) -> Iterator[tuple[int, int, float]]:
+        """Cells crossed by the segment with the share of the segment at which it enters them"""
+        x0: float = (start[0] - self.origin[0]) / self.size
+        y0: float = (start[1] - self.origin[1]) / self.size
+        dx: float = (end[0] - start[0]) / self.size
+        dy: float = (end[1] - start[1]) / self.size
+        col: int = floor(x0)
+        row: int = floor(y0)
+        end_col: int = floor(x0 + dx)
+        end_row: int = floor(y0 + dy)
+        step_col: int = 1 if dx > 0 else -1
+        step_row: int = 1 if dy > 0 else -1
+        delta_x: float = abs(1 / dx) if dx else inf
+        delta_y: float = abs(1 / dy) if dy else inf
+        next_x: float = ((col + 1 - x0) if dx > 0 else (x0 - col)) * delta_x if dx else inf
+        next_y: float = ((row + 1 - y0) if dy > 0 else (y0 - row)) * delta_y if dy else inf
+        share: float = 0
+        yield col, row, share
+        while ((col, row) != (end_col, end_row)) and (share <= 1):
+            if next_x < next_y:
+                col += step_col
+                share = next_x
+                next_x += delta_x
+            else:
+                row += step_row
+                share = next_y
+                next_y += delta_y
+            if share <= 1:
+                yield col, row, share
+
+    def cast(self, start: tuple[float, float], end: tuple[float, float]) -> tuple[float, float] | None:
+        """The point where the segment enters the first solid cell, None if it hits nothing. A
+        segment inside one cell, the common short step, is answered without the traversal"""
+        col, row = self.cell(start)
+        if (col, row) == self.cell(end):
+            return start if self.solid(col, row) else None
+        for col, row, share in self.traverse(start, end):
+            if self.solid(col, row):
+                return start[0] + (end[0] - start[0]) * share, start[1] + (end[1] - start[1]) * share
+        return None
+
+    def shift(self, dx: float = 0, dy: float = 0) -> None:
+        """Rectangles move by whole pixels, so the origin does the same"""
+        self.origin = self.origin[0] + int(dx), self.origin[1] + int(dy)
+
+    def __del__(self) -> None:
+        pass
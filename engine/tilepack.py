@@ -0,0 +1,251 @@
+"""Packed tilemaps. A tilemap of the engine/tilemaps modules is stored as a small header, a table of
+its symbols and a grid of uint8 indexes into the table, one byte per tile. The grid is read through
+numpy.memmap, so opening a map reads only its header, and the rows become strings only when they are
+asked for. The header names the tilemap module of the map and keeps the hash of its file, so a map
+whose module has changed since it was packed is packed again on load, from that module alone and
+into the cache directory, so the files of the package are only written by the conversion. Convert
+the tilemap modules from the root of the repository:
+
+    python -m engine.tilepack
+    python -m engine.tilepack gym thousand
+"""
+from importlib import import_module
+from typing import Iterator
+from hashlib import sha1
+import numpy as np
+import argparse
+import warnings
+import struct
+import sys
+import os
+
+
+MAGIC: bytes = b'TMAP'
+VERSION: int = 2
+HEADER: struct.Struct = struct.Struct('<4sBHII16s20s')
+EXTENSION: str = '.tmap'
+TILEMAPS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tilemaps')
+PACKED_DIR: str = os.path.join(TILEMAPS_DIR, 'packed')
+CACHE_DIR: str = os.path.join('.cache', 'tilemaps')
+TILEMAP_MODULES: tuple[str, ...] = 'smalls', 'mids', 'bigs'
+
+
+class PackedTilemap:
+    """A read-only tilemap over a packed file. It is a sequence of row strings like the tuple maps,
+    so the level, the tile compiler and the chunk layer take it as it is. Short rows are padded with
+    spaces when packed, which every consumer treats as a missing tile. grid is the memory-mapped
+    array of symbol indexes for the code which works without strings"""
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as file:
+            header: bytes = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f'Not a packed tilemap: {path}')
+            magic, version, symbols, rows, cols, module, digest = HEADER.unpack(header)
+            if (magic != MAGIC) or (version != VERSION):
+                raise ValueError(f'Not a packed tilemap: {path}')
+            self.symbols: str = file.read(symbols).decode('ascii')
+        self.path: str = path
+        self.module: str = module.rstrip(b'\0').decode('ascii')
+        self.digest: bytes = digest
+        self.grid: np.ndarray = np.memmap(path, np.uint8, 'r', HEADER.size + symbols, (rows, cols))
+        self.__table: bytes = self.symbols.encode('ascii').ljust(256, b' ')
+        self.__rows: dict[int, str] = {}
+
+    def row(self, index: int) -> str:
+        """The row decoded from the grid, kept once decoded"""
+        row: str | None = self.__rows.get(index)
+        if row is None:
+            row = self.grid[index].tobytes().translate(self.__table).decode('ascii')
+            self.__rows[index] = row
+        return row
+
+    def mask(self, symbols: str) -> np.ndarray:
+        """Boolean grid of the tiles with one of the symbols"""
+        indexes: list[int] = [self.symbols.index(symbol) for symbol in symbols if symbol in self.symbols]
+        return np.isin(self.grid, indexes)
+
+    def cells(self, symbols: str) -> np.ndarray:
+        """Rows and columns of the tiles with one of the symbols"""
+        return np.argwhere(self.mask(symbols))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self.row(i) for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __len__(self) -> int:
+        return self.grid.shape[0]
+
+    @property
+    def sizes(self) -> tuple[int, int]:
+        """Columns and rows"""
+        return self.grid.shape[1], self.grid.shape[0]
+
+    def __del__(self) -> None:
+        pass
+
+
+def pack(tilemap, path: str, module: str = '', digest: bytes = bytes(20)) -> None:
+    """Writes a tuple map to a packed file. module and digest name its source"""
+    rows: int = len(tilemap)
+    cols: int = max((len(row) for row in tilemap), default=0)
+    symbols: str = ''.join(sorted(set(''.join(tilemap)) | {' '}))
+    if (len(symbols) > 256) or not symbols.isascii():
+        raise ValueError('A packed tilemap holds up to 256 ascii symbols')
+    lookup: bytes = bytes.maketrans(symbols.encode('ascii'), bytes(range(len(symbols))))
+    grid: np.ndarray = np.empty((rows, cols), np.uint8)
+    for index, row in enumerate(tilemap):
+        grid[index] = np.frombuffer(row.ljust(cols).encode('ascii').translate(lookup), np.uint8)
+    temporary: str = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(symbols), rows, cols, module.encode('ascii'), digest))
+        file.write(symbols.encode('ascii'))
+        file.write(grid.tobytes())
+    os.replace(temporary, path)
+
+
+def module_digest(module_name: str) -> bytes:
+    """Hash of the file of a tilemap module, read without importing it. Line ends do not count"""
+    with open(os.path.join(TILEMAPS_DIR, module_name + '.py'), 'rb') as file:
+        return sha1(file.read().replace(b'\r\n', b'\n')).digest()
+
+
+class TilemapLibrary:
+    """Tilemaps by name. A packed file of the name is opened on the first request and kept, a map
+    without one is looked up in the tilemap modules, so only the modules of such maps are imported.
+    A packed file of an older format or of a changed module is packed again into cache_directory,
+    whose files come before those of directory, or left for the module with a warning if it cannot
+    be written"""
+    def __init__(self, directory: str = PACKED_DIR,
+                 cache_directory: str = CACHE_DIR) -> None:
+        self.directory: str = directory
+        self.cache_directory: str = cache_directory
+        self.__maps: dict[str, PackedTilemap | tuple[str, ...]] = {}
+        self.__digests: dict[str, bytes] = {}
+
+    def get(self, name: str):
+        tilemap = self.__maps.get(name)
+        if tilemap is None:
+            tilemap = self.load(name)
+            self.__maps[name] = tilemap
+        return tilemap
+
+    def load(self, name: str):
+        """The fresh packed file of the cache or of the package, else the map packed again"""
+        stale: bool = False
+        module_name: str | None = None
+        for path in (self.cache_path(name), self.path(name)):
+            if not os.path.isfile(path):
+                continue
+            stale = True
+            try:
+                packed: PackedTilemap = PackedTilemap(path)
+            except ValueError:
+                continue
+            if (packed.module in TILEMAP_MODULES) and (packed.digest == self.digest(packed.module)):
+                return packed
+            module_name = module_name or packed.module
+            del packed
+        if not stale:
+            return self.source(name)
+        return self.repack(name, module_name)
+
+    def repack(self, name: str, module_name: str | None = None):
+        """Packs the map into the cache directory, reading only the module named in the header"""
+        module_name, tilemap = self.locate(name, module_name)
+        path: str = self.cache_path(name)
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            pack(tilemap, path, module_name, self.digest(module_name))
+        except OSError as error:
+            warnings.warn(f'The packed tilemap {name} is stale and can not be packed again: {error}')
+            return tilemap
+        return PackedTilemap(path)
+
+    def digest(self, module_name: str) -> bytes:
+        digest: bytes | None = self.__digests.get(module_name)
+        if digest is None:
+            digest = module_digest(module_name)
+            self.__digests[module_name] = digest
+        return digest
+
+    @staticmethod
+    def source(name: str) -> tuple[str, ...]:
+        """The tuple map of the tilemap modules"""
+        return TilemapLibrary.locate(name)[1]
+
+    @staticmethod
+    def locate(name: str, module_name: str | None = None) -> tuple[str, tuple[str, ...]]:
+        """The module of the map and the map. The named module is tried first, the others are
+        imported in turn only when it is unknown or lacks the map"""
+        names: tuple[str, ...] = TILEMAP_MODULES
+        if module_name in TILEMAP_MODULES:
+            names = (module_name,) + tuple(other for other in TILEMAP_MODULES if other != module_name)
+        for module_name in names:
+            module = import_module(f'engine.tilemaps.{module_name}')
+            if hasattr(module, name):
+                return module_name, getattr(module, name)
+        raise ValueError(f'Unknown tilemap: {name}')
+
+    @staticmethod
+    def sources() -> dict[str, tuple[str, tuple[str, ...]]]:
+        """Every tuple map of the tilemap modules, with the name of its module"""
+        maps: dict[str, tuple[str, tuple[str, ...]]] = {}
+        for module_name in TILEMAP_MODULES:
+            module = import_module(f'engine.tilemaps.{module_name}')
+            for name, value in vars(module).items():
+                if isinstance(value, tuple) and value and all(isinstance(row, str) for row in value):
+                    maps[name] = module_name, value
+        return maps
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name + EXTENSION)
+
+    def cache_path(self, name: str) -> str:
+        return os.path.join(self.cache_directory, name + EXTENSION)
+
+    def convert(self, names: list[str] | None = None) -> list[str]:
+        """Packs the tuple maps into the directory, all of them without names. Returns the written
+        paths"""
+        if names:
+            sources: dict[str, tuple[str, tuple[str, ...]]] = {name: self.locate(name) for name in names}
+        else:
+            sources: dict[str, tuple[str, tuple[str, ...]]] = self.sources()
+        os.makedirs(self.directory, exist_ok=True)
+        paths: list[str] = []
+        for name, (module_name, tilemap) in sources.items():
+            pack(tilemap, self.path(name), module_name, self.digest(module_name))
+            self.__maps.pop(name, None)
+            paths.append(self.path(name))
+        return paths
+
+    def clear(self) -> None:
+        self.__maps = {}
+        self.__digests = {}
+
+    def __del__(self) -> None:
+        pass
+
+
+TILEMAPS: TilemapLibrary = TilemapLibrary()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help='tilemaps to convert, all by default')
+    args = parser.parse_args(argv)
+    for path in TILEMAPS.convert(args.names):
+        print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
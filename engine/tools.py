@@ -1,3 +1,5 @@
+from engine.constants import FPSer
+from engine.atlas import FRAME_SETS
 from typing import Callable
 from functools import wraps
 from random import randint
@@ -17,8 +19,95 @@ def timer(func: Callable) -> Callable:
     return wrapper
 
 
+class Clock:
+    """The simulation clock shared by all timers. It is advanced once per frame by a fixed step of 
+    1 / fps seconds, so every entity reads the same time and a run does not depend on the machine 
+    or on the order of updates. The time is always a whole number of steps: until the first step 
+    the clock follows the real time by itself, the first step goes on from there. A game loop runs 
+    'for _ in range(CLOCK.tick()): CLOCK.step(); ...update...', a headless run resets the clock to 
+    zero and only steps"""
+    def __init__(self, fps: int | None = None) -> None:
+        if fps is None:
+            fps = FPSer().fps2
+        self.__fps: int = fps
+        self.__dt: float = 1 / fps
+        self.__frame: int = 0
+        self.__accumulator: float = 0
+        self.__start: float = tm.perf_counter()
+        self.__pacer = None
+        self.max_steps: int = 5
+        self.driven: bool = False
+    
+    def step(self) -> None:
+        if not self.driven:
+            self.follow()
+            self.driven = True
+        self.__frame += 1
+    
+    def follow(self) -> None:
+        """Moves the clock to the real time, in whole steps"""
+        frame: int = int((tm.perf_counter() - self.__start) / self.__dt)
+        if frame > self.__frame:
+            self.__frame = frame
+    
+    def tick(self) -> int:
+        """Waits for the next frame and returns the number of steps to catch up with the real time. 
+        Steps over max_steps are dropped, so slow frames do not pile up"""
+        if self.__pacer is None:
+            self.__pacer = pg.time.Clock()
+        self.__accumulator += self.__pacer.tick(self.__fps) / 1000
+        steps: int = int(self.__accumulator / self.__dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.__accumulator = 0
+        else:
+            self.__accumulator -= steps * self.__dt
+        return steps
+    
+    def now(self) -> float:
+        if not self.driven:
+            self.follow()
+        return self.time
+    
+    def reset(self, driven: bool = True) -> None:
+        """Starts again from zero. The timers started before are to be reset too"""
+        self.__frame = 0
+        self.__accumulator = 0
+        self.__start = tm.perf_counter()
+        self.driven = driven
+    
+    @property
+    def fps(self) -> int:
+        return self.__fps
+    
+    @property
+    def dt(self) -> float:
+        return self.__dt
+    
+    @property
+    def frame(self) -> int:
+        return self.__frame
+    
+    @property
+    def time(self) -> float:
+        return self.__frame * self.__dt
+    
+    @property
+    def alpha(self) -> float:
+        """Elapsed part of the next step, for interpolated drawing"""
+        return self.__accumulator / self.__dt
+    
+    def __del__(self) -> None:
+        pass
+
+
+CLOCK: Clock = Clock()
+
+
 class Timer:
-    """A class for storing time"""
+    """A class for storing time. Reads the shared simulation clock"""
+    __slots__ = ('__buffer', '__last', '__whole')
+
     def __init__(self) -> None:
         self.__buffer: float = 0
         self.__last: float = 0
@@ -26,10 +115,10 @@ class Timer:
     
     def get_time(self) -> float:
         if not self.__whole:
-            self.__last = tm.perf_counter()
+            self.__last = CLOCK.now()
             self.__whole = True
         else:
-            current: float = tm.perf_counter()
+            current: float = CLOCK.now()
             delta: float = current - self.__last
             self.__buffer += delta
             self.__whole = False
@@ -39,30 +128,29 @@ class Timer:
         elapsed_time: float = self.get_time()
         self.__buffer = 0
         return elapsed_time
-            
+    
+    def reset(self) -> None:
+        self.__buffer = 0
+        self.__whole = False
     
     @property
     def buffer(self) -> float:
         return self.__buffer
-    
-    def __del__(self) -> None:
-        pass
 
 
 class Animator:
     """A class for creating animations. Accepts a list of pygame images, you can adjust the frame time 
-    and image sizes. By deafult, the images have the right (current orientation)"""
+    and image sizes. By deafult, the images have the right (current orientation). Animators of the 
+    same images, sizes and orientation share one frame set, each keeps only its buffer"""
     def __init__(self, images,
                  sizes: tuple[float, float], 
                  k_time: float = .15,
                  right: bool = True) -> None:
-        self.__images = []
         for imag in images:
             imag.set_colorkey((255, 255, 255))
-            image = pg.transform.scale(imag, sizes)
-            if not right:
-                image = pg.transform.flip(image, True, False)
-            self.__images.append(image)
+        key: tuple = 'animation', tuple(images), int(sizes[0]), int(sizes[1]), right
+        self.__images: tuple = FRAME_SETS.get(key, lambda: [FRAME_SETS.variant(imag, sizes, flip_x=not right) 
+                                                            for imag in images])
         self.__buffer: float = 0
         self.__k_time: float = k_time
         self.__length: float = len(self.__images) - 1
@@ -79,38 +167,78 @@ class Animator:
         return self.__images[index]
     
     def total_resize(self, sizes: tuple[float, float]) -> None:
-        for i, image in enumerate(self.__images):
-            image = pg.transform.scale(image, sizes)
-            self.__images[i] = image
+        self.__images = tuple(FRAME_SETS.variant(image, sizes) for image in self.__images)
     
     def total_flip(self, flip_x: bool = True,
                    flip_y: bool = False) -> None:
-        for i, image in enumerate(self.__images):
-            image = pg.transform.flip(image, flip_x, flip_y)
-            self.__images[i] = image
+        self.__images = tuple(pg.transform.flip(image, flip_x, flip_y) for image in self.__images)
 
     def total_rotate(self, degree: float) -> None:
-        for i, image in enumerate(self.__images):
-            image = pg.transform.rotate(image, degree)
-            self.__images[i] = image
+        self.__images = tuple(pg.transform.rotate(image, degree) for image in self.__images)
     
     def __del__(self) -> None:
         pass
 
 
+class View:
+    """The camera offset of the world-space mode. Entities keep their world coordinates, and only 
+    the draw path and the screen bound checks add the offset. Static entities live in screen space"""
+    def __init__(self) -> None:
+        self.active: bool = False
+        self.x: float = 0
+        self.y: float = 0
+    
+    def move(self, dx: float = 0, dy: float = 0) -> None:
+        self.x += dx
+        self.y += dy
+    
+    def reset(self) -> None:
+        self.x = 0
+        self.y = 0
+    
+    def to_screen(self, pos: tuple[float, float], static: bool = False) -> tuple[float, float]:
+        if self.active and not static:
+            return pos[0] + self.x, pos[1] + self.y
+        return pos
+    
+    def to_world(self, pos: tuple[float, float]) -> tuple[float, float]:
+        if self.active:
+            return pos[0] - self.x, pos[1] - self.y
+        return pos
+    
+    def __del__(self) -> None:
+        pass
+
+
+VIEW: View = View()
+
+
 class Camera:
+    """With world_space the world is not shifted: the offset goes to VIEW and scrolling costs 
+    the same for any number of entities. Otherwise every collection is shifted as before"""
     def __init__(self, 
                  pos: tuple[float, float] = (0, 0),
                  distance_x1: float = 0,
                  distance_x2: float = 0,
-                 distance_y: float = 0) -> None:
+                 distance_y: float = 0,
+                 world_space: bool = False) -> None:
         self.distance_x1: float = distance_x1
         self.distance_x2: float = distance_x2
         self.distance_y: float = distance_y
         self.pos: tuple[float, float] = pos
+        self.world_space: bool = world_space
+        VIEW.active = world_space
+        VIEW.reset()
     
     def world_shift(self, target, world_objects) -> None:
         offset: tuple[float, float] = self.get_offset(target)
+        if self.world_space:
+            VIEW.move(offset[0], offset[1])
+        else:
+            self.shift_objects(target, world_objects, offset)
+    
+    @staticmethod
+    def shift_objects(target, world_objects, offset: tuple[float, float]) -> None:
         target.shift(offset[0], offset[1])
         for subject in world_objects:
             if subject is not None:
@@ -123,8 +251,9 @@ class Camera:
         return -offset_x, -offset_y
     
     def delta(self, target) -> tuple[float, float]:
-        dx: float = target.pos[0] - self.pos[0]
-        dy: float = target.pos[1] - self.pos[1]
+        target_pos: tuple[float, float] = VIEW.to_screen(target.pos)
+        dx: float = target_pos[0] - self.pos[0]
+        dy: float = target_pos[1] - self.pos[1]
         return dx, dy
     
     def offset_x(self, target, dx: float) -> float:
@@ -188,6 +317,37 @@ class Soundman:
         pass
                 
 
+class Pressed:
+    """Pressed keys in the form returned by pg.key.get_pressed"""
+    def __init__(self, keys: tuple[int, ...] = ()) -> None:
+        self.keys: frozenset[int] = frozenset(keys)
+    
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+    
+    def __del__(self) -> None:
+        pass
+
+
+class ScriptedKeys:
+    """Replaces the keyboard of a player. The script holds the pressed keys of every frame and is 
+    repeated from the start when it ends. The frame is changed by the next_frame method"""
+    def __init__(self, script: list[tuple[int, ...]]) -> None:
+        self.__script: list[Pressed] = [Pressed(keys) for keys in script]
+        self.frame: int = 0
+    
+    def get_pressed(self) -> Pressed:
+        if not self.__script:
+            return Pressed()
+        return self.__script[self.frame % len(self.__script)]
+    
+    def next_frame(self) -> None:
+        self.frame += 1
+    
+    def __del__(self) -> None:
+        pass
+
+
 class RandPos:
     
     @staticmethod
@@ -0,0 +1,120 @@
+from hashlib import sha1
+from typing import Callable
+import pygame as pg
+import struct
+import os
+
+
+HEADER: struct.Struct = struct.Struct('<4sBIIBB4B')
+MAGIC: bytes = b'VRNT'
+VERSION: int = 1
+
+
+class VariantCache:
+    """Scaled, flipped and rotated surfaces kept on the disk between launches. A surface loaded from
+    a file is known by the hash of the file, a variant by its source and its transform, so a warm
+    start at the same resolution reads the raw pixels instead of transforming them, and a changed
+    file gets new keys. Surfaces of unknown origin are transformed as before. A file that is
+    truncated, corrupt or of another format version is deleted and built again. Without active
+    nothing is read or written"""
+    def __init__(self, directory: str = os.path.join('.cache', 'variants'),
+                 active: bool = False) -> None:
+        self.directory: str = directory
+        self.active: bool = active
+        self.__origins: dict[int, tuple] = {}
+        self.__hashes: dict[str, str] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def source(self, surface, path: str) -> None:
+        """Remembers the file of a loaded surface"""
+        if self.active:
+            self.__origins[id(surface)] = surface, ('file', path, self.file_hash(path))
+
+    def variant(self, image, transform: tuple, build: Callable) -> pg.surface.Surface:
+        """The transform of the image, read from the disk or built by build and written"""
+        if not self.active:
+            return build()
+        origin: tuple | None = self.origin(image, transform)
+        if origin is None:
+            return build()
+        path: str = os.path.join(self.directory, sha1(repr(origin).encode()).hexdigest() + '.raw')
+        surface: pg.surface.Surface | None = self.load(path)
+        if surface is None:
+            surface = build()
+            self.save(path, surface)
+            self.misses += 1
+        else:
+            self.hits += 1
+        self.__origins.setdefault(id(surface), (surface, origin))
+        return surface
+
+    def derive(self, surface, image, transform: tuple) -> None:
+        """Remembers that the surface is the transform of the image, e.g. a packed copy of it"""
+        if self.active and (id(surface) not in self.__origins):
+            origin: tuple | None = self.origin(image, transform)
+            if origin is not None:
+                self.__origins[id(surface)] = surface, origin
+
+    def origin(self, image, transform: tuple) -> tuple | None:
+        known: tuple | None = self.__origins.get(id(image))
+        if known is None:
+            return None
+        return known[1], transform, image.get_colorkey()
+
+    def file_hash(self, path: str) -> str:
+        digest: str | None = self.__hashes.get(path)
+        if digest is None:
+            if os.path.isfile(path):
+                with open(path, 'rb') as file:
+                    digest = sha1(file.read()).hexdigest()
+            else:
+                digest = 'placeholder'
+            self.__hashes[path] = digest
+        return digest
+
+    @staticmethod
+    def load(path: str) -> pg.surface.Surface | None:
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as file:
+            data: bytes = file.read()
+        try:
+            magic, version, width, height, alpha, keyed, *colorkey = HEADER.unpack_from(data)
+            if (magic != MAGIC) or (version != VERSION):
+                raise ValueError(f'Not a variant of this version: {path}')
+            surface: pg.surface.Surface = pg.image.frombytes(data[HEADER.size:], (width, height),
+                                                             'RGBA' if alpha else 'RGB')
+        except (struct.error, ValueError):
+            os.remove(path)
+            return None
+        if pg.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        if keyed:
+            surface.set_colorkey(colorkey)
+        return surface
+
+    def save(self, path: str, surface) -> None:
+        alpha: bool = bool(surface.get_flags() & pg.SRCALPHA)
+        colorkey: tuple | None = surface.get_colorkey()
+        header: bytes = HEADER.pack(MAGIC, VERSION, surface.get_width(), surface.get_height(), alpha,
+                                    colorkey is not None, *(colorkey or (0, 0, 0, 0)))
+        os.makedirs(self.directory, exist_ok=True)
+        temporary: str = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(header)
+            file.write(pg.image.tobytes(surface, 'RGBA' if alpha else 'RGB'))
+        os.replace(temporary, path)
+
+    def clear(self) -> None:
+        """Forgets the surfaces of this launch, the files stay"""
+        self.__origins = {}
+        self.__hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __del__(self) -> None:
+        pass
+
+
+VARIANTS: VariantCache = VariantCache()
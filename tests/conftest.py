@@ -0,0 +1,52 @@
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def display():
+    from engine.constants import Sizes
+    from engine.assets import ASSETS
+    pg.init()
+    ASSETS.placeholders = True
+    yield pg.display.set_mode(Sizes().wnd_size)
+    pg.quit()
+
+
+@pytest.fixture
+def clock():
+    from engine.tools import CLOCK
+    CLOCK.reset()
+    yield CLOCK
+    CLOCK.reset(driven=False)
+
+
+@pytest.fixture
+def run_level(clock):
+    """Builds a populated level of the gym map and steps it like the bench"""
+    from engine.tools import ScriptedKeys
+    from engine.bench import default_script
+    from engine.tilepack import TILEMAPS
+    from engine.level import Level
+
+    def run(frames: int, seed: int = 0, mix: dict | None = None, **options) -> Level:
+        wnd = pg.display.get_surface()
+        level: Level = Level(TILEMAPS.get('gym'), **options)
+        level.populate(seed=seed, **(mix or {'coins': 50, 'surprises': 10, 'platforms': 10, 'bullets': 50}))
+        keyboard: ScriptedKeys = ScriptedKeys(default_script())
+        level.set_keyboard(keyboard)
+        for _ in range(frames):
+            clock.step()
+            level.update()
+            level.collide()
+            level.interact()
+            level.render(wnd)
+            keyboard.next_frame()
+        return level
+    return run
@@ -0,0 +1,79 @@
+from engine.atlas import Atlas, FrameSets
+import pygame as pg
+import random
+import pytest
+
+
+def pattern(sizes: tuple[int, int] = (16, 12), seed: int = 0) -> pg.surface.Surface:
+    """An asymmetric image with a white, colorkeyed, corner"""
+    rand: random.Random = random.Random(seed)
+    image: pg.surface.Surface = pg.surface.Surface(sizes)
+    for x in range(sizes[0]):
+        for y in range(sizes[1]):
+            image.set_at((x, y), (rand.randrange(250), rand.randrange(250), rand.randrange(250)))
+    image.fill((255, 255, 255), (0, 0, sizes[0] // 3, sizes[1] // 3))
+    image.set_colorkey((255, 255, 255))
+    return image
+
+
+def area(frame) -> pg.Rect:
+    return pg.Rect(frame.get_offset(), frame.get_size())
+
+
+def test_packed_frames_do_not_overlap():
+    atlas: Atlas = Atlas((128, 128), active=True)
+    rand: random.Random = random.Random(4)
+    frames: list = [atlas.variant(pattern((rand.randint(4, 40), rand.randint(4, 40)), i)) for i in range(120)]
+    assert atlas.pages > 1
+    for index, frame in enumerate(frames):
+        page = frame.get_parent()
+        assert atlas.packed(frame)
+        assert page.get_rect().contains(area(frame))
+        others: list[pg.Rect] = [area(other) for other in frames[index + 1:] if other.get_parent() is page]
+        assert area(frame).collidelist(others) == -1
+
+
+def test_packed_frame_keeps_the_pixels():
+    atlas: Atlas = Atlas((128, 128), active=True)
+    image: pg.surface.Surface = pattern()
+    frame: pg.surface.Surface = atlas.variant(image)
+    assert frame is not image
+    assert pg.image.tobytes(frame, 'RGB') == pg.image.tobytes(image, 'RGB')
+    assert atlas.variant(image) is frame
+
+
+def test_overflow_opens_a_page():
+    atlas: Atlas = Atlas((64, 64), active=True)
+    first: list = [atlas.variant(pattern((32, 32), i)) for i in range(4)]
+    assert atlas.pages == 1
+    assert atlas.used == 1.
+    extra: pg.surface.Surface = atlas.variant(pattern((32, 32), 4))
+    assert atlas.pages == 2
+    assert extra.get_parent() is not first[0].get_parent()
+    big: pg.surface.Surface = atlas.variant(pattern((100, 20), 5))
+    assert atlas.pages == 3
+    assert big.get_parent().get_size() == (100, 64)
+
+
+def baseline(image, sizes: tuple[int, int], flip_x: bool, degree: float) -> pg.surface.Surface:
+    """The chain of Rotation before the frame sets: scale, rotate, then flip"""
+    image = pg.transform.scale(image, sizes)
+    if degree:
+        image = pg.transform.rotate(image, degree)
+    if flip_x:
+        image = pg.transform.flip(image, True, False)
+    return image
+
+
+@pytest.mark.parametrize('active', [False, True])
+def test_variant_matches_the_transform_chain(active: bool):
+    frame_sets: FrameSets = FrameSets(Atlas((256, 256), active=active))
+    image: pg.surface.Surface = pattern()
+    for sizes in ((16, 12), (32, 20), (10, 30)):
+        for flip_x in (False, True):
+            for degree in (0, 45, 90, 135.5):
+                frame: pg.surface.Surface = frame_sets.variant(image, sizes, flip_x=flip_x, degree=degree)
+                expected: pg.surface.Surface = baseline(image, sizes, flip_x, degree)
+                assert frame.get_size() == expected.get_size()
+                assert pg.image.tobytes(frame, 'RGB') == pg.image.tobytes(expected, 'RGB')
+                assert frame_sets.variant(image, sizes, flip_x=flip_x, degree=degree) is frame
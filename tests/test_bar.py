@@ -0,0 +1,58 @@
+from engine.bar import GlyphCache, GLYPHS, Counter, DIGITS
+import pygame as pg
+import pytest
+
+FONT: str = 'Assets/SuperMario85.ttf'
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Texts rendered by the font through the glyph cache"""
+    texts: list[str] = []
+    render = GlyphCache.render
+
+    def counted(font, txt, fnt_color, color=None):
+        texts.append(txt)
+        return render(font, txt, fnt_color, color)
+    monkeypatch.setattr(GlyphCache, 'render', staticmethod(counted))
+    GLYPHS.clear()
+    yield texts
+    GLYPHS.clear()
+
+
+def test_changing_the_number_renders_nothing(renders):
+    counter: Counter = Counter('0', 24, FONT)
+    assert renders == [DIGITS]
+    glyphs: int = GLYPHS.glyphs
+    for number in (7, 42, 1990, 31415926, 0):
+        counter.change_text(str(number))
+    assert renders == [DIGITS]
+    assert GLYPHS.glyphs == glyphs == len(DIGITS)
+
+
+def test_layout_width_is_the_sum_of_the_digits(renders):
+    counter: Counter = Counter('90210', 24, FONT)
+    digits: tuple[pg.surface.Surface, ...] = GLYPHS.strip(counter.font, counter.fnt_color, counter.color)
+    width: int = sum(digits[int(char)].get_width() for char in '90210')
+    assert counter.rect.width == width
+    assert [offset for _, offset in counter.glyphs] == [sum(digits[int(char)].get_width() for char in '90210'[:i])
+                                                        for i in range(5)]
+
+
+def test_text_has_the_size_of_the_rect(renders):
+    counter: Counter = Counter('123', 24, FONT, pos=(40, 30), color=(0, 0, 0))
+    for number in ('123', '8', '4096'):
+        counter.change_text(number)
+        assert counter.text.get_size() == counter.rect.size
+        assert counter.rect.topleft == (40, 30)
+
+
+def test_counters_share_the_strip(renders):
+    first: Counter = Counter('12', 24, FONT, fnt_color=(255, 255, 0))
+    second: Counter = Counter('21', 24, FONT, pos=(100, 0), fnt_color=(255, 255, 0))
+    assert first.glyphs[0][0] is second.glyphs[1][0]
+    assert first.glyphs[1][0] is second.glyphs[0][0]
+    assert first.glyphs[0][0].get_parent() is second.glyphs[0][0].get_parent()
+    other: Counter = Counter('12', 24, FONT, fnt_color=(0, 255, 0))
+    assert other.glyphs[0][0] is not first.glyphs[0][0]
+    assert renders == [DIGITS, DIGITS]
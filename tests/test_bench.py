@@ -0,0 +1,21 @@
+from engine.bench import Bench, PHASES
+
+
+def state(level) -> list:
+    found: list = [tuple(player.rect) for player in level.players]
+    for collection in (level.mario_blocks, level.surprise_blocks, level.platforms, level.items, level.bullets):
+        found.append(sorted((tuple(item.rect), bool(item.destroyed)) for item in collection.tar))
+    return found
+
+
+def test_same_arguments_give_the_same_simulation(run_level):
+    first: list = state(run_level(120))
+    second: list = state(run_level(120))
+    assert first == second
+
+
+def test_bench_reports_every_phase():
+    result: dict = Bench('gym', frames=5).run()
+    assert set(result['phases']) == set(PHASES)
+    assert result['entities'] > 0
+    assert Bench('gym', frames=0).run()['fps'] == 0
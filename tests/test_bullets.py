@@ -0,0 +1,111 @@
+from engine.spawner import SpawnerClassicBullet, SpawnerParabolaBullet, SpawnerMarioBlock
+from engine.collection import BulletsList
+from engine.enumerations import EntityName
+from engine.level import Level, BULLET_PATH
+import random
+import pytest
+
+
+def bullets(count: int, activated: bool) -> BulletsList:
+    collection: BulletsList = BulletsList()
+    spawner: SpawnerClassicBullet = SpawnerClassicBullet(BULLET_PATH, (16, 16), EntityName.player)
+    for i in range(count):
+        bullet = spawner.spawn((i * 200, 100))
+        bullet.activated = activated
+        collection.append(bullet)
+    return collection
+
+
+def test_no_finder_without_flying_bullets(monkeypatch):
+    collection: BulletsList = bullets(10, activated=False)
+    monkeypatch.setattr(collection, 'target_finder', lambda targets: pytest.fail('finder was built'))
+    collection.kill_targets([Level.spawn_player((0, 100))])
+
+
+@pytest.mark.parametrize('count', [3, 40])
+def test_linear_and_grid_finders_kill_the_same(count: int):
+    players: list = [Level.spawn_player((i * 200, 100)) for i in range(count)]
+    collection: BulletsList = bullets(count, activated=True)
+    collection.kill_targets(players)
+    assert not any(player.fireform for player in players)
+    assert all(bullet.destroyed for bullet in collection.tar)
+
+
+class Recorder:
+    """Stands for the break sound of a block and notes its plays"""
+    def __init__(self, log: list, index: int) -> None:
+        self.log: list = log
+        self.index: int = index
+
+    def play(self) -> None:
+        self.log.append(self.index)
+
+
+def seeded_scene(seed: int, players: int, blocks: int, count: int) -> tuple:
+    """Players, bricks and flying bullets crowded into a small area, so many of them overlap"""
+    rand: random.Random = random.Random(seed)
+    sounds: list[int] = []
+    targets: list = [Level.spawn_player((rand.randint(0, 600), rand.randint(0, 300))) for _ in range(players)]
+    spawner: SpawnerMarioBlock = SpawnerMarioBlock()
+    for index in range(blocks):
+        block = spawner.spawn((rand.randint(0, 600), rand.randint(0, 300)))
+        block.sound_broken = Recorder(sounds, index)
+        targets.insert(rand.randint(0, len(targets)), block)
+    collection: BulletsList = BulletsList()
+    bullet_spawner: SpawnerClassicBullet = SpawnerClassicBullet(BULLET_PATH, (16, 16), EntityName.player)
+    for _ in range(count):
+        bullet = bullet_spawner.spawn((rand.randint(0, 600), rand.randint(0, 300)))
+        bullet.activated = True
+        collection.append(bullet)
+    return targets, collection, sounds
+
+
+def outcome(targets: list, collection: BulletsList, sounds: list[int]) -> tuple:
+    return ([index for index, target in enumerate(targets) if getattr(target, 'fireform', None) is False],
+            [index for index, target in enumerate(targets) if getattr(target, 'destroyed', False)],
+            list(sounds),
+            [index for index, bullet in enumerate(collection.tar) if bullet.destroyed])
+
+
+@pytest.mark.parametrize('seed, players, blocks', [(1, 6, 6), (2, 20, 30), (3, 40, 60)])
+def test_grid_finder_matches_the_linear_scan(seed: int, players: int, blocks: int, monkeypatch):
+    results: list[tuple] = []
+    grids: list[int] = []
+    for linear_targets in (BulletsList.linear_targets, 10 ** 9):
+        targets, collection, sounds = seeded_scene(seed, players, blocks, 80)
+        collection.linear_targets = linear_targets
+        finder = collection.target_finder
+        monkeypatch.setattr(collection, 'target_finder',
+                            lambda found: grids.append(len(found) > linear_targets) or finder(found))
+        collection.kill_targets(targets)
+        results.append(outcome(targets, collection, sounds))
+    assert grids == [players + blocks > BulletsList.linear_targets, False]
+    grid, linear = results
+    assert grid == linear
+    assert grid[0] and grid[1] and grid[2] and grid[3]
+
+
+@pytest.mark.parametrize('parabola', [False, True])
+def test_reused_bullet_moves_like_a_new_one(clock, parabola: bool):
+    def first_move(bullet) -> tuple[int, int]:
+        bullet.activated = True
+        bullet.update()
+        clock.step()
+        bullet.update()
+        return bullet.rect.left - 500, bullet.rect.top - 100
+
+    if parabola:
+        spawner = SpawnerParabolaBullet(BULLET_PATH, (16, 16), 60)
+    else:
+        spawner = SpawnerClassicBullet(BULLET_PATH, (16, 16))
+    fresh: tuple[int, int] = first_move(spawner.spawn((500, 100)))
+    used = spawner.spawn((500, 100))
+    first_move(used)
+    for _ in range(5):
+        clock.step()
+        used.update()
+    for _ in range(30):
+        clock.step()
+    spawner.recycle(used)
+    assert spawner.spawn((500, 100)) is used
+    assert first_move(used) == fresh
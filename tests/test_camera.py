@@ -0,0 +1,10 @@
+from engine.tools import Camera, VIEW
+
+
+def test_camera_sets_the_view_mode():
+    Camera(world_space=True)
+    VIEW.move(10, 5)
+    assert VIEW.active
+    Camera()
+    assert not VIEW.active
+    assert (VIEW.x, VIEW.y) == (0, 0)
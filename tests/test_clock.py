@@ -0,0 +1,30 @@
+from engine.tools import Clock, Timer, CLOCK
+import time
+
+
+def test_first_step_goes_on_from_the_real_time():
+    CLOCK.reset(driven=False)
+    time.sleep(.05)
+    timer: Timer = Timer()
+    timer.get_time()
+    before: float = CLOCK.now()
+    CLOCK.step()
+    assert CLOCK.now() >= before + CLOCK.dt
+    assert 0 <= timer.get_time() < .5
+    CLOCK.reset(driven=False)
+
+
+def test_time_is_whole_steps():
+    clock: Clock = Clock(60)
+    for _ in range(3):
+        assert clock.now() == clock.frame * clock.dt
+        clock.step()
+    assert clock.frame >= 3
+
+
+def test_stepped_timer(clock):
+    timer: Timer = Timer()
+    timer.get_time()
+    for _ in range(clock.fps):
+        clock.step()
+    assert abs(timer.get_time() - 1) < 1e-9
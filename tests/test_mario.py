@@ -0,0 +1,28 @@
+from engine.level import Level
+
+
+def test_one_respawn_after_the_death_pause(clock):
+    player = Level.spawn_player((0, 0))
+    lives: int = player.lives
+    player.alive = False
+    respawns: list[int] = []
+    for _ in range(clock.fps * 3):
+        clock.step()
+        was_alive: bool = player.alive
+        player.respawn()
+        if player.alive and not was_alive:
+            respawns.append(clock.frame)
+    assert respawns == [1 + round(player.death_pause * clock.fps)]
+    assert player.lives == lives - 1
+    assert not player.dying
+
+
+def test_revived_player_is_not_dying(clock):
+    player = Level.spawn_player((0, 0))
+    player.alive = False
+    clock.step()
+    player.respawn()
+    assert player.dying
+    player.alive = True
+    player.respawn()
+    assert not player.dying
@@ -0,0 +1,102 @@
+from engine.particles import ParticleRain, ParticleClouds, SpawnerParticleClouds
+from engine.constants import DRAW_BOUNDS
+from engine.tools import CLOCK
+import numpy as np
+import pygame as pg
+
+
+def rain(quantity: int = 50) -> ParticleRain:
+    return ParticleRain(pg.Surface((2, 4)), 120., 300., (0., 800.), (0., 600.), quantity, seed=3)
+
+
+def test_velocities_move_the_drops(clock):
+    drops: ParticleRain = rain()
+    vx, vy = drops.velocities
+    assert np.all(vy == 120.)
+    vx[::2] = 30.
+    vy[1::2] = 60.
+    x, y = (array.copy() for array in drops.positions)
+    CLOCK.step()
+    assert CLOCK.dt > 0
+    drops.update()
+    new_x, new_y = drops.positions
+    assert np.allclose(new_x - x, vx * CLOCK.dt)
+    assert np.allclose(new_y - y, vy * CLOCK.dt)
+
+
+def test_speed_sets_every_velocity():
+    drops: ParticleRain = rain()
+    drops.velocities[1][:] = 5.
+    drops.speed = 90.
+    assert drops.speed == 90.
+    assert np.all(drops.velocities[1] == 90.)
+
+
+def test_drops_below_the_bounds_start_again(clock):
+    drops: ParticleRain = rain()
+    drops.positions[1][:10] = 700.
+    CLOCK.step()
+    drops.update()
+    assert np.all(drops.positions[1][:10] + 2 <= 300.)
+
+
+def test_drops_blown_past_a_side_come_back(clock):
+    drops: ParticleRain = rain()
+    drops.velocities[0][:] = 1e5
+    CLOCK.step()
+    drops.update()
+    centres: np.ndarray = drops.positions[0] + 1
+    assert np.all((centres >= 0.) & (centres <= 800.))
+
+
+def clouds(**options) -> ParticleClouds:
+    return ParticleClouds(pg.Surface((40, 20)), 100., 1e4, (0., 800.), (0., 200.), 8, seed=5, **options)
+
+
+def test_clouds_drift_by_their_velocities(clock):
+    sky: ParticleClouds = clouds()
+    sky.positions[0][:] = 100.
+    sky.velocities[::2] = 50.
+    CLOCK.step()
+    sky.update()
+    assert np.allclose(sky.positions[0] - 100., sky.velocities * CLOCK.dt)
+    sky.right = False
+    assert np.all(sky.velocities < 0) and not sky.right
+
+
+def test_clouds_wrap_across_the_bounds(clock):
+    sky: ParticleClouds = clouds()
+    sky.positions[0][:4] = 799.9
+    sky.velocities[4:] = -100.
+    sky.positions[0][4:] = .01
+    CLOCK.step()
+    sky.update()
+    assert np.all(sky.positions[0][:4] == 0.)
+    assert np.all(sky.positions[0][4:] == 800.)
+
+
+def test_stopped_clouds_stay(clock):
+    sky: ParticleClouds = clouds(stop_clouds=True)
+    x: np.ndarray = sky.positions[0].copy()
+    CLOCK.step()
+    sky.update()
+    assert np.array_equal(sky.positions[0], x)
+
+
+def test_spawner_takes_the_draw_bounds():
+    sky: ParticleClouds = SpawnerParticleClouds('cloud.bmp', 60., 60., (48., 24.), 5, to_right=False).spawn()
+    assert sky.quantity == 5 and not sky.right
+    assert sky.image.get_size() == (48, 24)
+    assert sky.bounds_x == DRAW_BOUNDS.bound_x
+    assert np.all((sky.positions[0] >= DRAW_BOUNDS.bound_x[0]) & (sky.positions[0] <= DRAW_BOUNDS.bound_x[1]))
+
+
+def test_clouds_draw_at_their_positions():
+    image: pg.Surface = pg.Surface((40, 20))
+    image.fill((255, 0, 255))
+    sky: ParticleClouds = ParticleClouds(image, 100., 100., (0., 800.), (0., 200.), 8, seed=5)
+    wnd: pg.Surface = pg.Surface((900, 300))
+    wnd.fill((0, 0, 0))
+    sky.draw(wnd)
+    x, y = sky.positions
+    assert all(wnd.get_at((int(x[i]) + 1, int(y[i]) + 1))[:3] == (255, 0, 255) for i in range(sky.quantity))
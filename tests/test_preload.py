@@ -0,0 +1,22 @@
+from engine.spawner import SpawnerLifeShroom, SpawnerSuperShroom, SpawnerFireFlower
+from engine.preload import Preloader
+from engine.assets import ASSETS
+from engine.level import Level
+
+
+def test_manifest_holds_the_files_of_the_spawners():
+    manifest: tuple[str, ...] = ASSETS.manifest
+    assert len(manifest) == len(set(manifest))
+    for spawner in SpawnerLifeShroom, SpawnerSuperShroom, SpawnerFireFlower:
+        assert set(spawner.assets) <= set(manifest)
+    assert Preloader().paths == tuple(path for path in manifest if not ASSETS.cached(path))
+
+
+def test_populated_level_loads_nothing_beyond_the_manifest(run_level):
+    ASSETS.clear()
+    Preloader().wait()
+    preloaded: int = ASSETS.loaded
+    assert preloaded == len(ASSETS.manifest)
+    level: Level = run_level(5, mix={'coins': 5, 'surprises': 5, 'platforms': 3, 'bullets': 5, 'rain': 10})
+    assert level.players
+    assert ASSETS.loaded == preloaded
@@ -0,0 +1,13 @@
+from engine.prerender import ChunkLayer
+import pygame as pg
+
+
+def test_layer_leaves_the_shared_images_alone():
+    image: pg.surface.Surface = pg.Surface((64, 64))
+    image.fill((255, 255, 255))
+    image.fill((200, 0, 0), (8, 8, 48, 48))
+    layer: ChunkLayer = ChunkLayer(('BB', ' B'), {'B': image}, size=64, chunk=2)
+    assert image.get_colorkey() is None
+    chunk: pg.surface.Surface = layer.get_chunk(0, 0)
+    assert chunk.get_at((80, 80))[:3] == (200, 0, 0)
+    assert chunk.get_at((66, 66))[:3] == chunk.get_colorkey()[:3]
@@ -0,0 +1,114 @@
+from engine.spawner import SpawnerClassicBullet
+from engine.tilepack import TILEMAPS, TilemapLibrary
+from engine.tilemap import TileRaycaster
+from engine.level import Level, BULLET_PATH
+from engine.constants import Sizes
+import random
+import pytest
+
+SIZE: float = 64
+SAMPLES: int = 4000
+
+
+def point_at(start: tuple[float, float], end: tuple[float, float], share: float) -> tuple[float, float]:
+    return start[0] + (end[0] - start[0]) * share, start[1] + (end[1] - start[1]) * share
+
+
+def first_sampled(raycaster: TileRaycaster, start: tuple[float, float], end: tuple[float, float]) -> float | None:
+    for i in range(SAMPLES + 1):
+        share: float = i / SAMPLES
+        if raycaster.solid(*raycaster.cell(point_at(start, end, share))):
+            return share
+    return None
+
+
+def grazed(raycaster: TileRaycaster, start: tuple[float, float], end: tuple[float, float]) -> bool:
+    """The first solid cell of the segment is crossed within one sample, so sampling may miss it"""
+    cells: list[tuple[int, int, float]] = list(raycaster.traverse(start, end))
+    for index, (col, row, share) in enumerate(cells):
+        if raycaster.solid(col, row):
+            leave: float = cells[index + 1][2] if index + 1 < len(cells) else 1.
+            return leave - share <= 1 / SAMPLES
+    return False
+
+
+def share_of(start: tuple[float, float], end: tuple[float, float], point: tuple[float, float]) -> float:
+    if abs(end[0] - start[0]) > abs(end[1] - start[1]):
+        return (point[0] - start[0]) / (end[0] - start[0])
+    return (point[1] - start[1]) / (end[1] - start[1])
+
+
+@pytest.mark.parametrize('symbols', ['B', 'BMS'])
+def test_cast_matches_sampling(symbols: str):
+    raycaster: TileRaycaster = TileRaycaster(TilemapLibrary.source('gym'), symbols, size=SIZE)
+    rows: int = len(TilemapLibrary.source('gym'))
+    rand: random.Random = random.Random(7)
+    hits: int = 0
+    misses: int = 0
+    for _ in range(300):
+        start: tuple[float, float] = rand.uniform(0, 60 * SIZE), rand.uniform(0, rows * SIZE)
+        end: tuple[float, float] = start[0] + rand.uniform(-600, 600), start[1] + rand.uniform(-600, 600)
+        sampled: float | None = first_sampled(raycaster, start, end)
+        hit: tuple[float, float] | None = raycaster.cast(start, end)
+        if sampled is None:
+            assert (hit is None) or grazed(raycaster, start, end)
+            misses += 1
+            continue
+        hits += 1
+        assert hit is not None
+        assert share_of(start, end, hit) <= sampled + 1e-9
+        assert share_of(start, end, hit) >= sampled - 1 / SAMPLES - 1e-9
+    assert hits > 30
+    assert misses > 30
+
+
+def test_packed_map_casts_the_same():
+    rand: random.Random = random.Random(8)
+    plain: TileRaycaster = TileRaycaster(TilemapLibrary.source('gym'), size=SIZE)
+    packed: TileRaycaster = TileRaycaster(TILEMAPS.get('gym'), size=SIZE)
+    for raycaster in (plain, packed):
+        raycaster.shift(-130.5, 40)
+    for _ in range(300):
+        start: tuple[float, float] = rand.uniform(-200, 4000), rand.uniform(-200, 3000)
+        end: tuple[float, float] = start[0] + rand.uniform(-900, 900), start[1] + rand.uniform(-900, 900)
+        assert plain.cast(start, end) == packed.cast(start, end)
+
+
+def first_cell(level: Level, symbol: str) -> tuple[int, int]:
+    for row, line in enumerate(level.tilemap):
+        for col, char in enumerate(line):
+            if (char == symbol) and (level.tilemap[row - 1][col] == ' '):
+                return col, row
+    raise AssertionError(symbol)
+
+
+@pytest.mark.parametrize('store', [False, True])
+def test_destroyed_brick_clears_its_cell(store: bool):
+    level: Level = Level(TILEMAPS.get('gym'), store=store)
+    size: float = Sizes().size
+    col, row = first_cell(level, 'M')
+    s_col, s_row = first_cell(level, 'S')
+    assert level.raycaster.solid(col, row) and level.raycaster.solid(s_col, s_row)
+    brick = next(block for block in level.mario_blocks if block.rect.topleft == (col * size, row * size))
+    brick.destroyed = True
+    assert not level.raycaster.solid(col, row)
+    assert level.raycaster.solid(s_col, s_row)
+    centre: tuple[float, float] = (col + .5) * size, (row + .5) * size
+    assert level.raycaster.cast((centre[0], centre[1] - size), centre) is None
+
+
+def test_fast_bullet_stops_at_a_brick():
+    level: Level = Level(TILEMAPS.get('gym'))
+    size: float = Sizes().size
+    col, row = first_cell(level, 'M')
+    brick = next(block for block in level.mario_blocks if block.rect.topleft == (col * size, row * size))
+    bullet = SpawnerClassicBullet(BULLET_PATH, (size * .25, size * .25)).spawn((0, 0))
+    bullet.activated = True
+    bullet.rect.center = round((col + .5) * size), round((row - .5) * size)
+    bullet.previous = bullet.rect.center
+    bullet.rect.centery += round(size * 3)
+    level.bullets.append(bullet)
+    level.collide()
+    assert bullet.destroyed
+    assert brick.destroyed
+    assert not level.raycaster.solid(col, row)
@@ -0,0 +1,129 @@
+from engine.render import DirtyRenderer
+from engine.constants import Sizes
+from engine.tilepack import TILEMAPS
+from engine.level import Level
+from engine.tools import VIEW
+import pygame as pg
+import pytest
+
+
+class Block:
+    batched_draw: bool = True
+
+    def __init__(self, image, pos: tuple[int, int]) -> None:
+        self.image = image
+        self.pos: tuple[int, int] = pos
+
+    def blit_args(self) -> tuple:
+        return self.image, self.pos
+
+
+class Untracked:
+
+    def draw(self, wnd) -> None:
+        pass
+
+
+@pytest.fixture
+def shown(monkeypatch):
+    """Calls of the display: 'flip' or the list of updated rects"""
+    calls: list = []
+    monkeypatch.setattr(pg.display, 'flip', lambda: calls.append('flip'))
+    monkeypatch.setattr(pg.display, 'update', lambda rects: calls.append(list(rects)))
+    return calls
+
+
+def image(sizes: tuple[int, int] = (10, 10)) -> pg.surface.Surface:
+    surface: pg.surface.Surface = pg.surface.Surface(sizes)
+    surface.fill((200, 30, 30))
+    return surface
+
+
+def test_first_frame_is_full(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    renderer.render(pg.surface.Surface((400, 300)), [Block(image(), (5, 5))])
+    assert shown == ['flip']
+    assert (renderer.full_frames, renderer.dirty_frames) == (1, 0)
+
+
+def test_still_frame_updates_nothing(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    sprites: list = [Block(image(), (5, 5))]
+    renderer.render(wnd, sprites)
+    renderer.render(wnd, sprites)
+    assert shown == ['flip', []]
+
+
+def test_new_scene_key_redraws_in_full(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    sprites: list = [Block(image(), (5, 5))]
+    for key in (0, 0, 0, 1, 1, (1, 2), (1, 2)):
+        renderer.render(wnd, sprites, key)
+    assert shown == ['flip', [], [], 'flip', [], 'flip', []]
+
+
+def test_large_change_redraws_in_full(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)), max_area=.25)
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    small: Block = Block(image(), (5, 5))
+    large: Block = Block(image((300, 200)), (0, 0))
+    renderer.render(wnd, [small])
+    renderer.render(wnd, [small, large])
+    assert shown == ['flip', 'flip']
+    small.pos = 50, 50
+    renderer.render(wnd, [small, large])
+    assert isinstance(shown[-1], list)
+
+
+def test_untracked_sprite_redraws_in_full(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    sprites: list = [Block(image(), (5, 5)), Untracked()]
+    renderer.render(wnd, sprites)
+    renderer.render(wnd, sprites)
+    assert shown == ['flip', 'flip']
+
+
+def test_moved_sprite_dirties_its_old_and_new_rects(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    block: Block = Block(image(), (20, 20))
+    still: Block = Block(image(), (300, 200))
+    renderer.render(wnd, [block, still])
+    block.pos = 100, 120
+    renderer.render(wnd, [block, still])
+    dirty: list[pg.Rect] = shown[-1]
+    assert pg.Rect(19, 19, 12, 12) in dirty
+    assert pg.Rect(99, 119, 12, 12) in dirty
+    assert len(dirty) == 2
+    assert wnd.get_at((25, 25))[:3] == (0, 0, 0)
+    assert wnd.get_at((105, 125))[:3] == (200, 30, 30)
+    assert wnd.get_at((305, 205))[:3] == (200, 30, 30)
+
+
+def test_vanished_sprite_dirties_its_rect(shown):
+    renderer: DirtyRenderer = DirtyRenderer(lambda wnd: wnd.fill((0, 0, 0)))
+    wnd: pg.surface.Surface = pg.surface.Surface((400, 300))
+    block: Block = Block(image(), (20, 20))
+    renderer.render(wnd, [block])
+    renderer.render(wnd, [])
+    assert shown[-1] == [pg.Rect(19, 19, 12, 12)]
+    assert wnd.get_at((25, 25))[:3] == (0, 0, 0)
+
+
+def test_scene_key_follows_the_view_and_the_layer():
+    level: Level = Level(TILEMAPS.get('gym'), world_space=True, dirty=True)
+    keys: list[tuple] = [level.scene_key]
+    VIEW.move(-5, 0)
+    keys.append(level.scene_key)
+    level.layer.shift(3, 0)
+    keys.append(level.scene_key)
+    size: float = Sizes().size
+    row: int = next(index for index, line in enumerate(level.tilemap) if 'B' in line)
+    level.layer.erase((level.layer.origin[0] + level.tilemap[row].index('B') * size,
+                       level.layer.origin[1] + row * size))
+    keys.append(level.scene_key)
+    VIEW.reset()
+    assert len(set(keys)) == len(keys)
@@ -0,0 +1,38 @@
+from engine.constants import SCREEN, DRAW_BOUNDS, UPDATE_BOUNDS, Sizes
+from engine.particles import SpawnerParticleRain
+from engine.spawner import SpawnerCoin
+from engine.surprise import SpawnerSurpriseBlock
+from engine.tilepack import TILEMAPS
+from engine.level import Level, DRIP_PATH
+
+
+def test_recompute_reaches_sizes_bounds_and_new_spawners():
+    before: float = Sizes().size
+    try:
+        SCREEN.override((1100, 600))
+        assert Sizes().size == 50
+        assert DRAW_BOUNDS.bound_x == (-250, 1350)
+        assert UPDATE_BOUNDS.bound_x == (-1100, 2200)
+        assert SpawnerCoin().sizes == (50, 50)
+    finally:
+        SCREEN.override(None)
+    assert Sizes().size == before
+    assert DRAW_BOUNDS.bound_y == (-before * 5, before * 17)
+
+
+def test_spawners_made_after_override_use_the_new_size():
+    before: float = Sizes().size
+    old: SpawnerCoin = SpawnerCoin()
+    try:
+        SCREEN.override((880, 480))
+        assert SpawnerSurpriseBlock().sizes == (40, 40)
+        assert SpawnerCoin().spawn((0, 0)).rect.size == (40, 40)
+        rain = SpawnerParticleRain(DRIP_PATH, 10).spawn()
+        assert rain.image.get_size() == (5, 10)
+        assert rain.bounds_x == (-200, 1080)
+        level: Level = Level(TILEMAPS.get('room'))
+        assert all(collider.rect.width % 40 == 0 for collider in level.solid_blocks)
+        assert level.tile_spawners['M'][1].sizes == (40, 40)
+    finally:
+        SCREEN.override(None)
+    assert old.sizes == (before, before)
@@ -0,0 +1,77 @@
+from engine.collection import MarioBlocks
+from engine.spawner import SpawnerMarioBlock
+from engine.spatial import UniformGrid, SortedIndex
+import pygame as pg
+import random
+
+
+class Item:
+    def __init__(self, rect: pg.Rect) -> None:
+        self.rect: pg.Rect = rect
+
+
+def random_items(rand: random.Random, count: int) -> list[Item]:
+    return [Item(pg.Rect(rand.randrange(-500, 3000), rand.randrange(-200, 900),
+                         rand.randrange(1, 200), rand.randrange(1, 200))) for _ in range(count)]
+
+
+def test_grid_query_matches_brute_force():
+    rand: random.Random = random.Random(1)
+    items: list[Item] = random_items(rand, 300)
+    grid: UniformGrid = UniformGrid(64)
+    for item in items:
+        grid.insert(item)
+    for step in range(100):
+        if step % 10 == 0:
+            grid.shift(7, -3)
+            for item in items:
+                item.rect.move_ip(7, -3)
+        if step % 7 == 0:
+            item: Item = rand.choice(items)
+            item.rect.move_ip(rand.randrange(-300, 300), rand.randrange(-300, 300))
+            grid.update(item)
+        area: pg.Rect = random_items(rand, 1)[0].rect
+        found: list[Item] = grid.query(area)
+        expected: list[Item] = [item for item in items if item.rect.colliderect(area)]
+        assert [item for item in found if item.rect.colliderect(area)] == expected
+        assert [items.index(item) for item in found] == sorted(items.index(item) for item in found)
+
+
+def test_sorted_index_query_matches_brute_force():
+    rand: random.Random = random.Random(2)
+    items: list[Item] = random_items(rand, 300)
+    index: SortedIndex = SortedIndex()
+    for item in items:
+        index.insert(item)
+    for step in range(100):
+        if step % 10 == 0:
+            index.shift(-5)
+            for item in items:
+                item.rect.move_ip(-5, 0)
+        if step % 7 == 0:
+            item: Item = rand.choice(items)
+            item.rect.move_ip(rand.randrange(-300, 300), 0)
+            index.update(item)
+        x1: int = rand.randrange(-600, 3000)
+        x2: int = x1 + rand.randrange(0, 1500)
+        assert index.query(x1, x2) == [item for item in items if x1 <= item.rect.left <= x2]
+
+
+def test_shifts_keep_the_indexes_of_pinned_blocks():
+    rand: random.Random = random.Random(4)
+    spawner: SpawnerMarioBlock = SpawnerMarioBlock()
+    blocks: MarioBlocks = MarioBlocks(use_grid=True, indexed=True)
+    for _ in range(100):
+        blocks.append(spawner.spawn((rand.randrange(0, 40) * 64, rand.randrange(0, 12) * 64)))
+    for block in rand.sample(blocks.tar, 20):
+        block.destroyed = True
+    for block in rand.sample(blocks.tar, 10):
+        block.static = True
+    for _ in range(10):
+        blocks.shifts(rand.randrange(-200, 200), rand.randrange(-100, 100))
+        for _ in range(20):
+            x1: int = rand.randrange(-2000, 4000)
+            x2: int = x1 + rand.randrange(0, 300)
+            assert blocks.x_index.query(x1, x2) == [block for block in blocks.tar if x1 <= block.rect.left <= x2]
+    for block in blocks.tar:
+        assert any(found is block for found in blocks.grid.query(block.rect))
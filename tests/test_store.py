@@ -0,0 +1,50 @@
+from engine.collection import MarioBlocks
+from engine.spawner import SpawnerMarioBlock
+from engine.store import BlockStore
+import pygame as pg
+import random
+import pytest
+
+
+def fill(collection, positions: list[tuple[int, int]]):
+    spawner: SpawnerMarioBlock = SpawnerMarioBlock()
+    for pos in positions:
+        collection.append(spawner.spawn(pos))
+    return collection
+
+
+def test_proxies_follow_a_deletion():
+    store: BlockStore = fill(BlockStore(), [(i * 64, 0) for i in range(5)])
+    deleted = store[1]
+    block = store[3]
+    store.delete_item(1)
+    assert block.pos == (192, 0)
+    assert store[2] is block
+    with pytest.raises(IndexError):
+        deleted.pos
+
+
+@pytest.mark.parametrize('use_grid', [True, False])
+def test_query_matches_brute_force(use_grid: bool):
+    rand: random.Random = random.Random(3)
+    positions: list[tuple[int, int]] = [(rand.randrange(0, 3000), rand.randrange(0, 800)) for _ in range(300)]
+    store: BlockStore = fill(BlockStore(use_grid), positions)
+    for _ in range(50):
+        area: pg.Rect = pg.Rect(rand.randrange(-100, 3000), rand.randrange(-100, 800),
+                                rand.randrange(1, 300), rand.randrange(1, 300))
+        expected: list[int] = [i for i, block in enumerate(store.tar) if block.rect.colliderect(area)]
+        assert store.query(area).tolist() == expected
+        store.shifts(rand.choice((0, 7)), 0)
+
+
+def test_nearby_matches_mario_blocks():
+    rand: random.Random = random.Random(5)
+    positions: list[tuple[int, int]] = [(rand.randrange(0, 20) * 64, rand.randrange(0, 12) * 64) for _ in range(80)]
+    blocks: MarioBlocks = fill(MarioBlocks(True), positions)
+    store: BlockStore = fill(BlockStore(), positions)
+    sprite = SpawnerMarioBlock().spawn((0, 0))
+    for _ in range(30):
+        sprite.rect.topleft = rand.randrange(0, 1280), rand.randrange(0, 768)
+        expected: list = sorted(tuple(item.rect) for item in blocks.nearby(sprite) if item.rect.colliderect(sprite.rect))
+        found: list = sorted(tuple(item.rect) for item in store.nearby(sprite) if item.rect.colliderect(sprite.rect))
+        assert found == expected
@@ -0,0 +1,56 @@
+from engine.tilepack import TILEMAPS
+from engine.constants import Sizes
+from engine.level import Level
+from engine.tools import VIEW
+
+
+def at(collection, pos: tuple[float, float]) -> list:
+    return [item for item in collection.tar if item.rect.topleft == pos]
+
+
+def first_tile(tilemap, symbol: str) -> tuple[int, int]:
+    for row_index, row in enumerate(tilemap):
+        if symbol in row:
+            return row.index(symbol), row_index
+
+
+def test_evicted_chunk_comes_back_as_it_was(clock):
+    level: Level = Level(TILEMAPS.get('gym'), streamed=True)
+    streamer = level.streamer
+    size: float = Sizes().size
+    tiles: dict = {symbol: first_tile(level.tilemap, symbol) for symbol in 'MS'}
+    keys: set = {(col // streamer.chunk, row // streamer.chunk) for col, row in tiles.values()}
+    for key in keys:
+        streamer.load(key)
+    brick_pos: tuple = tiles['M'][0] * size, tiles['M'][1] * size
+    surprise_pos: tuple = tiles['S'][0] * size, tiles['S'][1] * size
+    bricks: int = len(level.mario_blocks)
+    at(level.mario_blocks, brick_pos)[0].destroyed = True
+    at(level.surprise_blocks, surprise_pos)[0].unleashed = True
+    for key in keys:
+        streamer.evict(key)
+    assert not at(level.mario_blocks, brick_pos)
+    assert not at(level.surprise_blocks, surprise_pos)
+    for key in keys:
+        streamer.load(key)
+    assert not at(level.mario_blocks, brick_pos)
+    assert len(level.mario_blocks) == bricks - 1
+    assert [item.unleashed for item in at(level.surprise_blocks, surprise_pos)] == [True]
+
+
+def test_streamer_keeps_at_most_max_chunks(clock):
+    level: Level = Level(TILEMAPS.get('gym'), streamed=True)
+    streamer = level.streamer
+    streamer.max_chunks = 4
+    level.players.append(Level.spawn_player(level.spawn_pos))
+    streamer.update()
+    counts: tuple[int, int] = len(level.solid_blocks), len(level.items)
+    for _ in range(40):
+        VIEW.move(-Sizes().size * 4, 0)
+        streamer.update()
+        assert streamer.loaded <= max(streamer.max_chunks, len(streamer.needed()))
+    assert streamer.evictions > 0
+    VIEW.reset()
+    for _ in range(streamer.max_chunks + 1):
+        streamer.update()
+    assert (len(level.solid_blocks), len(level.items)) == counts
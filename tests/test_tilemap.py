@@ -0,0 +1,63 @@
+from engine.tilemap import TileCompiler, Collider
+from engine.tilepack import TilemapLibrary
+import pygame as pg
+import random
+
+SIZE: float = 64
+
+
+def random_map(rand: random.Random, rows: int = 30, cols: int = 40) -> tuple[str, ...]:
+    return tuple(''.join(rand.choice('BBB  M') for _ in range(rand.randint(cols // 2, cols)))
+                 for _ in range(rows))
+
+
+def solid_cells(tilemap, symbols: str = 'B') -> set[tuple[int, int]]:
+    return {(col, row) for row, line in enumerate(tilemap) for col, symbol in enumerate(line) if symbol in symbols}
+
+
+def covered_cells(rects) -> list[tuple[int, int]]:
+    return [(col, row) for left, top, width, height in rects
+            for row in range(top, top + height) for col in range(left, left + width)]
+
+
+def test_merged_rectangles_cover_the_solid_cells_once():
+    rand: random.Random = random.Random(11)
+    compiler: TileCompiler = TileCompiler('B', SIZE)
+    for tilemap in [TilemapLibrary.source('gym')] + [random_map(rand) for _ in range(20)]:
+        cells: list[tuple[int, int]] = covered_cells(compiler.merge(tilemap))
+        assert len(cells) == len(set(cells))
+        assert set(cells) == solid_cells(tilemap)
+
+
+def test_colliders_cover_the_solid_tiles_in_pixels():
+    tilemap: tuple[str, ...] = random_map(random.Random(3))
+    origin: tuple[float, float] = -128, 64
+    colliders: list[Collider] = TileCompiler('B', SIZE).compile(tilemap, origin)
+    pixels: list[tuple[int, int]] = [((collider.rect.left - origin[0]) // SIZE, (collider.rect.top - origin[1]) // SIZE,
+                                      collider.rect.width // SIZE, collider.rect.height // SIZE)
+                                     for collider in colliders]
+    assert all(collider.rect.width % SIZE == 0 and collider.rect.height % SIZE == 0 for collider in colliders)
+    assert sorted(covered_cells(pixels)) == sorted(solid_cells(tilemap))
+    assert len(colliders) < len(solid_cells(tilemap))
+
+
+def test_piece_is_the_tile_under_the_centre():
+    rand: random.Random = random.Random(5)
+    collider: Collider = Collider((128, 64, SIZE * 5, SIZE * 3), SIZE)
+    for _ in range(500):
+        sprite: pg.Rect = pg.Rect(0, 0, 40, 50)
+        sprite.center = rand.randint(0, 128 + SIZE * 7), rand.randint(0, 64 + SIZE * 5)
+        col: int = min(max((sprite.centerx - 128) // SIZE, 0), 4)
+        row: int = min(max((sprite.centery - 64) // SIZE, 0), 2)
+        piece: Collider = collider.piece(sprite)
+        assert piece.rect == pg.Rect(128 + col * SIZE, 64 + row * SIZE, SIZE, SIZE)
+        assert collider.rect.contains(piece.rect)
+        assert piece.tile == SIZE
+
+
+def test_piece_clamps_to_the_edge_tiles():
+    collider: Collider = Collider((0, 0, SIZE * 4, SIZE), SIZE)
+    assert collider.piece(pg.Rect(-300, -300, 10, 10)).rect == pg.Rect(0, 0, SIZE, SIZE)
+    assert collider.piece(pg.Rect(900, 900, 10, 10)).rect == pg.Rect(SIZE * 3, 0, SIZE, SIZE)
+    assert collider.piece(pg.Rect(SIZE * 4 - 1, SIZE - 1, 1, 1)).rect == pg.Rect(SIZE * 3, 0, SIZE, SIZE)
+    assert collider.piece(pg.Rect(SIZE * 2, -40, 1, 1)).rect == pg.Rect(SIZE * 2, 0, SIZE, SIZE)
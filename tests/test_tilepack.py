@@ -0,0 +1,80 @@
+from engine.tilepack import PackedTilemap, TilemapLibrary, TILEMAPS, HEADER, pack
+import warnings
+import pytest
+import sys
+import os
+
+
+def test_pack_round_trip(tmp_path):
+    source: tuple[str, ...] = TilemapLibrary.source('gym')
+    path: str = str(tmp_path / 'gym.tmap')
+    pack(source, path)
+    packed: PackedTilemap = PackedTilemap(path)
+    width: int = max(len(row) for row in source)
+    assert list(packed) == [row.ljust(width) for row in source]
+    assert packed[-1] == source[-1].ljust(width)
+    expected: list[list[int]] = [[row, col] for row, line in enumerate(source)
+                                 for col, symbol in enumerate(line) if symbol in 'BM']
+    assert packed.cells('BM').tolist() == expected
+
+
+def test_committed_maps_are_fresh():
+    for name in os.listdir(TILEMAPS.directory):
+        packed: PackedTilemap = PackedTilemap(os.path.join(TILEMAPS.directory, name))
+        assert packed.digest == TILEMAPS.digest(packed.module), name
+
+
+def stale_library(tmp_path, name: str = 'room') -> TilemapLibrary:
+    library: TilemapLibrary = TilemapLibrary(str(tmp_path / 'packed'), str(tmp_path / 'cache'))
+    path: str = library.convert([name])[0]
+    with open(path, 'r+b') as file:
+        file.seek(HEADER.size - 20)
+        file.write(bytes(20))
+    return library
+
+
+def test_stale_map_is_packed_again_into_the_cache(tmp_path):
+    library: TilemapLibrary = stale_library(tmp_path)
+    with open(library.path('room'), 'rb') as file:
+        stale: bytes = file.read()
+    packed = library.get('room')
+    assert isinstance(packed, PackedTilemap)
+    assert packed.path == library.cache_path('room')
+    assert packed.digest == library.digest(packed.module)
+    assert list(packed) == [row.ljust(packed.sizes[0]) for row in TilemapLibrary.source('room')]
+    with open(library.path('room'), 'rb') as file:
+        assert file.read() == stale
+    assert TilemapLibrary(library.directory, library.cache_directory).get('room').path == packed.path
+
+
+def test_repack_imports_only_the_module_of_the_map(tmp_path, monkeypatch):
+    library: TilemapLibrary = stale_library(tmp_path)
+    for module_name in ('smalls', 'mids', 'bigs'):
+        monkeypatch.delitem(sys.modules, f'engine.tilemaps.{module_name}', raising=False)
+    assert isinstance(library.get('room'), PackedTilemap)
+    assert 'engine.tilemaps.smalls' in sys.modules
+    assert 'engine.tilemaps.mids' not in sys.modules
+    assert 'engine.tilemaps.bigs' not in sys.modules
+
+
+def test_old_format_is_packed_again(tmp_path):
+    library: TilemapLibrary = TilemapLibrary(str(tmp_path / 'packed'), str(tmp_path / 'cache'))
+    os.makedirs(library.directory)
+    with open(library.path('room'), 'wb') as file:
+        file.write(b'TMAP\x01')
+    packed = library.get('room')
+    assert isinstance(packed, PackedTilemap)
+    assert packed.path == library.cache_path('room')
+
+
+def test_unwritable_cache_warns_and_falls_back(tmp_path):
+    library: TilemapLibrary = stale_library(tmp_path)
+    with open(library.cache_directory, 'w') as file:
+        file.write('not a directory')
+    with pytest.warns(UserWarning, match='room'):
+        tilemap = library.get('room')
+    assert tilemap == TilemapLibrary.source('room')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert library.get('room') is tilemap
+
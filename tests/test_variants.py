@@ -0,0 +1,49 @@
+from engine.variants import VariantCache
+import pygame as pg
+import os
+
+
+def source_image(tmp_path) -> tuple[pg.surface.Surface, str]:
+    image: pg.surface.Surface = pg.Surface((6, 4))
+    for x in range(6):
+        for y in range(4):
+            image.set_at((x, y), (x * 40, y * 60, 90))
+    path: str = str(tmp_path / 'source.bmp')
+    pg.image.save(image, path)
+    image = pg.image.load(path)
+    image.set_colorkey((0, 0, 90))
+    return image, path
+
+
+def scaled(cache: VariantCache, image: pg.surface.Surface) -> pg.surface.Surface:
+    return cache.variant(image, ('scale', (12, 8)), lambda: pg.transform.scale(image, (12, 8)))
+
+
+def test_warm_start_reads_the_same_pixels(tmp_path):
+    image, path = source_image(tmp_path)
+    cold: VariantCache = VariantCache(str(tmp_path / 'cache'), active=True)
+    cold.source(image, path)
+    built: pg.surface.Surface = scaled(cold, image)
+    warm: VariantCache = VariantCache(str(tmp_path / 'cache'), active=True)
+    warm.source(image, path)
+    read: pg.surface.Surface = scaled(warm, image)
+    assert (cold.misses, warm.hits) == (1, 1)
+    assert pg.image.tobytes(read, 'RGB') == pg.image.tobytes(built, 'RGB')
+    assert read.get_colorkey() == built.get_colorkey()
+
+
+def test_corrupt_file_is_built_again(tmp_path):
+    image, path = source_image(tmp_path)
+    cache: VariantCache = VariantCache(str(tmp_path / 'cache'), active=True)
+    cache.source(image, path)
+    scaled(cache, image)
+    (file_name,) = os.listdir(cache.directory)
+    file_path: str = os.path.join(cache.directory, file_name)
+    for data in (b'', b'VRNT', b'VRNT' + bytes(40), open(file_path, 'rb').read()[:-5]):
+        with open(file_path, 'wb') as file:
+            file.write(data)
+        assert VariantCache.load(file_path) is None
+        assert not os.path.exists(file_path)
+        scaled(cache, image)
+    assert cache.misses == 5
+    assert VariantCache.load(file_path) is not None